@@ -4,8 +4,10 @@ from ._grid_processing import *
 from ._terrain_processing import *
 from ._terrain_processing import _COLORS
 from ._floorplan_processing import *
+from ._layer_processing import *
 import numpy as np
 from collections import defaultdict
+from itertools import compress
 from uuid import uuid4
 import pickle
 import os as _os
@@ -88,7 +90,6 @@ class _AbstractGridBlueprint:
     _file = None
     _layers = None
     _cell_list = None
-    _array = None
     _dictGrid = None
     _dictTerrain = None
     _dictObject = None
@@ -99,6 +100,7 @@ class _AbstractGridBlueprint:
     _cell_coordinates = None
     _quadrants = None
     _graph = None
+    _neighbors = None
     _items = None
 
     @property
@@ -188,18 +190,12 @@ class _AbstractGridBlueprint:
         self._cell_list = cell_list
 
     @property
-    def array(self):
-        """Returns the array of cells. The array of cells is a NumPy array of cells with 3 dimensions. The first
-        dimension is the column, the second dimension is the row, and the third dimension is the layer. The layers
-        are defined in the `_layer_attributes` dictionary. The first layer is the base layer, the second layer is the
-        terrain layer.
+    def array(self) -> list:
+        """Returns the layers of the grid, in the order of `_levels` after the base level: the terrain layer
+        (`dictTerrain`), the sparse object, unit and zone layers and the dense effect and fog of war layers. The
+        attributes of each layer are defined in the `_layer_attributes` dictionary.
         """
-        return self._array
-
-    @array.setter
-    def array(self, array) -> None:
-        """Sets the array of cells. Each cell's array attribute is set to the corresponding cell in the array."""
-        self._array = array
+        return [self.dictTerrain, self.dictObject, self.dictUnit, self.dictZone, self.dictEffect, self.dictFow]
 
     @property
     def dictGrid(self) -> dict[str, any]:
@@ -221,9 +217,6 @@ class _AbstractGridBlueprint:
         """Sets the dictionary of terrain information. Which corresponds to the terrain layer of the array. The value
         set here will be reflected in the array."""
         self._dictTerrain = dictTerrain
-        for designation, terrain_info in dictTerrain.items():
-            self.array[self.dictGrid[designation]['col_index']][self.dictGrid[designation]['row_index']][
-                0] = terrain_info
 
     @property
     def dictObject(self):
@@ -234,10 +227,7 @@ class _AbstractGridBlueprint:
     def dictObject(self, dictObject) -> None:
         """Sets the dictionary of objects. Which corresponds to the object layer of the array. The value set here will
         be reflected in the array."""
-        self._dictObject = dictObject
-        for designation, object_info in dictObject.items():
-            self.array[self.dictGrid[designation]['col_index']][self.dictGrid[designation]['row_index']][
-                1] = object_info
+        self._dictObject = self._load_layer(self._dictObject, dictObject)
 
     @property
     def dictUnit(self):
@@ -248,9 +238,7 @@ class _AbstractGridBlueprint:
     def dictUnit(self, dictUnit) -> None:
         """Sets the dictionary of units. Which corresponds to the unit layer of the array. The value set here will be
         reflected in the array."""
-        self._dictUnit = dictUnit
-        for designation, unit_info in dictUnit.items():
-            self.array[self.dictGrid[designation]['col_index']][self.dictGrid[designation]['row_index']][2] = unit_info
+        self._dictUnit = self._load_layer(self._dictUnit, dictUnit)
 
     @property
     def dictZone(self):
@@ -260,9 +248,7 @@ class _AbstractGridBlueprint:
     @dictZone.setter
     def dictZone(self, dictZone) -> None:
         """Sets the dictionary of zones. Which corresponds to the zone layer of the array. The value set here will be"""
-        self._dictZone = dictZone
-        for designation, zone_info in dictZone.items():
-            self.array[self.dictGrid[designation]['col_index']][self.dictGrid[designation]['row_index']][3] = zone_info
+        self._dictZone = self._load_layer(self._dictZone, dictZone)
 
     @property
     def dictEffect(self):
@@ -273,10 +259,7 @@ class _AbstractGridBlueprint:
     def dictEffect(self, dictEffect) -> None:
         """Sets the dictionary of effects. Which corresponds to the effect layer of the array. The value set here will
         be reflected in the array."""
-        self._dictEffect = dictEffect
-        for designation, effect_info in dictEffect.items():
-            self.array[self.dictGrid[designation]['col_index']][self.dictGrid[designation]['row_index']][
-                4] = effect_info
+        self._dictEffect = self._load_layer(self._dictEffect, dictEffect)
 
     @property
     def dictFow(self):
@@ -286,9 +269,7 @@ class _AbstractGridBlueprint:
     @dictFow.setter
     def dictFow(self, dictFow) -> None:
         """Sets the dictionary of fog of war. Which corresponds to the fog of war layer of the array. The value set"""
-        self._dictFow = dictFow
-        for designation, fow_info in dictFow.items():
-            self.array[self.dictGrid[designation]['col_index']][self.dictGrid[designation]['row_index']][5] = fow_info
+        self._dictFow = self._load_layer(self._dictFow, dictFow)
 
     @property
     def cell_coordinates(self):
@@ -320,6 +301,42 @@ class _AbstractGridBlueprint:
         """Sets the graph of the grid."""
         self._graph = graph
 
+    @property
+    def neighbors(self) -> np.ndarray:
+        """Returns the neighbor table of the grid. Row `i` holds the cell indices of the eight cells adjacent to cell
+        `i`, in the order of the cell's `adjacent` list. Off-grid neighbors are -1."""
+        return self._neighbors
+
+    @neighbors.setter
+    def neighbors(self, neighbors: np.ndarray) -> None:
+        """Sets the neighbor table of the grid."""
+        self._neighbors = neighbors
+
+    def _load_layer(self, layer, layer_dict):
+        """Writes a dictionary of cell information keyed by designation into a layer, and returns the layer. A layer
+        object is taken as it is."""
+        if layer is None or isinstance(layer_dict, (DenseLayer, SparseLayer)):
+            return layer_dict
+        for cell, entry in layer_dict.items():
+            layer[cell] = entry
+        return layer
+
+    def get_layer_entry(self, layer: int, col_index: int, row_index: int) -> dict[str, any]:
+        """Returns the entry of a cell in a layer. Terrain entries are taken from `dictTerrain`; the entries of the
+        other layers are views that read and write the layer directly."""
+        cell_index = row_index * self._col_count + col_index
+        if layer == 0:
+            return self.dictTerrain[self.cell_list[cell_index]]
+        return self.array[layer].entry(cell_index)
+
+    def set_layer_entry(self, layer: int, col_index: int, row_index: int, entry: dict[str, any]) -> None:
+        """Sets the entry of a cell in a layer."""
+        cell_index = row_index * self._col_count + col_index
+        if layer == 0:
+            self.dictTerrain[self.cell_list[cell_index]] = entry
+        else:
+            self.array[layer].set_entry(cell_index, entry)
+
     def __getstate__(self):
         return self.__dict__.copy()
 
@@ -342,16 +359,10 @@ class BaseGridBlueprint(_AbstractGridBlueprint):
         super(BaseGridBlueprint, self).__init__()
         self.blueprint_id = uuid4().hex if grid_id is None else grid_id
         if array and quadrants and graph:
-            self._array = array
             self._quadrants = quadrants
             self._graph = graph
-            self._init_from_array()
         self.cell_size = cell_size if cell_size is not None else 3
         self.grid_dimensions = grid_dimensions if grid_dimensions is not None else (_SCRX, _SCRY)
-        self._array = np.array(
-                [0 for _ in list(range((self._col_count * self._row_count) * (len(_levels) - 1)))],
-                dtype=type(any),
-        ).reshape((self._col_count, self._row_count, len(_levels) - 1))
         self._init()
         self.layer_attributes = _layer_attributes
 
@@ -362,36 +373,37 @@ class BaseGridBlueprint(_AbstractGridBlueprint):
         self.cell_list = grid_info['cell_strings']
         self.cell_coordinates = grid_info['cell_coordinates']
         self.dictGrid = grid_info['grid_dict']
-        self.quadrants = self._init_quadrants()
+        self.quadrants = self._init_quadrants(grid_info['quadrant_indices'])
         self.graph = grid_info['graph']
+        self.neighbors = grid_info['neighbor_table']
         self._init_layers()
-        self.array[:, :, 0] = self.dictGrid.values()
         if not self.with_terrain:
-            self.dictTerrain = {
-                    cell: {'raw':  1, 'int': 1, 'str': 'GRASS', 'color': _COLORS['GRASS_GREEN'], 'cost_in': 1, 'cost_out': 1,
-                           'char': ''} for cell in self.cell_list}
+            cell_count = len(self.cell_list)
+            self.dictTerrain = TerrainDict(
+                    self.dictGrid, {'GRASS': BASE_TERRAIN}, np.zeros(cell_count, dtype=np.uint8), np.ones(cell_count)
+            )
 
-    def _init_quadrants(self):
+    def _init_quadrants(self, quadrant_indices: np.ndarray):
         quadrants = defaultdict(dict)
-        quad_cells = defaultdict(list)
-        for cell, information in self.dictGrid.items():
-            quad_cells[information['quadrant_index']].append(cell)
-        for quadrant_index, cell_list in quad_cells.items():
+        cell_order = np.argsort(quadrant_indices, kind='stable')
+        quadrant_ends = np.cumsum(np.bincount(quadrant_indices, minlength=4))
+        for quadrant_index, cell_indices in enumerate(np.split(cell_order, quadrant_ends[:-1])):
             # Create a dictionary of the cells in each quadrant
+            cell_list = [self.cell_list[cell_index] for cell_index in cell_indices.tolist()]
             quadrants[quadrant_index] = {
                     'cell_count': len(cell_list),
-                    'cells':      cell_list
+                    'cells':      cell_list,
+                    'indices':    cell_indices
             }
         return quadrants
 
     def _init_layers(self):
-        for i, level in enumerate(_levels):
-            if i > 0:
-                for cell, information in self.dictGrid.items():
-                    # self.array[information['col_index']][information['row_index']][0] = information
-                    self.array[information['col_index']][information['row_index']][i - 1] = {f'{attr}': None for attr in
-                                                                                             _layer_attributes[level]}
-                setattr(self, f'_dict{level.capitalize()}', self.array[:, :, i - 1])
+        # Objects, units and zones occupy few cells, so their layers only store the cells that hold something; the
+        # effect and fog of war layers have a fixed schema and are stored densely. Terrain is set by `dictTerrain`.
+        for level in ('object', 'unit', 'zone'):
+            setattr(self, f'_dict{level.capitalize()}', SparseLayer(self.dictGrid, _layer_attributes[level]))
+        self._dictEffect = DenseLayer(self.dictGrid, EFFECT_SCHEMA)
+        self._dictFow = DenseLayer(self.dictGrid, FOW_SCHEMA)
 
     def __json__(self):
         return {
@@ -408,52 +420,28 @@ class TerrainGridBlueprint(BaseGridBlueprint):
 
     def __init__(
             self, cell_size: int, grid_dimensions: tuple[int, int], grid_id: str = None, noise_scale: int = None,
-            noise_octaves: int = None, noise_roughness: float = None
+            noise_octaves: int = None, noise_roughness: float = None, noise_workers: int = None,
+            noise_seed: int = None
     ):
         super(TerrainGridBlueprint, self).__init__(cell_size, grid_dimensions, grid_id)
-        for cell in self.dictGrid:
-            self.dictGrid[cell]['passable'] = None
-        self._init_terrain(noise_scale, noise_octaves, noise_roughness)
+        self.dictGrid.set_passable(None)
+        self._init_terrain(noise_scale, noise_octaves, noise_roughness, noise_workers, noise_seed)
 
-    def _init_terrain(self, noise_scale, noise_octaves, noise_roughness):
+    def _init_terrain(self, noise_scale, noise_octaves, noise_roughness, noise_workers=None, noise_seed=None):
         self._noise_scale = noise_scale if noise_scale is not None else 350
         self._noise_octaves = noise_octaves if noise_octaves is not None else 88
         self._noise_roughness = noise_roughness if noise_roughness is not None else 0.65
+        self._noise_seed = noise_seed
         self.dictTerrain = process_noise(
             self._noise_scale, self._noise_octaves, self._noise_roughness, self._row_count, self._col_count,
-            self._cell_size, self.dictGrid
+            self._cell_size, self.dictGrid, noise_workers, np.random.default_rng(noise_seed)
             )
-        self._set_base_terrain()
         self._adjust_passability()
 
-    def _set_base_terrain(self):
-        base_terrain = {
-                'str':      'OCEAN',
-                'raw':      None,
-                'int':      9,
-                'color':    _OCEAN_BLUE,
-                'cost_in':  float('inf'),
-                'cost_out': float('inf'),
-                'char':     '~'
-        }
-        dictTerrain = self.dictTerrain.copy()
-        for cell in self.cell_list:
-            if self.dictTerrain[cell]['raw'] is None:
-                dictTerrain[cell] = base_terrain
-                self.dictGrid[cell]['passable'] = False
-        self.dictTerrain = dictTerrain
-
     def _adjust_passability(self):
-        passable = []
-        unpassable = []
-        for c, info in self.dictTerrain.items():
-            if info['str'] in _UNPASSABLE_TERRAIN:
-                self.dictGrid[c]['passable'] = False
-                unpassable.append(c)
-            else:
-                self.dictGrid[c]['passable'] = True
-                passable.append(c)
-        return passable, unpassable
+        unpassable = self.dictTerrain.terrain_mask(_UNPASSABLE_TERRAIN)
+        self.dictGrid.set_passable(~unpassable)
+        return list(compress(self.cell_list, ~unpassable)), list(compress(self.cell_list, unpassable))
 
     def __json__(self):
         return {
@@ -468,6 +456,7 @@ class TerrainGridBlueprint(BaseGridBlueprint):
                 'noise_scale':      self._noise_scale,
                 'noise_octaves':    self._noise_octaves,
                 'noise_roughness':  self._noise_roughness,
+                'noise_seed':       self._noise_seed,
                 'quadrants':        self.quadrants,
                 'graph':            self.graph,
         }
\ No newline at end of file
@@ -1,7 +1,11 @@
 from typing import Optional, List, Tuple, Dict, Any
+from collections.abc import Mapping, MutableMapping
 import itertools
 import numpy as np
 
+_NEIGHBOR_ROW_OFFSETS = np.array([-1, -1, -1, 0, 1, 1, 1, 0], dtype=np.int32)
+_NEIGHBOR_COL_OFFSETS = np.array([-1, 0, 1, 1, 1, 0, -1, -1], dtype=np.int32)
+
 
 def generate_row_strings(row_count: int) -> List[str]:
     """
@@ -102,11 +106,11 @@ def generate_cell_strings(row_strings: List[str], col_strings: List[str]) -> Lis
 def get_cell_strings(row_strings: List[str], col_strings: List[str]) -> List[str]:
     return generate_cell_strings(row_strings, col_strings)
 
-def get_cell_coordinates(cell_size: int, row_count: int, col_count: int) -> List[Tuple[int, int]]:
+def get_cell_coordinates(cell_size: int, row_count: int, col_count: int) -> np.ndarray:
     """
     Get the coordinates of each cell in a grid.
 
-    This function calculates the coordinates of each cell in a grid based on the provided `cell_size`, `row_count`, and `col_count` parameters. The coordinates are returned as a list of tuples, where each tuple represents the x and y coordinates of a cell.
+    This function calculates the coordinates of each cell in a grid based on the provided `cell_size`, `row_count`, and `col_count` parameters. The coordinates are returned as an (N, 2) array in cell index order, where each row holds the x and y coordinates of a cell.
 
     Args:
         cell_size (int): The size of each cell in the grid.
@@ -114,76 +118,151 @@ def get_cell_coordinates(cell_size: int, row_count: int, col_count: int) -> List
         col_count (int): The number of columns in the grid.
 
     Returns:
-        List[Tuple[int, int]]: A list of tuples representing the coordinates of each cell.
+        np.ndarray: An (N, 2) int32 array of cell coordinates.
 
     Example:
         ```python
         cell_coordinates = get_cell_coordinates(10, 3, 4)
-        print(cell_coordinates)
-        # Output: [(0, 0), (10, 0), (20, 0), (30, 0), (0, 10), (10, 10), (20, 10), (30, 10), (0, 20), (10, 20), (20, 20), (30, 20)]
+        print(cell_coordinates.tolist())
+        # Output: [[0, 0], [10, 0], [20, 0], [30, 0], [0, 10], [10, 10], [20, 10], [30, 10], [0, 20], [10, 20], [20, 20], [30, 20]]
         ```
     """
     print(f'Getting cell coordinates')
-    return [
-        (
-            abs(0 - ((num % col_count) * cell_size)),
-            abs(0 - ((num // col_count) * cell_size)),
-       )
-        for num in range(row_count*col_count)
-    ]
+    rows, cols = get_cell_indices(row_count, col_count)
+    return np.stack((cols * cell_size, rows * cell_size), axis=1).astype(np.int32)
 
-def get_grid_dict(cell_strings: List[str], row_strings: List[str], col_strings: List[str], cell_coordinates: List[Tuple[int, int]]) -> Dict[str, Any]:
+def get_cell_indices(row_count: int, col_count: int) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Get the row and column index of each cell in a grid.
+
+    Args:
+        row_count (int): The number of rows in the grid.
+        col_count (int): The number of columns in the grid.
+
+    Returns:
+        Tuple[np.ndarray, np.ndarray]: The row indices and column indices of every cell, in cell index order.
+
+    Example:
+        ```python
+        rows, cols = get_cell_indices(2, 3)
+        print(rows.tolist(), cols.tolist())
+        # Output: [0, 0, 0, 1, 1, 1] [0, 1, 2, 0, 1, 2]
+        ```
+    """
+    return np.divmod(np.arange(row_count * col_count, dtype=np.int32), np.int32(col_count))
+
+class GridDict(MutableMapping):
+    """
+    A dictionary representing a grid, keyed by cell designation.
+
+    The entry of a cell is built from the grid's index arrays the first time it is looked up and kept from then on, so
+    changes made to an entry persist. Creating the dictionary therefore costs nothing per cell until a cell is used.
+    Cells cannot be added to or removed from the dictionary. The passability of every cell can be read and written in
+    bulk with `get_passable` and `set_passable` without building any entries.
+    """
+
+    def __init__(self, cell_strings: List[str], row_strings: List[str], cell_coordinates: np.ndarray, quadrant_indices: np.ndarray, neighbor_table: np.ndarray) -> None:
+        self._cell_strings = cell_strings
+        self._col_count = len(cell_strings) // len(row_strings)
+        self._row_lookup = {row: i for i, row in enumerate(row_strings)}
+        self._cell_coordinates = cell_coordinates
+        self._quadrant_indices = quadrant_indices
+        self._neighbor_table = neighbor_table
+        self._passable = np.full(len(cell_strings), True, dtype=object)
+        self._entries = {}
+
+    def index_of(self, cell: str) -> int:
+        """Returns the cell index of a designation. Raises a KeyError if the designation is not on the grid."""
+        row_index = self._row_lookup.get(cell[:-5])
+        col_string = cell[-5:]
+        if row_index is None or len(col_string) != 5 or not col_string.isdigit() or not 0 < int(col_string) <= self._col_count:
+            raise KeyError(cell)
+        return row_index * self._col_count + int(col_string) - 1
+
+    def _build_entry(self, cell_index: int) -> Dict[str, Any]:
+        row_index, col_index = divmod(cell_index, self._col_count)
+        x, y = self._cell_coordinates[cell_index].tolist()
+        cell_strings = self._cell_strings
+        return {
+            "designation": cell_strings[cell_index],
+            "cell_index": cell_index,
+            "row_index": row_index,
+            "col_index": col_index,
+            "coordinates": (x, y),
+            "quadrant_index": int(self._quadrant_indices[cell_index]),
+            "adjacent": [cell_strings[adjacent] if adjacent >= 0 else None for adjacent in self._neighbor_table[cell_index].tolist()],
+            "passable": self._passable[cell_index]
+        }
+
+    def get_passable(self) -> np.ndarray:
+        """Returns the passability of every cell, in cell index order."""
+        passable = self._passable.copy()
+        for cell, entry in self._entries.items():
+            passable[self.index_of(cell)] = entry['passable']
+        return passable
+
+    def set_passable(self, passable) -> None:
+        """Sets the passability of every cell from a value or an array in cell index order."""
+        self._passable[:] = passable
+        for cell, entry in self._entries.items():
+            entry['passable'] = self._passable[self.index_of(cell)]
+
+    def __getitem__(self, cell: str) -> Dict[str, Any]:
+        entry = self._entries.get(cell)
+        if entry is None:
+            entry = self._entries[cell] = self._build_entry(self.index_of(cell))
+        return entry
+
+    def __setitem__(self, cell: str, entry: Dict[str, Any]) -> None:
+        self.index_of(cell)
+        self._entries[cell] = entry
+
+    def __delitem__(self, cell: str) -> None:
+        raise TypeError('Cells cannot be removed from a grid.')
+
+    def __iter__(self):
+        return iter(self._cell_strings)
+
+    def __len__(self) -> int:
+        return len(self._cell_strings)
+
+    def __contains__(self, cell) -> bool:
+        try:
+            self.index_of(cell)
+        except (KeyError, TypeError):
+            return False
+        return True
+
+def get_grid_dict(cell_strings: List[str], row_strings: List[str], cell_coordinates: np.ndarray, quadrant_indices: np.ndarray, neighbor_table: np.ndarray) -> GridDict:
     """
     Get a dictionary representing a grid.
 
-    This function creates a dictionary representing a grid based on the provided `cell_strings`, `row_strings`, `col_strings`, and `cell_coordinates`. Each cell in the grid is represented by a key-value pair in the dictionary, where the key is the cell string and the value is a dictionary containing various properties of the cell.
+    This function creates a dictionary representing a grid based on the provided `cell_strings`, `row_strings`, `cell_coordinates`, `quadrant_indices` and `neighbor_table`. Each cell in the grid is represented by a key-value pair in the dictionary, where the key is the cell string and the value is a dictionary containing various properties of the cell. Entries are built on first access.
 
     Args:
         cell_strings (List[str]): A list of strings representing cells.
         row_strings (List[str]): A list of strings representing rows.
-        col_strings (List[str]): A list of strings representing columns.
-        cell_coordinates (List[Tuple[int, int]]): A list of tuples representing the coordinates of each cell.
+        cell_coordinates (np.ndarray): An (N, 2) array of cell coordinates.
+        quadrant_indices (np.ndarray): The quadrant index of each cell.
+        neighbor_table (np.ndarray): An (N, 8) array of neighbor cell indices.
 
     Returns:
-        Dict[str, Any]: A dictionary representing the grid.
+        GridDict: A dictionary representing the grid.
 
     Example:
         ```python
-        cell_strings = ['a1', 'a2', 'a3', 'b1', 'b2', 'b3']
-        row_strings = ['a', 'b']
-        col_strings = ['1', '2', '3']
-        cell_coordinates = [(0, 0), (10, 0), (20, 0), (0, 10), (10, 10), (20, 10)]
-        grid_dict = get_grid_dict(cell_strings, row_strings, col_strings, cell_coordinates)
-        print(grid_dict)
-        # Output: {
-        #     'a1': {'designation': 'a1', 'cell_index': 0, 'row_index': 0, 'col_index': 0, 'coordinates': (0, 0), 'quadrant_index': None, 'adjacent': []},
-        #     'a2': {'designation': 'a2', 'cell_index': 1, 'row_index': 0, 'col_index': 1, 'coordinates': (10, 0), 'quadrant_index': None, 'adjacent': []},
-        #     'a3': {'designation': 'a3', 'cell_index': 2, 'row_index': 0, 'col_index': 2, 'coordinates': (20, 0), 'quadrant_index': None, 'adjacent': []},
-        #     'b1': {'designation': 'b1', 'cell_index': 3, 'row_index': 1, 'col_index': 0, 'coordinates': (0, 10), 'quadrant_index': None, 'adjacent': []},
-        #     'b2': {'designation': 'b2', 'cell_index': 4, 'row_index': 1, 'col_index': 1, 'coordinates': (10, 10), 'quadrant_index': None, 'adjacent': []},
-        #     'b3': {'designation': 'b3', 'cell_index': 5, 'row_index': 1, 'col_index': 2, 'coordinates': (20, 10), 'quadrant_index': None, 'adjacent': []}
-        # }
+        grid_dict = get_grid_dict(cell_strings, row_strings, cell_coordinates, quadrant_indices, neighbor_table)
+        print(grid_dict['a00002'])
+        # Output: {'designation': 'a00002', 'cell_index': 1, 'row_index': 0, 'col_index': 1, 'coordinates': (10, 0), 'quadrant_index': 0, 'adjacent': [None, None, None, 'a00003', 'b00003', 'b00002', 'b00001', 'a00001'], 'passable': True}
         ```
     """
+    return GridDict(cell_strings, row_strings, cell_coordinates, quadrant_indices, neighbor_table)
 
-    return {
-        cell: {
-            "designation": cell,
-            "cell_index": i,
-            "row_index": row_strings.index(cell[:-5]),
-            "col_index": col_strings.index(cell[-5:]),
-            "coordinates": cell_coordinates[i],
-            "quadrant_index": None,
-            "adjacent": [],
-            "passable": True
-        } for i, cell in enumerate(cell_strings)
-    }
-    
 def generate_quadrant_coordinates(row_count: int, col_count: int) -> List[List[Tuple[int, int]]]:
     """
     Get the coordinates of each quadrant in a grid.
 
-    This function calculates the coordinates of each quadrant in a grid based on the provided `row_count` and `col_count` parameters. The grid is divided into four quadrants, and the coordinates of each quadrant are returned as a list of lists, where each inner list represents the coordinates of a quadrant.
+    This function calculates the coordinates of each quadrant in a grid based on the provided `row_count` and `col_count` parameters. The grid is divided into four quadrants, numbered left to right and top to bottom, and the (column, row) corners of each quadrant are returned as a list of lists, where each inner list represents the corners of a quadrant.
 
     Args:
         row_count (int): The number of rows in the grid.
@@ -194,7 +273,7 @@ def generate_quadrant_coordinates(row_count: int, col_count: int) -> List[List[T
 
     Example:
         ```python
-        quadrant_coordinates = get_quadrant_coordinates(4, 6)
+        quadrant_coordinates = generate_quadrant_coordinates(4, 6)
         print(quadrant_coordinates)
         # Output: [
         #     [(0, 0), (3, 0), (3, 2), (0, 2)],
@@ -205,133 +284,102 @@ def generate_quadrant_coordinates(row_count: int, col_count: int) -> List[List[T
         ```
     """
 
-    quad_x = [0, col_count//2, col_count, col_count//2]
-    quad_y = [0, row_count//2, row_count, row_count//2]
+    quad_x = [0, col_count//2, col_count]
+    quad_y = [0, row_count//2, row_count]
     return [
         [
-            (quad_x[i], quad_y[j])[::-1],
-            (quad_x[i+1], quad_y[j])[::-1],
-            (quad_x[i+1], quad_y[j+1])[::-1],
-            (quad_x[i], quad_y[j+1])[::-1]
+            (quad_x[i], quad_y[j]),
+            (quad_x[i+1], quad_y[j]),
+            (quad_x[i+1], quad_y[j+1]),
+            (quad_x[i], quad_y[j+1])
         ]
-        for i, j in itertools.product(range(2), range(2))
+        for j, i in itertools.product(range(2), range(2))
     ]
-    
-def get_quadrant_indices(quadrant_coords: List[List[Tuple[int,int]]], grid_dict: Dict[str, Any]) -> Dict[str, Any]:
+
+def generate_quadrant_indices(row_count: int, col_count: int) -> np.ndarray:
     """
-    Assign quadrant indices to cells in a grid.
+    Get the quadrant index of each cell in a grid.
 
-    This function assigns quadrant indices to cells in a grid based on the provided `quadrant_coords` and `grid_dict`. Each cell in the grid is checked against the coordinates of each quadrant, and if the cell falls within a quadrant, its `quadrant_index` property in the `grid_dict` is updated accordingly.
+    Quadrants are numbered left to right and top to bottom, matching `generate_quadrant_coordinates`.
 
     Args:
-        quadrant_coords (List[List[Tuple[int, int]]]): A list of lists representing the coordinates of each quadrant.
-        grid_dict (Dict[str, Any]): A dictionary representing the grid.
+        row_count (int): The number of rows in the grid.
+        col_count (int): The number of columns in the grid.
 
     Returns:
-        Dict[str, Any]: A dictionary representing the updated grid with assigned quadrant indices.
+        np.ndarray: The quadrant index of every cell, in cell index order.
 
     Example:
         ```python
-        updated_grid_dict = get_quadrant_indices(quadrant_coordinates, grid_dict)
+        quadrant_indices = generate_quadrant_indices(2, 4)
+        print(quadrant_indices.tolist())
+        # Output: [0, 0, 1, 1, 2, 2, 3, 3]
         ```
     """
+    rows, cols = get_cell_indices(row_count, col_count)
+    return (2 * (rows >= row_count // 2) + (cols >= col_count // 2)).astype(np.int8)
 
-    for i, quad in enumerate(quadrant_coords):
-        for cell in grid_dict:
-            if (
-                quad[0][0] <= grid_dict[cell]['col_index'] < quad[2][0] 
-                and 
-                quad[0][1] <= grid_dict[cell]['row_index'] < quad[1][1]
-            ):
-                grid_dict[cell]['quadrant_index'] = i
-    return grid_dict
-
-def generate_adjacency(grid_dict: Dict[str, any], row_count: int, col_count: int) -> Dict[str, Any]:
+def generate_neighbor_table(row_count: int, col_count: int) -> np.ndarray:
     """
-    Assign adjacent cells to each cell in a grid.
+    Get the neighbor table of a grid.
 
-    This function assigns adjacent cells to each cell in a grid based on the provided `grid_dict`, `row_count`, and `col_count`. The adjacency is determined based on the position of each cell within the grid. The adjacent cells are stored as a list in the `adjacent` property of each cell in the `grid_dict`.
+    Row `i` of the table holds the indices of the eight cells adjacent to the cell with index `i`, in the order
+    up-left, up, up-right, right, down-right, down, down-left, left. Neighbors that fall off the grid are marked
+    with -1.
 
     Args:
-        grid_dict (Dict[str, Any]): A dictionary representing the grid.
         row_count (int): The number of rows in the grid.
         col_count (int): The number of columns in the grid.
 
     Returns:
-        Dict[str, Any]: A dictionary representing the updated grid with assigned adjacent cells.
+        np.ndarray: An (N, 8) int32 array of neighbor cell indices.
 
     Example:
         ```python
-        updated_grid_dict = get_adjacency(grid_dict, row_count, col_count)
+        neighbor_table = generate_neighbor_table(3, 6)
+        print(neighbor_table[0].tolist())
+        # Output: [-1, -1, -1, 1, 7, 6, -1, -1]
         ```
     """
     print('Generating adjacency')
-    cell_list = list(grid_dict.keys())
-    w = col_count
-    h = row_count
-    for cell, information in grid_dict.items():
-        print(f'Progress: {information["cell_index"]}/{len(grid_dict)}', end='\r')
-        if information['cell_index'] == row_count * col_count - 1:
-            print('\nAdjacency generation complete.')
-        n = information['cell_index']
-        r = grid_dict[cell]['row_index']
-        f = grid_dict[cell]['col_index']
-        if r not in [0, row_count - 1] and f not in [0, col_count - 1]:
-            grid_dict[cell]['adjacent'] = [cell_list[n - (w + 1)], cell_list[n - w],
-                                            cell_list[n - (w - 1)],
-                                            cell_list[n + 1],
-                                            cell_list[n + (w + 1)], cell_list[n + w],
-                                            cell_list[n + (w - 1)],
-                                            cell_list[n - 1]]
-        elif r == 0:
-            if f == 0:
-                grid_dict[cell]['adjacent'] = [None, None, None, cell_list[1], cell_list[w + 1],
-                                                cell_list[w], None, None]
-            elif f == col_count - 1:
-                grid_dict[cell]['adjacent'] = [None, None, None, None, None, cell_list[n + w], cell_list[n + (w - 1)],
-                                                cell_list[n - 1]]
-            else:
-                grid_dict[cell]['adjacent'] = [None, None, None, cell_list[n + 1], cell_list[n + (w + 1)],
-                                                cell_list[n + w],
-                                                cell_list[n + (w - 1)],
-                                                cell_list[n - 1]]
-        elif r == row_count - 1:
-            if f == 0:
-                grid_dict[cell]['adjacent'] = [None, cell_list[n - w], cell_list[n - (w - 1)],
-                                                cell_list[n + 1], None, None, None, None]
-            elif f == col_count - 1:
-                grid_dict[cell]['adjacent'] = [cell_list[n - (w + 1)], cell_list[n - w], None, None, None, None, None,
-                                                cell_list[n - 1]]
-            else:
-                grid_dict[cell]['adjacent'] = [cell_list[n - (w + 1)], cell_list[n - w],
-                                                cell_list[n - (w - 1)],
-                                                cell_list[n + 1],
-                                                None, None, None,
-                                                cell_list[n - 1]]
-        elif f == 0:
-            grid_dict[cell]['adjacent'] = [None, cell_list[n - w], cell_list[n - (w - 1)],
-                                            cell_list[n + 1],
-                                            cell_list[n + (w + 1)],
-                                            cell_list[n + w], None, None]
-        elif f == col_count - 1:
-            grid_dict[cell]['adjacent'] = [cell_list[n - (w + 1)], cell_list[n - w], None, None, None,
-                                            cell_list[n + w],
-                                            cell_list[n + (w - 1)],
-                                            cell_list[n - 1]]
-    return grid_dict
-
-
-def get_graph(grid_dict: Dict[str, Any]) -> Dict[str, List[str]]:
+    rows, cols = get_cell_indices(row_count, col_count)
+    neighbor_rows = rows[:, None] + _NEIGHBOR_ROW_OFFSETS
+    neighbor_cols = cols[:, None] + _NEIGHBOR_COL_OFFSETS
+    on_grid = (
+        (neighbor_rows >= 0) & (neighbor_rows < row_count)
+        & (neighbor_cols >= 0) & (neighbor_cols < col_count)
+    )
+    return np.where(on_grid, neighbor_rows * col_count + neighbor_cols, -1).astype(np.int32)
+
+class GridGraph(Mapping):
+    """
+    A graph representation of a grid, keyed by cell designation. The adjacency of each cell is read from the grid
+    dictionary when it is looked up.
+    """
+
+    def __init__(self, grid_dict: GridDict) -> None:
+        self._grid_dict = grid_dict
+
+    def __getitem__(self, cell: str) -> List[Optional[str]]:
+        return list(self._grid_dict[cell]['adjacent'])
+
+    def __iter__(self):
+        return iter(self._grid_dict)
+
+    def __len__(self) -> int:
+        return len(self._grid_dict)
+
+def get_graph(grid_dict: GridDict) -> GridGraph:
     """
     Get a graph representation of the grid.
 
-    This function creates a graph representation of the grid based on the provided `grid_dict`. Each cell in the grid is treated as a node in the graph, and the adjacent cells are treated as edges connecting the nodes. The graph is returned as a dictionary, where the keys are the cells and the values are lists of adjacent cells.
+    This function creates a graph representation of the grid based on the provided `grid_dict`. Each cell in the grid is treated as a node in the graph, and the adjacent cells are treated as edges connecting the nodes. The graph is returned as a mapping, where the keys are the cells and the values are lists of adjacent cells.
 
     Args:
-        grid_dict (Dict[str, Any]): A dictionary representing the grid.
+        grid_dict (GridDict): A dictionary representing the grid.
 
     Returns:
-        Dict[str, List[str]]: A dictionary representing the graph.
+        GridGraph: A mapping representing the graph.
 
     Example:
         ```python
@@ -339,10 +387,7 @@ def get_graph(grid_dict: Dict[str, Any]) -> Dict[str, List[str]]:
         ```
     """
 
-    return {
-        cell: list(info['adjacent'])
-        for cell, info in grid_dict.items()
-    }
+    return GridGraph(grid_dict)
 
 def process_grid(row_count: int, col_count: int, cell_size: int) -> Dict[str, Any]:
     """
@@ -353,19 +398,22 @@ def process_grid(row_count: int, col_count: int, cell_size: int) -> Dict[str, An
     2. Generates column strings.
     3. Generates cell strings.
     4. Calculates cell coordinates.
-    5. Creates a grid dictionary.
-    6. Calculates quadrant coordinates.
-    7. Assigns quadrant indices to cells.
-    8. Assigns adjacent cells to each cell.
+    5. Calculates quadrant coordinates.
+    6. Calculates the quadrant index of each cell.
+    7. Creates a table of neighbor cell indices.
+    8. Creates a grid dictionary.
     9. Creates a graph representation of the grid.
 
+    Every per-cell step is a single vectorized operation over cell indices, and the entries of the grid dictionary are
+    only built when they are first looked up.
+
     Args:
         row_count (int): The number of rows in the grid.
         col_count (int): The number of columns in the grid.
         cell_size (int): The size of each cell in the grid.
 
     Returns:
-        Dict[str, Any]: A dictionary containing the processed grid data, including row strings, column strings, cell strings, cell coordinates, grid dictionary, quadrant coordinates, and graph representation.
+        Dict[str, Any]: A dictionary containing the processed grid data, including row strings, column strings, cell strings, cell coordinates, grid dictionary, quadrant coordinates, quadrant indices, graph representation and neighbor table.
 
     Example:
         ```python
@@ -384,24 +432,28 @@ def process_grid(row_count: int, col_count: int, cell_size: int) -> Dict[str, An
         #         "C1", "C2", "C3", "C4", "C5", "C6",
         #         "D1", "D2", "D3", "D4", "D5", "D6"
         #     ],
-        #     "cell_coordinates": [
-        #         (0, 0), (10, 0), (20, 0), (30, 0), (40, 0), (50, 0),
-        #         (0, 10), (10, 10), (20, 10), (30, 10), (40, 10), (50, 10),
-        #         (0, 20), (10, 20), (20, 20), (30, 20), (40, 20), (50, 20),
-        #         (0, 30), (10, 30), (20, 30), (30, 30), (40, 30), (50, 30)
-        #     ],
+        #     "cell_coordinates": array([
+        #         [0, 0], [10, 0], [20, 0], [30, 0], [40, 0], [50, 0],
+        #         ...
+        #         [0, 30], [10, 30], [20, 30], [30, 30], [40, 30], [50, 30]
+        #     ]),
         #     "grid_dict": {
-        #         "A1": {"designation": "A1", "cell_index": 0, "row_index": 0, "col_index": 0, "coordinates": (0, 0), "quadrant_index": 0, "adjacent": [...]},
+        #         "A1": {"designation": "A1", "cell_index": 0, "row_index": 0, "col_index": 0, "coordinates": (0, 0), "quadrant_index": 0, "adjacent": [...], "passable": True},
         #         ...
         #     },
         #     "quadrant_coords": [
-        #         [(0, 0), (15, 0), (15, 20), (0, 20)],
+        #         [(0, 0), (3, 0), (3, 2), (0, 2)],
         #         ...
         #     ],
+        #     "quadrant_indices": array([0, 0, 0, 1, 1, 1, ..., 2, 2, 2, 3, 3, 3]),
         #     "graph": {
-        #         "A1": ["A2", "B2", "B1"],
+        #         "A1": [None, None, None, "A2", "B2", "B1", None, None],
         #         ...
-        #     }
+        #     },
+        #     "neighbor_table": array([
+        #         [-1, -1, -1, 1, 7, 6, -1, -1],
+        #         ...
+        #     ])
         # }
         ```
     """
@@ -410,10 +462,10 @@ def process_grid(row_count: int, col_count: int, cell_size: int) -> Dict[str, An
     col_strings = get_column_strings(col_count)
     cell_strings = get_cell_strings(row_strings, col_strings)
     cell_coordinates = get_cell_coordinates(cell_size, row_count, col_count)
-    grid_dict = get_grid_dict(cell_strings, row_strings, col_strings, cell_coordinates)
     quadrant_coords = generate_quadrant_coordinates(row_count, col_count)
-    grid_dict = get_quadrant_indices(quadrant_coords, grid_dict)
-    grid_dict = generate_adjacency(grid_dict, row_count, col_count)
+    quadrant_indices = generate_quadrant_indices(row_count, col_count)
+    neighbor_table = generate_neighbor_table(row_count, col_count)
+    grid_dict = get_grid_dict(cell_strings, row_strings, cell_coordinates, quadrant_indices, neighbor_table)
     graph = get_graph(grid_dict)
     return {
         "cell_size": cell_size,
@@ -423,5 +475,7 @@ def process_grid(row_count: int, col_count: int, cell_size: int) -> Dict[str, An
         "cell_coordinates": cell_coordinates,
         "grid_dict": grid_dict,
         "quadrant_coords": quadrant_coords,
-        "graph": graph
-    }
\ No newline at end of file
+        "quadrant_indices": quadrant_indices,
+        "graph": graph,
+        "neighbor_table": neighbor_table
+    }
@@ -0,0 +1,189 @@
+from collections.abc import MutableMapping
+from typing import Dict, List, Optional
+import numpy as np
+
+
+# The fixed schema of every dense layer: a (field, dtype, default) triple per attribute.
+EFFECT_SCHEMA = [
+    ('weather', object, None),
+    ('lighting', object, None),
+    ('environment', object, None),
+    ('magic', object, None)
+]
+
+FOW_SCHEMA = [
+    ('visibility', np.float32, 0.0),
+    ('explored', np.bool_, False),
+    ('seen', np.bool_, False),
+    ('hidden', np.bool_, False)
+]
+
+
+class _LayerEntry(MutableMapping):
+    """The entry of one cell in a layer. Reads and writes go straight to the layer, so an entry can be held on to and
+    changed like the dictionary it replaces."""
+
+    __slots__ = ('_layer', '_cell_index')
+
+    def __init__(self, layer, cell_index: int) -> None:
+        self._layer = layer
+        self._cell_index = cell_index
+
+    def __getitem__(self, key: str):
+        return self._layer.get_value(self._cell_index, key)
+
+    def __setitem__(self, key: str, value) -> None:
+        self._layer.set_value(self._cell_index, key, value)
+
+    def __delitem__(self, key: str) -> None:
+        raise TypeError('The attributes of a layer entry cannot be removed.')
+
+    def __iter__(self):
+        return iter(self._layer.entry_keys(self._cell_index))
+
+    def __len__(self) -> int:
+        return len(self._layer.entry_keys(self._cell_index))
+
+    def __eq__(self, other) -> bool:
+        if isinstance(other, MutableMapping):
+            return dict(self) == dict(other)
+        return NotImplemented
+
+    def __repr__(self) -> str:
+        return repr(dict(self))
+
+
+class _Layer(MutableMapping):
+    """
+    A layer of per-cell information keyed by designation. Looking up a cell returns a `_LayerEntry` onto the layer's
+    storage rather than a dictionary of its own, and assigning a mapping to a cell writes its values into the layer.
+    Cells cannot be added to or removed from a layer.
+    """
+
+    def __init__(self, grid_dict, keys: List[str]) -> None:
+        self._grid_dict = grid_dict
+        self.attributes = list(keys)
+
+    def entry(self, cell_index: int) -> _LayerEntry:
+        """Returns the entry of a cell by cell index."""
+        return _LayerEntry(self, cell_index)
+
+    def entry_keys(self, cell_index: int) -> List[str]:
+        """Returns the attributes of the entry of a cell."""
+        return self.attributes
+
+    def get_value(self, cell_index: int, key: str):
+        raise NotImplementedError
+
+    def set_value(self, cell_index: int, key: str, value) -> None:
+        raise NotImplementedError
+
+    def set_entry(self, cell_index: int, entry: Dict[str, any]) -> None:
+        """Writes every value of a mapping into the entry of a cell."""
+        for key, value in entry.items():
+            self.set_value(cell_index, key, value)
+
+    def __getitem__(self, cell: str) -> _LayerEntry:
+        return self.entry(self._grid_dict.index_of(cell))
+
+    def __setitem__(self, cell: str, entry: Dict[str, any]) -> None:
+        self.set_entry(self._grid_dict.index_of(cell), entry)
+
+    def __delitem__(self, cell: str) -> None:
+        raise TypeError('Cells cannot be removed from a grid.')
+
+    def __iter__(self):
+        return iter(self._grid_dict)
+
+    def __len__(self) -> int:
+        return len(self._grid_dict)
+
+    def __contains__(self, cell) -> bool:
+        return cell in self._grid_dict
+
+
+class DenseLayer(_Layer):
+    """
+    A layer with a fixed schema, stored as one structured NumPy array with a record per cell. Every attribute of every
+    cell always exists, and a whole attribute can be read or written at once through `values`.
+
+    Example:
+        ```python
+        fow = DenseLayer(grid_dict, FOW_SCHEMA)
+        fow['a00001']['explored'] = True
+        print(fow.values['explored'][:3])
+        # Output: [ True False False]
+        ```
+    """
+
+    def __init__(self, grid_dict, schema: List[tuple]) -> None:
+        super().__init__(grid_dict, [name for name, _, _ in schema])
+        self._values = np.zeros(len(grid_dict), dtype=[(name, dtype) for name, dtype, _ in schema])
+        for name, _, default in schema:
+            self._values[name] = default
+        self._native = {name: np.dtype(dtype).kind != 'O' for name, dtype, _ in schema}
+
+    @property
+    def values(self) -> np.ndarray:
+        """The structured array holding the layer, in cell index order."""
+        return self._values
+
+    def get_value(self, cell_index: int, key: str):
+        value = self._values[key][cell_index]
+        return value.item() if self._native[key] else value
+
+    def set_value(self, cell_index: int, key: str, value) -> None:
+        if key not in self._native:
+            raise KeyError(key)
+        self._values[key][cell_index] = value
+
+
+class SparseLayer(_Layer):
+    """
+    A layer that is empty for most cells, stored as a dictionary of entries keyed by cell index. An entry is only
+    allocated when a value is first set on a cell, and is dropped again once all of its values are None, so the cost
+    of the layer follows the number of occupied cells rather than the size of the grid. Every attribute of a cell
+    without an entry reads as None.
+
+    Example:
+        ```python
+        units = SparseLayer(grid_dict, ['players', 'npcs'])
+        units['a00002']['players'] = {'hero': hero}
+        print(units.occupied(), units['a00001']['players'])
+        # Output: [1] None
+        ```
+    """
+
+    def __init__(self, grid_dict, keys: List[str]) -> None:
+        super().__init__(grid_dict, keys)
+        self._entries: Dict[int, Dict[str, any]] = {}
+
+    def entry_keys(self, cell_index: int) -> List[str]:
+        entry = self._entries.get(cell_index)
+        return self.attributes if entry is None else list(entry)
+
+    def get_value(self, cell_index: int, key: str):
+        entry = self._entries.get(cell_index)
+        if entry is None:
+            if key not in self.attributes:
+                raise KeyError(key)
+            return None
+        return entry[key]
+
+    def set_value(self, cell_index: int, key: str, value) -> None:
+        entry = self._entries.get(cell_index)
+        if entry is None:
+            if value is None and key in self.attributes:
+                return
+            entry = self._entries[cell_index] = dict.fromkeys(self.attributes)
+        entry[key] = value
+        if value is None and all(item is None for item in entry.values()):
+            del self._entries[cell_index]
+
+    def get_entry(self, cell_index: int) -> Optional[Dict[str, any]]:
+        """Returns the stored entry of a cell, or None if the cell has no entry."""
+        return self._entries.get(cell_index)
+
+    def occupied(self) -> np.ndarray:
+        """Returns the cell indices of the cells with an entry, in cell index order."""
+        return np.array(sorted(self._entries), dtype=np.int64)
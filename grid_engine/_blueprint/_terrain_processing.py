@@ -1,8 +1,8 @@
 import itertools
-from typing import Dict
+from collections.abc import MutableMapping
+from concurrent.futures import ProcessPoolExecutor
+from typing import Dict, List, Optional
 import numpy as np
-import random
-import noise
 import os
 
 import json
@@ -28,6 +28,44 @@ _COLORS = {
     'SNOW_WHITE': (253, 245, 245, 255)
 }
 
+# Ken Perlin's reference permutation, repeated so that hashed lookups never need to wrap.
+_PERM = np.tile(np.array([
+    151, 160, 137, 91, 90, 15, 131, 13, 201, 95, 96, 53, 194, 233, 7, 225, 140, 36, 103, 30, 69, 142, 8, 99, 37,
+    240, 21, 10, 23, 190, 6, 148, 247, 120, 234, 75, 0, 26, 197, 62, 94, 252, 219, 203, 117, 35, 11, 32, 57, 177,
+    33, 88, 237, 149, 56, 87, 174, 20, 125, 136, 171, 168, 68, 175, 74, 165, 71, 134, 139, 48, 27, 166, 77, 146,
+    158, 231, 83, 111, 229, 122, 60, 211, 133, 230, 220, 105, 92, 41, 55, 46, 245, 40, 244, 102, 143, 54, 65, 25,
+    63, 161, 1, 216, 80, 73, 209, 76, 132, 187, 208, 89, 18, 169, 200, 196, 135, 130, 116, 188, 159, 86, 164, 100,
+    109, 198, 173, 186, 3, 64, 52, 217, 226, 250, 124, 123, 5, 202, 38, 147, 118, 126, 255, 82, 85, 212, 207, 206,
+    59, 227, 47, 16, 58, 17, 182, 189, 28, 42, 223, 183, 170, 213, 119, 248, 152, 2, 44, 154, 163, 70, 221, 153,
+    101, 155, 167, 43, 172, 9, 129, 22, 39, 253, 19, 98, 108, 110, 79, 113, 224, 232, 178, 185, 112, 104, 218, 246,
+    97, 228, 251, 34, 242, 193, 238, 210, 144, 12, 191, 179, 162, 241, 81, 51, 145, 235, 249, 14, 239, 107, 49,
+    192, 214, 31, 181, 199, 106, 157, 184, 84, 204, 176, 115, 121, 50, 45, 127, 4, 150, 254, 138, 236, 205, 93,
+    222, 114, 67, 29, 24, 72, 243, 141, 128, 195, 78, 66, 215, 61, 156, 180
+], dtype=np.int32), 2)
+
+_GRAD2 = np.array([
+    [1, 1], [-1, 1], [1, -1], [-1, -1],
+    [1, 0], [-1, 0], [1, 0], [-1, 0],
+    [0, 1], [0, -1], [0, 1], [0, -1],
+    [1, 0], [-1, 0], [0, -1], [0, 1]
+], dtype=np.float32)
+
+# The gradient selected by each hash index, packed as x + yj so that a single lookup fetches both components.
+_HASH_GRADIENTS = (_GRAD2[_PERM[_PERM] & 15] @ np.array([1, 1j])).astype(np.complex64)
+
+# Noise is evaluated in bands of rows of about this many cells, which keeps the per-octave temporaries in cache.
+_NOISE_BAND_CELLS = 1 << 15
+
+# Octaves past this point sample the lattice at (float32) integer coordinates, where gradient noise is zero, and their
+# amplitude is already below float32 resolution, so they are skipped without changing the result.
+_SIGNIFICANT_OCTAVES = 24
+
+# The level and relief of the diamond-square heightmap in the terrain and object blends. The heightmap is rescaled from
+# [0, 1] to this band around the level, which keeps the share of land of a world close to what the terrain thresholds
+# were tuned for while keeping the relief of the heightmap.
+_HEIGHTMAP_LEVEL = 0.29
+_HEIGHTMAP_RELIEF = 0.5
+
 install_dir = os.path.abspath(os.path.dirname(__file__))
 
 def load_terrain() -> type[dict]:
@@ -62,71 +100,97 @@ OBJECTS = load_objects()
 DEFAULT_TERRAIN_DICT = TERRAINS['default']
 DEFAULT_OBJECT_DICT = OBJECTS['default']
 
+# The terrain of cells above every threshold of DEFAULT_TERRAIN_DICT.
+OCEAN_TERRAIN = {
+    'int': 9,
+    'color': _COLORS['OCEAN_BLUE'],
+    'cost_in': float('inf'),
+    'cost_out': float('inf'),
+    'char': '~'
+}
+
+# The terrain of every cell of a grid without terrain.
+BASE_TERRAIN = {
+    'int': 1,
+    'color': _COLORS['GRASS_GREEN'],
+    'cost_in': 1,
+    'cost_out': 1,
+    'char': ''
+}
+
+TERRAIN_TABLE = {**DEFAULT_TERRAIN_DICT, 'OCEAN': OCEAN_TERRAIN}
+
+_OBJECT_CATEGORIES = [
+    'items', 'obstructions', 'structures', 'features', 'resources', 'containers', 'doors', 'traps', 'switches'
+]
+
+
+def _padded_size(row_count: int, col_count: int) -> int:
+    """Returns the side of the smallest (2^n + 1)-square that covers a grid of the given dimensions."""
+    size = 2
+    while size + 1 < max(row_count, col_count, 2):
+        size *= 2
+    return size + 1
+
 
 def initialize_grid(row_count, col_count):
-    return np.zeros((row_count, col_count))
+    size = _padded_size(row_count, col_count)
+    return np.zeros((size, size))
 
 
-def set_corner_values(grid):
-    row_count, col_count = grid.shape
-    grid[0, 0] = random.uniform(0.0, 1.0)
-    grid[0, col_count - 1] = random.uniform(0.0, 1.0)
-    grid[row_count - 1, 0] = random.uniform(0.0, 1.0)
-    grid[row_count - 1, col_count - 1] = random.uniform(0.0, 1.0)
+def set_corner_values(grid, rng: np.random.Generator):
+    grid[::grid.shape[0] - 1, ::grid.shape[1] - 1] = rng.uniform(0.0, 1.0, (2, 2))
     return grid
 
 def set_edge_values(grid, edge, idx, noise_vals):
-    r, c = grid.shape
-    set_cells = []
-    if edge == 'vertical' and idx == 0:
-        for i in range(r):
-            grid[i, 0] = noise_vals[i]
-            set_cells.append((i, 0))
-    elif edge == 'vertical' and idx == c - 1:
-        for i in range(r):
-            grid[i, c - 1] = noise_vals[i]
-            set_cells.append((i, c - 1))
-    elif edge == 'horizontal' and idx == 0:
-        for i in range(c):
-            grid[0, i] = noise_vals[i]
-            set_cells.append((0, i))
-    elif edge == 'horizontal' and idx == r - 1:
-        for i in range(c):
-            grid[r - 1, i] = noise_vals[i]
-            set_cells.append((r - 1, i))
+    """
+    Fixes one edge of a heightmap to the given values.
+
+    Returns the grid and a boolean mask of the cells that were set, which the diamond and square steps leave untouched.
+    """
+    set_cells = np.zeros(grid.shape, dtype=bool)
+    if edge == 'vertical':
+        grid[:len(noise_vals), idx] = noise_vals
+        set_cells[:len(noise_vals), idx] = True
+    elif edge == 'horizontal':
+        grid[idx, :len(noise_vals)] = noise_vals
+        set_cells[idx, :len(noise_vals)] = True
     return grid, set_cells
 
 
-def diamond_step(grid, step, half, roughness, set_cells = None):
-    r, c = grid.shape
-    for i, j in itertools.product(range(half, r - 1, step), range(half, c - 1, step)):
-        average = (grid[i - half, j - half] + grid[i - half, j] +
-                    grid[i, j - half] + grid[i, j]) / 4.0
-        if set_cells is not None:
-            grid[i, j] = average + random.uniform(-1.0, 1.0) * roughness if (i, j) not in set_cells else grid[i, j]
-        else:
-            grid[i, j] = average + random.uniform(-1.0, 1.0) * roughness
+def diamond_step(grid, step, half, offsets):
+    """Sets the centre of every square of side `step` to the mean of its corners plus an offset."""
+    corners = grid[:-1:step, :-1:step] + grid[:-1:step, step::step] + grid[step::step, :-1:step] + grid[step::step, step::step]
+    grid[half::step, half::step] = corners / 4.0 + offsets
     return grid
 
 
-def square_step(grid, step, half, roughness, set_cells = None):
-    r, c = grid.shape
-    for i in range(0, r - 1, half):
-        for j in range((i + half) % step, c - 1, step):        
-            average = (grid[(i - half + r - 1) % (r - 1), j] +
-                grid[(i + half) % (r - 1), j] +
-                grid[i, (j + half) % (c - 1)] +
-                grid[i, (j - half + c - 1) % (c - 1)]) / 4.0
-        if set_cells is not None:
-            grid[i, j] = average + random.uniform(-1.0, 1.0) * roughness if (i, j) not in set_cells else grid[i, j]
-        else:
-            grid[i, j] = average + random.uniform(-1.0, 1.0) * roughness
-        if i == 0 and set_cells is not None:
-            grid[r - 1, j] = (grid[i, j] + grid[
-                r - 2, j]) / 2.0 + random.uniform(-1.0, 1.0) * roughness if (r - 1, j) not in set_cells else grid[r - 1, j]
-        elif i == 0:
-            grid[r - 1, j] = (grid[i, j] + grid[
-                r - 2, j]) / 2.0 + random.uniform(-1.0, 1.0) * roughness
+def square_step(grid, step, half, offsets):
+    """
+    Sets the midpoint of every edge of side `step` to the mean of its diamond neighbours plus an offset.
+
+    Midpoints on the border of the grid have only three neighbours and take the mean of those.
+    """
+    centres = grid[half::step, half::step]
+    n = centres.shape[0]
+
+    # Midpoints on rows of corners: left and right corners, plus the centres above and below.
+    total = grid[::step, :-1:step] + grid[::step, step::step]
+    count = np.full(total.shape, 2.0)
+    total[1:] += centres
+    total[:-1] += centres
+    count[1:] += 1
+    count[:-1] += 1
+    grid[::step, half::step] = total / count + offsets[:total.size].reshape(total.shape)
+
+    # Midpoints on columns of corners: corners above and below, plus the centres to the left and right.
+    total = grid[:-1:step, ::step] + grid[step::step, ::step]
+    count = np.full(total.shape, 2.0)
+    total[:, 1:] += centres
+    total[:, :-1] += centres
+    count[:, 1:] += 1
+    count[:, :-1] += 1
+    grid[half::step, ::step] = total / count + offsets[n * (n + 1):].reshape(total.shape)
     return grid
 
 
@@ -139,54 +203,191 @@ def normalize_grid(grid):
     return grid
 
 
-def diamond_square(noise_roughness: float, row_count: int, col_count: int) -> type[np.ndarray]:
-    roughness = noise_roughness
-    grid = initialize_grid(row_count, col_count)
-    grid = set_corner_values(grid)
-    step = col_count - 1
+def blend_heightmap(heightmap: np.ndarray) -> np.ndarray:
+    """
+    Rescales a normalized diamond-square heightmap to the band it takes in the terrain and object blends: a spread of
+    `_HEIGHTMAP_RELIEF` around `_HEIGHTMAP_LEVEL`.
+
+    Example:
+        ```python
+        print(blend_heightmap(np.array([0.0, 0.5, 1.0])))
+        # Output: [0.04 0.29 0.54]
+        ```
+    """
+    return _HEIGHTMAP_LEVEL + (heightmap - 0.5) * _HEIGHTMAP_RELIEF
+
+
+def _diamond_square(grid, roughness: float, rng: np.random.Generator, set_cells=None):
+    """Runs the diamond and square steps over a (2^n + 1)-square grid, drawing the offsets of each level at once."""
+    fixed_values = grid[set_cells] if set_cells is not None else None
+    step = grid.shape[0] - 1
     while step > 1:
         half = step // 2
-        grid = diamond_step(grid, step, half, roughness)
-        grid = square_step(grid, step, half, roughness)
+        n = (grid.shape[0] - 1) // step
+        offsets = rng.uniform(-1.0, 1.0, n * n + 2 * n * (n + 1)) * roughness
+        grid = diamond_step(grid, step, half, offsets[:n * n].reshape(n, n))
+        grid = square_step(grid, step, half, offsets[n * n:])
+        if set_cells is not None:
+            grid[set_cells] = fixed_values
         roughness /= 2.0
         step //= 2
-    grid = normalize_grid(grid)
     return grid
 
-def diamond_square_from_edge(noise_roughness: float, row_count: int, col_count: int, edge: tuple[tuple[str, int], list[float]]) -> type[np.ndarray]:
-    roughness = noise_roughness
-    r = row_count
-    c = col_count
 
-    grid = np.zeros((r, c))
+def diamond_square(noise_roughness: float, row_count: int, col_count: int, rng: Optional[np.random.Generator] = None) -> type[np.ndarray]:
+    """
+    Generates a diamond-square heightmap for a grid.
 
-    edge, idx = edge[0]
-    noise_vals = edge[1]
+    The heightmap is generated on the smallest (2^n + 1)-square that covers the grid and cropped to `row_count` by
+    `col_count`. Each level of the algorithm is computed with strided slices of the whole heightmap, and the random
+    offsets of a level are drawn from `rng` in a single batch, so the same generator state always produces the same
+    heightmap.
 
-    grid, set_cells = set_edge_values(grid, edge, idx, noise_vals)
+    Args:
+        noise_roughness (float): The amplitude of the random offsets of the first level. It halves with each level.
+        row_count (int): The number of rows in the grid.
+        col_count (int): The number of columns in the grid.
+        rng (Optional[np.random.Generator]): The random number generator to draw from. Defaults to a new, unseeded
+            generator.
 
-    step = c - 1
-    while step > 1:
-        half = step // 2
-        grid = diamond_step(grid, half, roughness, set_cells)
-        grid = square_step(grid, half, roughness, set_cells)
-        roughness /= 2.0
-        step //= 2
+    Returns:
+        numpy.ndarray: The normalized heightmap.
 
-    grid = normalize_grid(grid)
+    Example:
+        ```python
+        heightmap = diamond_square(0.65, 200, 250, np.random.default_rng(42))
+        print(heightmap.shape)
+        # Output: (200, 250)
+        ```
+    """
+    rng = rng if rng is not None else np.random.default_rng()
+    grid = initialize_grid(row_count, col_count)
+    grid = set_corner_values(grid, rng)
+    grid = _diamond_square(grid, noise_roughness, rng)
+    return normalize_grid(grid[:row_count, :col_count])
 
-    return grid
+def diamond_square_from_edge(noise_roughness: float, row_count: int, col_count: int, edge: tuple[tuple[str, int], list[float]], rng: Optional[np.random.Generator] = None) -> type[np.ndarray]:
+    """
+    Generates a diamond-square heightmap for a grid, with one edge fixed to the given values.
+
+    Args:
+        noise_roughness (float): The amplitude of the random offsets of the first level. It halves with each level.
+        row_count (int): The number of rows in the grid.
+        col_count (int): The number of columns in the grid.
+        edge (tuple[tuple[str, int], list[float]]): The orientation ('vertical' or 'horizontal') and index of the edge,
+            followed by its values.
+        rng (Optional[np.random.Generator]): The random number generator to draw from. Defaults to a new, unseeded
+            generator.
+
+    Returns:
+        numpy.ndarray: The normalized heightmap.
+    """
+    rng = rng if rng is not None else np.random.default_rng()
+    grid = initialize_grid(row_count, col_count)
 
+    (edge, idx), noise_vals = edge
 
+    grid, set_cells = set_edge_values(grid, edge, idx, noise_vals)
+    grid = _diamond_square(grid, noise_roughness, rng, set_cells)
+
+    return normalize_grid(grid[:row_count, :col_count])
+
+
+def _gradient_noise(x: np.ndarray, y: np.ndarray, repeatx: float, repeaty: float) -> np.ndarray:
+    """Evaluates a single octave of 2D Perlin noise at every point of `x` and `y`, in float32. Only the broadcast
+    result is two-dimensional; the lattice coordinates and fade curves are computed in the shapes of `x` and `y`."""
+    i = np.floor(np.fmod(x, np.float32(repeatx))).astype(np.int32)
+    j = np.floor(np.fmod(y, np.float32(repeaty))).astype(np.int32)
+    ii = np.fmod((i + 1).astype(np.float32), np.float32(repeatx)).astype(np.int32) & 255
+    jj = np.fmod((j + 1).astype(np.float32), np.float32(repeaty)).astype(np.int32) & 255
+    i &= 255
+    j &= 255
+
+    x = x - np.floor(x)
+    y = y - np.floor(y)
+    fx = x * x * x * (x * (x * np.float32(6) - np.float32(15)) + np.float32(10))
+    fy = y * y * y * (y * (y * np.float32(6) - np.float32(15)) + np.float32(10))
+    x1 = x - np.float32(1)
+    y1 = y - np.float32(1)
+    a = _PERM[i]
+    b = _PERM[ii]
+
+    def grad(hash_index: np.ndarray, gx: np.ndarray, gy: np.ndarray) -> np.ndarray:
+        gradient = _HASH_GRADIENTS[hash_index]
+        return gx * gradient.real + gy * gradient.imag
+
+    def lerp(t: np.ndarray, start: np.ndarray, end: np.ndarray) -> np.ndarray:
+        return start + t * (end - start)
+
+    return lerp(
+        fy,
+        lerp(fx, grad(a + j, x, y), grad(b + j, x1, y)),
+        lerp(fx, grad(a + jj, x, y1), grad(b + jj, x1, y1))
+    )
 
 
-def perlin_noise(row_count: int, col_count: int, noise_scale: int, noise_octaves: int) -> type[np.ndarray]:
+def pnoise2(x: np.ndarray, y: np.ndarray, octaves: int = 1, persistence: float = 0.5, lacunarity: float = 2.0,
+            repeatx: float = 1024, repeaty: float = 1024) -> np.ndarray:
+    """
+    Evaluates fractal 2D Perlin noise for arrays of coordinates.
+
+    This is a vectorized equivalent of `noise.pnoise2`: the same permutation table, gradients, fade curve and octave
+    summation are applied to whole arrays at once in float32, so results agree with the `noise` package to within
+    float32 rounding.
+
+    Args:
+        x (np.ndarray): The x coordinates to sample.
+        y (np.ndarray): The y coordinates to sample, broadcastable against `x`.
+        octaves (int): The number of octaves to sum. Defaults to 1.
+        persistence (float): The amplitude multiplier between octaves. Defaults to 0.5.
+        lacunarity (float): The frequency multiplier between octaves. Defaults to 2.0.
+        repeatx (float): The period of the noise along x. Defaults to 1024.
+        repeaty (float): The period of the noise along y. Defaults to 1024.
+
+    Returns:
+        np.ndarray: The noise values, in the broadcast shape of `x` and `y`.
+
+    Example:
+        ```python
+        cols, rows = np.meshgrid(np.arange(4), np.arange(3))
+        values = pnoise2(cols / 10, rows / 10, octaves=4)
+        print(values.shape)
+        # Output: (3, 4)
+        ```
+    """
+    if octaves < 1:
+        raise ValueError('Expected octaves value > 0')
+    x = np.asarray(x, dtype=np.float32)
+    y = np.asarray(y, dtype=np.float32)
+    freq = np.float32(1)
+    amp = np.float32(1)
+    max_amp = np.float32(0)
+    total = np.zeros(np.broadcast_shapes(x.shape, y.shape), dtype=np.float32)
+    for octave in range(octaves):
+        if octave < _SIGNIFICANT_OCTAVES:
+            total += _gradient_noise(x * freq, y * freq, repeatx * freq, repeaty * freq) * amp
+        max_amp += amp
+        freq *= np.float32(lacunarity)
+        amp *= np.float32(persistence)
+    return total / max_amp
+
+
+def _perlin_noise_rows(row_start: int, row_stop: int, col_count: int, noise_scale: int, noise_octaves: int) -> np.ndarray:
+    """Evaluates the unnormalized Perlin noise of a band of grid rows."""
+    cols = np.arange(col_count) / noise_scale
+    rows = np.arange(row_start, row_stop)[:, np.newaxis] / noise_scale
+    return pnoise2(cols, rows, noise_octaves)
+
+
+def perlin_noise(row_count: int, col_count: int, noise_scale: int, noise_octaves: int,
+                 workers: Optional[int] = None) -> type[np.ndarray]:
     """
     Generates Perlin noise terrain data for a grid.
 
     The function generates a grid of Perlin noise values using the specified dimensions (`row_count` and `col_count`), 
     noise scale (`noise_scale`), and number of octaves (`noise_octaves`). 
-    It iterates over each cell in the grid and calculates the Perlin noise value using the `noise.pnoise2` function. 
+    The noise is evaluated with `pnoise2` a band of rows at a time; when `workers` is given, the bands are shared out
+    between a pool of that many processes so that large grids can use every core.
     The generated terrain data is then normalized to be in the range [0, 1].
 
     Args:
@@ -194,6 +395,8 @@ def perlin_noise(row_count: int, col_count: int, noise_scale: int, noise_octaves
         col_count (int): The number of columns in the grid.
         noise_scale (int): The scale of the Perlin noise.
         noise_octaves (int): The number of octaves for the Perlin noise.
+        workers (Optional[int]): The number of worker processes to use. Defaults to None, which evaluates the noise in
+            the current process.
 
     Returns:
         numpy.ndarray: The generated terrain data grid.
@@ -209,75 +412,252 @@ def perlin_noise(row_count: int, col_count: int, noise_scale: int, noise_octaves
         ```
     """
 
-    inverse_terrain_data = np.zeros((row_count, col_count))  # type: np.ndarray
-    for y, x in itertools.product(range(col_count), range(row_count)):
-        inverse_terrain_data[x][y] = noise.pnoise2(
-            y / noise_scale, x / noise_scale,
-            noise_octaves
-            )
+    band_rows = max(1, _NOISE_BAND_CELLS // max(col_count, 1))
+    bounds = list(range(0, row_count, band_rows)) + [row_count]
+    band_args = (
+        bounds[:-1], bounds[1:], itertools.repeat(col_count), itertools.repeat(noise_scale),
+        itertools.repeat(noise_octaves)
+    )
+    if workers is None or workers < 2:
+        bands = list(map(_perlin_noise_rows, *band_args))
+    else:
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            bands = list(executor.map(_perlin_noise_rows, *band_args, chunksize=-(-len(bounds) // workers)))
+    inverse_terrain_data = np.concatenate(bands)
+    inverse_terrain_data = inverse_terrain_data.astype(np.float64)
     return (inverse_terrain_data - np.min(inverse_terrain_data)) / (
             np.max(inverse_terrain_data) - np.min(inverse_terrain_data)
     )
     
 
-def generate_terrain_dict(terrain_data_ds: type[np.ndarray], terrain_data_pn: type[np.ndarray], cell_size: int, grid_dict: Dict[str, any]):
-    terrain_dict = {
-        cell: {'str': None, 'raw': None, 'int': None, 'color': None, 'cost_in': None, 'cost_out': None}
-        for cell in grid_dict
-    }
-    for cell, information in grid_dict.items():
-        r, f = information['row_index'], information['col_index']
-        x, y = information['coordinates']
-        terrain_pn_raw = terrain_data_pn[y // cell_size][x // cell_size]
-        terrain_ds_raw = terrain_data_ds[r, f]
-        terrain_raw = (terrain_pn_raw + terrain_ds_raw) / 1.5
-        for terrain, info in DEFAULT_TERRAIN_DICT.items():
-            if terrain_raw <= info['raw_max']:
-                terrain_dict[cell]['str'] = terrain
-                terrain_dict[cell]['raw'] = terrain_raw
-                terrain_dict[cell]['int'] = info['int']
-                terrain_dict[cell]['color'] = info['color']
-                terrain_dict[cell]['cost_in'] = info['cost_in']
-                terrain_dict[cell]['cost_out'] = info['cost_out']
-                terrain_dict[cell]['char'] = info['char']
-                break
-    return terrain_dict
-
-def generate_object_dict(object_data_ds: type[np.ndarray], object_data_pn: type[np.ndarray], cell_size: int, grid_dict: Dict[str, any]):
-    object_dict = {
-        cell: {'items': None, 'obstructions': None, 'structures': None, 'features': None, 'resources': None, 'containers': None, 'doors': None, 'traps': None, 'switches': None }
-    for cell in grid_dict
-    }
-    for cell, information in grid_dict.items():
-        r, f = information['row_index'], information['col_index']
-        x, y = information['coordinates']
-        object_pn_raw = object_data_pn[y // cell_size][x // cell_size]
-        object_ds_raw = object_data_ds[r, f]
-        object_raw = (object_pn_raw + object_ds_raw) / 1.5
-        for obj, info in DEFAULT_OBJECT_DICT.items():
-            if object_raw <= info['raw_max']:
-                if grid_dict[cell]['passable']:
-                    object_dict[cell][info['object_type']+'s'] = [] 
-                    object_dict[cell][info['object_type']+'s'].append(obj)
-                break
-    return object_dict
-            
-def process_noise(noise_scale: int, noise_octaves: int, noise_roughness: float, row_count: int, col_count: int, cell_size: int, grid_dict: Dict[str, any]):
-    terrain_data_ds = diamond_square(noise_roughness, row_count, col_count)
-    terrain_data_pn = perlin_noise(row_count, col_count, noise_scale, noise_octaves)
+class _LayerDict(MutableMapping):
+    """
+    A dictionary of per-cell layer information keyed by designation, backed by one small id per cell.
+
+    Each cell holds an index into a table of per-id information, and the dictionary entry of a cell is only built from
+    that table the first time it is looked up. Built and assigned entries are kept from then on, so changes made to an
+    entry persist. Cells cannot be added to or removed from the dictionary.
+    """
+
+    def __init__(self, grid_dict, ids: np.ndarray) -> None:
+        self._grid_dict = grid_dict
+        self._ids = ids
+        self._entries = {}
+
+    @property
+    def ids(self) -> np.ndarray:
+        """The table id of every cell, in cell index order. Cells whose entries have been built are not updated."""
+        return self._ids
+
+    def _build_entry(self, cell_index: int) -> Dict[str, any]:
+        raise NotImplementedError
+
+    def __getitem__(self, cell: str) -> Dict[str, any]:
+        entry = self._entries.get(cell)
+        if entry is None:
+            entry = self._entries[cell] = self._build_entry(self._grid_dict.index_of(cell))
+        return entry
+
+    def __setitem__(self, cell: str, entry: Dict[str, any]) -> None:
+        self._grid_dict.index_of(cell)
+        self._entries[cell] = entry
+
+    def __delitem__(self, cell: str) -> None:
+        raise TypeError('Cells cannot be removed from a grid.')
+
+    def __iter__(self):
+        return iter(self._grid_dict)
+
+    def __len__(self) -> int:
+        return len(self._grid_dict)
+
+    def __contains__(self, cell) -> bool:
+        return cell in self._grid_dict
+
+
+class TerrainDict(_LayerDict):
+    """
+    A dictionary of terrain information keyed by designation.
+
+    Every cell stores a terrain id and a raw value. The colour, costs and character of each terrain are held once in
+    `terrain_table` rather than copied into every cell. A cell without a raw value has a NaN in `raw`.
+    """
+
+    def __init__(self, grid_dict, terrain_table: Dict[str, Dict[str, any]], terrain_ids: np.ndarray, terrain_raw: np.ndarray) -> None:
+        super().__init__(grid_dict, terrain_ids)
+        self.terrain_table = terrain_table
+        self._terrain_names = list(terrain_table)
+        self._raw = terrain_raw
+
+    @property
+    def raw(self) -> np.ndarray:
+        """The raw terrain value of every cell, in cell index order."""
+        return self._raw
+
+    def _build_entry(self, cell_index: int) -> Dict[str, any]:
+        terrain = self._terrain_names[self._ids[cell_index]]
+        info = self.terrain_table[terrain]
+        raw = float(self._raw[cell_index])
+        return {
+            'str': terrain,
+            'raw': None if raw != raw else raw,
+            'int': info['int'],
+            'color': info['color'],
+            'cost_in': info['cost_in'],
+            'cost_out': info['cost_out'],
+            'char': info['char']
+        }
+
+    def terrain_mask(self, terrains: List[str]) -> np.ndarray:
+        """Returns a mask of the cells whose terrain is one of `terrains`, in cell index order."""
+        mask = np.isin(self._ids, [i for i, terrain in enumerate(self._terrain_names) if terrain in terrains])
+        for cell, entry in self._entries.items():
+            mask[self._grid_dict.index_of(cell)] = entry['str'] in terrains
+        return mask
+
+    def columns(self) -> Dict[str, any]:
+        """
+        Returns the terrain of every cell as columns in cell index order: the terrain names and, per cell, the index
+        into them, the raw value (NaN for None) and the int, colour, costs and character. Built entries take precedence
+        over the table.
+        """
+        names = list(self._terrain_names)
+        table = [self.terrain_table[terrain] for terrain in names]
+        columns = {
+            'names': names,
+            'ids': self._ids.astype(np.intp),
+            'raw': self._raw.astype(np.float64),
+            'int': np.array([info['int'] for info in table])[self._ids],
+            'color': np.array([_as_color(info['color']) for info in table], dtype=np.uint8)[self._ids],
+            'cost_in': np.array([info['cost_in'] for info in table], dtype=np.float64)[self._ids],
+            'cost_out': np.array([info['cost_out'] for info in table], dtype=np.float64)[self._ids],
+            'char': np.array([info['char'] or ' ' for info in table])[self._ids]
+        }
+        for cell, entry in self._entries.items():
+            cell_index = self._grid_dict.index_of(cell)
+            if entry['str'] not in names:
+                names.append(entry['str'])
+            columns['ids'][cell_index] = names.index(entry['str'])
+            columns['raw'][cell_index] = np.nan if entry['raw'] is None else entry['raw']
+            columns['int'][cell_index] = entry['int'] if entry['int'] is not None else 0
+            columns['color'][cell_index] = _as_color(entry['color'])
+            columns['cost_in'][cell_index] = entry['cost_in']
+            columns['cost_out'][cell_index] = entry['cost_out']
+            columns['char'][cell_index] = entry.get('char') or ' '
+        return columns
+
+
+class ObjectDict(_LayerDict):
+    """
+    A dictionary of object information keyed by designation.
+
+    Every cell stores an object id, where 0 means the cell holds no object and `i > 0` means it holds the `i - 1`th
+    object of `object_table`.
+    """
+
+    def __init__(self, grid_dict, object_table: Dict[str, Dict[str, any]], object_ids: np.ndarray) -> None:
+        super().__init__(grid_dict, object_ids)
+        self.object_table = object_table
+        self._object_names = list(object_table)
+
+    def _build_entry(self, cell_index: int) -> Dict[str, any]:
+        entry = dict.fromkeys(_OBJECT_CATEGORIES)
+        object_id = self._ids[cell_index]
+        if object_id:
+            obj = self._object_names[object_id - 1]
+            entry[self.object_table[obj]['object_type'] + 's'] = [obj]
+        return entry
+
+
+def _as_color(color) -> tuple:
+    return (0, 0, 0, 0) if color is None else tuple(color) + (255,) * (4 - len(color))
+
+
+def classify(raw: np.ndarray, table: Dict[str, Dict[str, any]]) -> np.ndarray:
+    """
+    Classifies raw values against the `raw_max` thresholds of a table.
+
+    Each value is given the index of the first entry of the table whose `raw_max` it does not exceed, or `len(table)`
+    if it exceeds them all. An entry whose threshold is not above that of an earlier entry can never be chosen first,
+    so the running maximum of the thresholds is sorted and can be searched in a single `np.searchsorted` call.
+
+    Args:
+        raw (np.ndarray): The raw values to classify.
+        table (Dict[str, Dict[str, any]]): The table to classify against, in priority order.
+
+    Returns:
+        np.ndarray: The uint8 table index of every value.
+
+    Example:
+        ```python
+        ids = classify(np.array([0.4, 0.476, 0.6]), DEFAULT_TERRAIN_DICT)
+        print(ids)
+        # Output: [0 3 8]
+        ```
+    """
+    thresholds = np.maximum.accumulate([info['raw_max'] for info in table.values()])
+    return np.searchsorted(thresholds, raw, side='left').astype(np.uint8)
+
+
+def generate_terrain_dict(terrain_data_ds: type[np.ndarray], terrain_data_pn: type[np.ndarray], cell_size: int, grid_dict: Dict[str, any]) -> TerrainDict:
+    """
+    Classifies the terrain of every cell of a grid.
+
+    The raw terrain value of each cell is the sum of its Perlin noise and its diamond-square noise, rescaled by
+    `blend_heightmap`, divided by 1.5. Cells are classified against `DEFAULT_TERRAIN_DICT` with `classify`, and cells
+    above every threshold become `OCEAN`, with no raw value.
+
+    Args:
+        terrain_data_ds (np.ndarray): The diamond-square noise of the grid, by row and column.
+        terrain_data_pn (np.ndarray): The Perlin noise of the grid, by row and column.
+        cell_size (int): The size of each cell in the grid.
+        grid_dict (GridDict): The grid dictionary.
+
+    Returns:
+        TerrainDict: The terrain of every cell.
+    """
+    terrain_raw = ((terrain_data_pn + blend_heightmap(terrain_data_ds)) / 1.5).ravel()
+    terrain_ids = classify(terrain_raw, DEFAULT_TERRAIN_DICT)
+    terrain_raw = np.where(terrain_ids < len(DEFAULT_TERRAIN_DICT), terrain_raw, np.nan)
+    return TerrainDict(grid_dict, TERRAIN_TABLE, terrain_ids, terrain_raw)
+
+def generate_object_dict(object_data_ds: type[np.ndarray], object_data_pn: type[np.ndarray], cell_size: int, grid_dict: Dict[str, any]) -> ObjectDict:
+    """
+    Places objects on the passable cells of a grid.
+
+    The raw object value of each cell is computed like the raw terrain value and classified against
+    `DEFAULT_OBJECT_DICT`; cells above every threshold, and impassable cells, hold no object.
+
+    Args:
+        object_data_ds (np.ndarray): The diamond-square noise of the grid, by row and column.
+        object_data_pn (np.ndarray): The Perlin noise of the grid, by row and column.
+        cell_size (int): The size of each cell in the grid.
+        grid_dict (GridDict): The grid dictionary.
+
+    Returns:
+        ObjectDict: The objects of every cell.
+    """
+    object_raw = ((object_data_pn + blend_heightmap(object_data_ds)) / 1.5).ravel()
+    object_ids = classify(object_raw, DEFAULT_OBJECT_DICT) + 1
+    object_ids[(object_ids > len(DEFAULT_OBJECT_DICT)) | ~grid_dict.get_passable().astype(bool)] = 0
+    return ObjectDict(grid_dict, DEFAULT_OBJECT_DICT, object_ids)
+
+def process_noise(noise_scale: int, noise_octaves: int, noise_roughness: float, row_count: int, col_count: int, cell_size: int, grid_dict: Dict[str, any], noise_workers: Optional[int] = None, rng: Optional[np.random.Generator] = None):
+    terrain_data_ds = diamond_square(noise_roughness, row_count, col_count, rng)
+    terrain_data_pn = perlin_noise(row_count, col_count, noise_scale, noise_octaves, noise_workers)
     return generate_terrain_dict(
         terrain_data_ds, terrain_data_pn, cell_size, grid_dict
     ) 
 
-def process_tree_noise(noise_scale: int, noise_octaves: int, noise_roughness: float, row_count: int, col_count: int, cell_size: int, grid_dict: Dict[str, any]):
-    tree_data_ds = diamond_square(noise_roughness, row_count, col_count)
-    tree_data_pn = perlin_noise(row_count, col_count, noise_scale, noise_octaves)
+def process_tree_noise(noise_scale: int, noise_octaves: int, noise_roughness: float, row_count: int, col_count: int, cell_size: int, grid_dict: Dict[str, any], noise_workers: Optional[int] = None, rng: Optional[np.random.Generator] = None):
+    tree_data_ds = diamond_square(noise_roughness, row_count, col_count, rng)
+    tree_data_pn = perlin_noise(row_count, col_count, noise_scale, noise_octaves, noise_workers)
     return generate_object_dict(
         tree_data_ds, tree_data_pn, cell_size, grid_dict
     )
     
-def process_edge_noise(noise_scale: int, noise_octaves: int, noise_roughness: float, row_count: int, col_count: int, cell_size: int, grid_dict: Dict[str, any], edge: tuple[tuple[str, int], list[float]]):
-    terrain_data_ds = diamond_square_from_edge(noise_roughness, row_count, col_count, edge)
-    terrain_data_pn = perlin_noise(row_count, col_count, noise_scale, noise_octaves)
+def process_edge_noise(noise_scale: int, noise_octaves: int, noise_roughness: float, row_count: int, col_count: int, cell_size: int, grid_dict: Dict[str, any], edge: tuple[tuple[str, int], list[float]], noise_workers: Optional[int] = None, rng: Optional[np.random.Generator] = None):
+    terrain_data_ds = diamond_square_from_edge(noise_roughness, row_count, col_count, edge, rng)
+    terrain_data_pn = perlin_noise(row_count, col_count, noise_scale, noise_octaves, noise_workers)
     return generate_terrain_dict(
         terrain_data_ds, terrain_data_pn, cell_size, grid_dict)
\ No newline at end of file
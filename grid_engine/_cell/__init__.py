@@ -1 +1,2 @@
-from ._cell import Cell
\ No newline at end of file
+from ._cell import Cell
+from ._cell_store import CellStore
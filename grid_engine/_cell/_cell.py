@@ -57,173 +57,87 @@ class CellEventMeta(type):
 
 
 class AbstractCell(metaclass=type):
-    """Abstract cell class. Contains the basic attributes and methods of a cell."""
-    __slots__ = (
-        'parentgrid', 
-        'entry',
-        'designation', 
-        'cell_index', 
-        'row_index', 
-        'col_index', 
-        'quadrant_index', 
-        'coordinates', 
-        'x', 
-        'y', 
-        'size', 
-        'width', 
-        'height', 
-        'adjacent', 
-        'quadrant', 
-        'terrain_str', 
-        'terrain_raw', 
-        'terrain_int', 
-        'terrain_color',
-        'terrain_char', 
-        'terrain_shape', 
-        'groups', 
-        'neighborhood', 
-    )
-    _up_left = None
-    _up = None
-    _up_right = None
-    _clearance_up = None
-    _down_right = None
-    _down = None
-    _down_left = None
-    _clearance_down = None
-    _clearance_y = None
-    _left = None
-    _clearance_left = None
-    _right = None
-    _clearance_right = None
-    _clearance_x = None
-
-    _cost_in = None
-    _cost_out = None
-    _array = None
-    _entry_terrain = None
-    _entry_object = None
-    _entry_unit = None
-    _entry_zone = None
-    _entry_effect = None
-    _entry_fow = None
-    _passable = None
-    
-    _occupied = False
-    _occupant = None
-    _constructed = False
-    _construction = None
+    """Abstract cell class. Contains the basic attributes and methods of a cell.
 
-    _entitled = False
-    _title = None
-    _entity = None
+    A cell is a lightweight view onto one index of its parent grid's `CellStore`. Only the parent grid and the cell
+    index live on the instance; every other attribute is read from, and written to, the store. Attributes without a
+    column in the store are kept in the store's sparse `extras`.
+    """
+    __slots__ = ('parentgrid', 'cell_index')
 
-    
     def __init__(self, cell_designation = None, row = None, col = None, parentgrid = None):
-        self._null = None
+        pass
+
+    def __getattr__(self, name):
+        if name in AbstractCell.__slots__ or name.startswith('__'):
+            raise AttributeError(name)
+        try:
+            return self.parentgrid.store.extras[self.cell_index][name]
+        except (KeyError, AttributeError):
+            raise AttributeError(f'{type(self).__name__!r} object has no attribute {name!r}') from None
+
+    def __setattr__(self, name, value):
+        if name in AbstractCell.__slots__ or hasattr(type(self), name):
+            object.__setattr__(self, name, value)
+        else:
+            self.parentgrid.store.set_extra(self.cell_index, name, value)
+
+    @property
+    def store(self):
+        """Returns the store holding the cell's data"""
+        return self.parentgrid.store
 
     @property
     def null(self):
-        return self._null
+        return self.store.extra(self.cell_index, 'null')
 
     @null.setter
     def null(self, value):
-        self._null = value
+        self.store.set_extra(self.cell_index, 'null', value)
+
+    def _neighbor(self, direction: int):
+        adjacent = int(self.parentgrid.blueprint.neighbors[self.cell_index, direction])
+        return None if adjacent < 0 else self.parentgrid.cells[adjacent]
 
     @property
     def up_left(self):
         """Returns the cell adjacent in the up-left direction"""
-        if self.row == self.parentgrid.last_row or self.col == self.parentgrid.first_col:
-            self._up_left = None
-        else:
-            self._up_left = self.parentgrid[self.adjacent[0]]
-            # self._up_left = self.parentgrid.get_cell_by_position(self.x - self.size, self.y + self.size)
-        return self._up_left
+        return self._neighbor(0)
 
     @property
     def up(self):
         """Returns the cell adjacent in the up direction"""
-        if self.row == self.parentgrid.first_row:
-            self._up = None
-        else:
-            self._up = self.parentgrid[self.adjacent[1]]
-            # self._up = self.col[self.col.index(self)+1]
-        return self._up
-    
+        return self._neighbor(1)
+
     @property
     def up_right(self):
         """Returns the cell adjacent in the up-right direction"""
-        if self.row == self.parentgrid.first_row or self.col == self.parentgrid.last_col:
-            self._up_right = None
-        else:
-            self._up_right = self.parentgrid[self.adjacent[2]]
-            # self._up_right = self.parentgrid.get_cell_by_position(self.x + self.size, self.y + self.size)
-        return self._up_right
-    
+        return self._neighbor(2)
+
     @property
     def clearance_up(self):
         """Returns the number of cells in the up direction that are passable"""
-        if self.row == self.parentgrid.first_row:
-            self._clearance_up = 0
-        else:
-            clearance = 0
-            place_in_col = self.col.index(self)
-            col_len = len(self.col)
-            steps_to_top = col_len - place_in_col
-            for step in range(steps_to_top):
-                if self.col[place_in_col + step].passable:
-                    clearance += 1
-                else:
-                    break
-            self._clearance_up = clearance
-        return self._clearance_up
+        return int(self.parentgrid.clearance.up[self.cell_index])
 
     @property
     def down_right(self):
         """Returns the cell adjacent in the down-right direction"""
-        if self.row == self.parentgrid.last_row or self.col == self.parentgrid.last_col:
-            self._down_right = None
-        else:
-            self._down_right = self.parentgrid[self.adjacent[4]]
-            # self._down_right = self.parentgrid.get_cell_by_position(self.x + self.size, self.y - self.size)
-        return self._down_right    
-    
+        return self._neighbor(4)
+
     @property
     def down(self):
         """Returns the cell adjacent in the down direction"""
-        if self.row == self.parentgrid.last_row:
-            self._down = None
-        else:
-            self._down = self.parentgrid[self.adjacent[5]]
-            # self._down = self.col[self.col.index(self) - 1]
-        return self._down
+        return self._neighbor(5)
 
     @property
     def down_left(self):
         """Returns the cell adjacent in the down-left direction"""
-        if self.row == self.parentgrid.last_row or self.col == self.parentgrid.first_col:
-            self._down_left = None
-        else:
-            self._down_left = self.parentgrid[self.adjacent[6]]
-            # self._down_left = self.parentgrid.get_cell_by_position(self.x - self.size, self.y - self.size)
-        return self._down_left
+        return self._neighbor(6)
 
     @property
     def clearance_down(self):
         """Returns the number of cells in the down direction that are passable"""
-        if self.row == self.parentgrid.last_row:
-            self._clearance_down = 0
-        else:
-            clearance = 0
-            place_in_col = self.col.index(self)
-            steps_to_bottom = place_in_col
-            for step in range(steps_to_bottom):
-                if self.col[steps_to_bottom - step].passable:
-                    clearance += 1
-                else:
-                    break
-            self._clearance_down = clearance
-        return self._clearance_down
+        return int(self.parentgrid.clearance.down[self.cell_index])
 
     @property
     def clearance_y(self):
@@ -233,56 +147,22 @@ class AbstractCell(metaclass=type):
     @property
     def left(self):
         """Returns the cell adjacent in the left direction"""
-        if self.col == self.parentgrid.first_col:
-            self._left = None
-        else:
-            self._left = self.parentgrid[self.adjacent[7]]
-            # self._left = self.row[self.row.index(self) - 1]
-        return self._left
-    
+        return self._neighbor(7)
+
     @property
     def clearance_left(self):
         """Returns the number of cells in the left direction that are passable"""
-        if self.col == self.parentgrid.first_col:
-            self._clearance_left = 0
-        else:
-            clearance = 0
-            place_in_row = self.row.index(self)
-            steps_to_left = place_in_row
-            for step in range(steps_to_left):
-                if self.row[steps_to_left - step].passable:
-                    clearance += 1
-                else:
-                    break
-            self._clearance_left = clearance
-        return self._clearance_left
+        return int(self.parentgrid.clearance.left[self.cell_index])
 
     @property
     def right(self):
         """Returns the cell adjacent in the right direction"""
-        if self.col == self.parentgrid.last_col:
-            self._right = None
-        else:
-            self._right = self.parentgrid[self.adjacent[3]]
-        return self._right
-    
+        return self._neighbor(3)
+
     @property
     def clearance_right(self):
         """Returns the number of cells in the right direction that are passable"""
-        if self.col == self.parentgrid.last_col:
-            self._clearance_right = 0
-        else:
-            clearance = 0
-            place_in_row = self.row.index(self)
-            len_row = len(self.row)
-            steps_to_right = len_row - place_in_row
-            for step in range(steps_to_right):
-                if self.row[place_in_row + step].passable:
-                    clearance += 1
-                else:
-                    break
-            self._clearance_right = clearance
-        return self._clearance_right
+        return int(self.parentgrid.clearance.right[self.cell_index])
 
     @property
     def clearance_x(self):
@@ -293,175 +173,183 @@ class AbstractCell(metaclass=type):
     def clearance_zone(self):
         """Returns the clearance zone of the cell"""
         return self.get_clearance_zone()
-    
+
     @property
     def cost_in(self):
         """Returns the cost to move into the cell"""
-        return self._cost_in
+        return float(self.store.cost_in[self.cell_index])
+
+    @cost_in.setter
+    def cost_in(self, value):
+        """Sets the cost to move into the cell"""
+        self.store.set_cost_in(self.cell_index, value)
 
     @property
     def cost_out(self):
         """Returns the cost to move out of the cell"""
-        return self._cost_out
+        return float(self.store.cost_out[self.cell_index])
+
+    @cost_out.setter
+    def cost_out(self, value):
+        """Sets the cost to move out of the cell"""
+        self.store.set_cost_out(self.cell_index, value)
 
     @property
     def array(self):
-        """Returns the array of the cell"""
-        return self._array
-    
+        """Returns the entries of the cell in every layer of the grid, from terrain to fog of war"""
+        return [self.parentgrid.blueprint.get_layer_entry(layer, self.col_index, self.row_index) for layer in range(6)]
+
     @array.setter
     def array(self, value):
-        """Sets the array of the cell"""
-        self._array = value
-            
+        """Sets the entries of the cell in every layer of the grid"""
+        for layer, entry in enumerate(value):
+            self._set_entry(layer, entry)
+
+    def _set_entry(self, layer, entry):
+        self.parentgrid.blueprint.set_layer_entry(layer, self.col_index, self.row_index, entry)
+
     @property
     def entry_terrain(self):
         """Returns the dict entry for the cell related to terrain"""
-        return self._entry_terrain
-    
+        return self.parentgrid.blueprint.get_layer_entry(0, self.col_index, self.row_index)
+
     @entry_terrain.setter
     def entry_terrain(self, entry_terrain: dict[str, any]):
         """Sets the dict entry for the cell related to terrain"""
-        self._entry_terrain = entry_terrain
-        self._cost_in = entry_terrain['cost_in']
-        self._cost_out = entry_terrain['cost_out']
-        self.array[0, 0] = entry_terrain
-    
+        self._set_entry(0, entry_terrain)
+        self.cost_in = entry_terrain['cost_in']
+        self.cost_out = entry_terrain['cost_out']
+
     @property
     def entry_object(self):
         """Returns the dict entry for the cell related to objects"""
-        return self._entry_object
-    
+        return self.parentgrid.blueprint.get_layer_entry(1, self.col_index, self.row_index)
+
     @entry_object.setter
     def entry_object(self, entry_object: dict[str, any]):
         """Sets the dict entry for the cell related to objects"""
-        self._entry_object = entry_object
-        self.array[0, 1] = entry_object
-            
+        self._set_entry(1, entry_object)
+
     @property
     def entry_unit(self):
         """Returns the dict entry for the cell related to units"""
-        return self._entry_unit
-    
+        return self.parentgrid.blueprint.get_layer_entry(2, self.col_index, self.row_index)
+
     @entry_unit.setter
     def entry_unit(self, entry_unit: dict[str, any]):
         """Sets the dict entry for the cell related to units"""
-        self._entry_unit = entry_unit
-        self.array[0, 2] = entry_unit
-        
+        self._set_entry(2, entry_unit)
+
     @property
     def entry_zone(self):
         """Returns the dict entry for the cell related to zones"""
-        return self._entry_zone
-    
+        return self.parentgrid.blueprint.get_layer_entry(3, self.col_index, self.row_index)
+
     @entry_zone.setter
     def entry_zone(self, entry_zone: dict[str, any]):
         """Sets the dict entry for the cell related to zones"""
-        self._entry_zone = entry_zone
-        self.array[0, 3] = entry_zone
-        
+        self._set_entry(3, entry_zone)
+
     @property
     def entry_effect(self):
         """Returns the dict entry for the cell related to effects"""
-        return self._entry_effect
-    
+        return self.parentgrid.blueprint.get_layer_entry(4, self.col_index, self.row_index)
+
     @entry_effect.setter
     def entry_effect(self, entry_effect: dict[str, any]):
         """Sets the dict entry for the cell related to effects"""
-        self._entry_effect = entry_effect
-        self.array[0, 4] = entry_effect
-        
+        self._set_entry(4, entry_effect)
+
     @property
     def entry_fow(self):
         """Returns the dict entry for the cell related to fog of war"""
-        return self._entry_fow
-    
+        return self.parentgrid.blueprint.get_layer_entry(5, self.col_index, self.row_index)
+
     @entry_fow.setter
     def entry_fow(self, entry_fow: dict[str, any]):
         """Sets the dict entry for the cell related to fog of war"""
-        self._entry_fow = entry_fow
-        self.array[0, 5] = entry_fow
-        
+        self._set_entry(5, entry_fow)
+
     @property
     def passable(self):
         """Returns the passable value of the cell"""
-        return self._passable
-    
+        return bool(self.store.passable[self.cell_index])
+
     @passable.setter
     def passable(self, value):
-        """Sets the passable value of the cell. Additionally, the main entry and grid array are updated."""
-        self._passable = value
+        """Sets the passable value of the cell. Additionally, the main entry is updated."""
+        self.store.set_passable(self.cell_index, value)
         self.entry['passable'] = value
-        
+
     @property
     def occupied(self):
         """Returns True if the cell is occupied, False otherwise"""
-        return self._occupied
-    
+        return self.store.extra(self.cell_index, 'occupied', False)
+
     @occupied.setter
     def occupied(self, value):
         """Sets the occupied value of the cell"""
-        self._occupied = value
-        
+        self.store.set_extra(self.cell_index, 'occupied', value)
+
     @property
     def occupant(self):
         """Returns the occupant of the cell"""
-        return self._occupant
-    
+        return self.store.extra(self.cell_index, 'occupant')
+
     @occupant.setter
     def occupant(self, value):
         """Sets the occupant of the cell"""
-        self._occupant = value
-        
+        self.store.set_extra(self.cell_index, 'occupant', value)
+
     @property
     def constructed(self):
         """Returns True if the cell is constructed, False otherwise"""
-        return self._constructed
-    
+        return self.store.extra(self.cell_index, 'constructed', False)
+
     @constructed.setter
     def constructed(self, value):
         """Sets the constructed value of the cell"""
-        self._constructed = value
-        
+        self.store.set_extra(self.cell_index, 'constructed', value)
+
     @property
     def construction(self):
         """Returns the construction of the cell"""
-        return self._construction
-    
+        return self.store.extra(self.cell_index, 'construction')
+
     @construction.setter
     def construction(self, value):
         """Sets the construction of the cell"""
-        self._construction = value
+        self.store.set_extra(self.cell_index, 'construction', value)
 
     @property
     def entitled(self):
         """Returns True if the cell is entitled, False otherwise"""
-        return self._entitled
-    
+        return self.store.extra(self.cell_index, 'entitled', False)
+
     @entitled.setter
     def entitled(self, value):
         """Sets the entitled value of the cell"""
-        self._entitled = value
-        
+        self.store.set_extra(self.cell_index, 'entitled', value)
+
     @property
     def title(self):
         """Returns the title of the cell"""
-        return self._title
-    
+        return self.store.extra(self.cell_index, 'title')
+
     @title.setter
     def title(self, value):
         """Sets the title of the cell"""
-        self._title = value
-    
+        self.store.set_extra(self.cell_index, 'title', value)
+
     @property
     def entity(self):
         """Returns the entity of the cell"""
-        return self._entity
+        return self.store.extra(self.cell_index, 'entity')
 
     @entity.setter
     def entity(self, value):
         """Sets the entity of the cell"""
-        self._entity = value
+        self.store.set_extra(self.cell_index, 'entity', value)
 
 def _dynamic_cell_decorator(cell: Cell = None):
     def decorator(func):
@@ -471,87 +359,215 @@ def _dynamic_cell_decorator(cell: Cell = None):
     return decorator
 
 class Cell(AbstractCell, metaclass=CellEventMeta):
+    """A view onto a single cell of a grid. Views are cheap to create and compare equal by cell index, so the grid
+    hands out a new one on every lookup instead of keeping one object per cell alive."""
+    __slots__ = ()
 
     def __repr__(self):
         return str(f'{self.designation}({self.row_index}, {self.col_index})')
 
     def __init__(
             self,
-            designation: _Optional[str] = None,
-            row: _Optional[str] = None,
-            col: _Optional[str] = None,
+            cell_index: _Optional[_Union[int, str]] = None,
             parentgrid: _Optional[Grid] = None,
     ) -> None:
-        self.parentgrid = parentgrid
-        if parentgrid is not None:
-            self.with_terrain = self.parentgrid.with_terrain
-            self.entry = self.parentgrid.blueprint.dictGrid[designation]
-
-            self.designation = designation if designation is not None else row + col
-            self.cell_index = self.entry['cell_index']
-
-            self.row_name = designation[:-5] if row is None else row
-            self.row_index = self.entry['row_index']
-
-            self.col_name = designation[-5:] if col is None else col
-            self.col_index = self.entry['col_index']
-
-            self._array = np.array([{} for _ in range(6)], dtype=type(any)).reshape(1, 6)
-
-            self.coordinates = self.entry['coordinates']
-            self.x = self.coordinates[0]
-            self.y = self.coordinates[1]
-
-            self.size = self.parentgrid.cell_size
-            self.width = self.size
-            self.height = self.size
-
-            self.adjacent = self.entry['adjacent']
-            if self.with_terrain:
-                self._entry_terrain = self.parentgrid.dictTerrain[self.designation]
-                self.terrain_str = self.parentgrid.dictTerrain[self.designation]['str']
-                self.terrain_raw = self.parentgrid.dictTerrain[self.designation]['raw']
-                self.terrain_int = self.parentgrid.dictTerrain[self.designation]['int']
-                self.terrain_color = self.parentgrid.dictTerrain[self.designation]['color']
-                self.terrain_char = self.parentgrid.dictTerrain[self.designation]['char']
-                self._cost_in = self.parentgrid.dictTerrain[self.designation]['cost_in']
-                self._cost_out = self.parentgrid.dictTerrain[self.designation]['cost_out']
-            self.overlay_color = None
-            self.stored_overlay_color = None
-
-            self.quadrant_index = self.entry['quadrant_index']
-            self._passable = self.entry['passable']
-
-            self.groups = {}
-            self._in_zone = False
-            self._in_region = False
-            self._landmass_index = None
-            self._body_of_water_index = None
-            self._is_coastal = False
-
-            for key, val in self.entry.items():
-                if key not in list(self.entry)[:7]:
-                    setattr(self, key, val)
-
-            self.neighborhood = _Neighborhood
-            
-            self._shape = None
+        if isinstance(cell_index, str) and parentgrid is not None:
+            cell_index = parentgrid.cells.index_of(cell_index)
+        object.__setattr__(self, 'parentgrid', parentgrid)
+        object.__setattr__(self, 'cell_index', cell_index)
+
+    @property
+    def with_terrain(self):
+        """Returns True if the parent grid has terrain, False otherwise"""
+        return self.parentgrid.with_terrain
+
+    @property
+    def entry(self):
+        """Returns the main dict entry of the cell"""
+        return self.parentgrid.blueprint.dictGrid[self.designation]
+
+    @property
+    def designation(self):
+        """Returns the designation of the cell"""
+        return self.parentgrid.blueprint.cell_list[self.cell_index]
+
+    @property
+    def row_index(self):
+        """Returns the index of the cell's row"""
+        return self.cell_index // self.store.col_count
+
+    @property
+    def col_index(self):
+        """Returns the index of the cell's column"""
+        return self.cell_index % self.store.col_count
+
+    @property
+    def row_name(self):
+        """Returns the name of the cell's row"""
+        return self.designation[:-5]
+
+    @property
+    def col_name(self):
+        """Returns the name of the cell's column"""
+        return self.designation[-5:]
+
+    @property
+    def coordinates(self):
+        """Returns the coordinates of the cell"""
+        return self.x, self.y
+
+    @property
+    def x(self):
+        """Returns the x coordinate of the cell"""
+        return int(self.store.x[self.cell_index])
+
+    @property
+    def y(self):
+        """Returns the y coordinate of the cell"""
+        return int(self.store.y[self.cell_index])
+
+    @property
+    def size(self):
+        """Returns the size of the cell"""
+        return self.parentgrid.cell_size
+
+    @property
+    def width(self):
+        """Returns the width of the cell"""
+        return self.size
+
+    @property
+    def height(self):
+        """Returns the height of the cell"""
+        return self.size
+
+    @property
+    def adjacent(self):
+        """Returns the designations of the cells adjacent to the cell"""
+        return self.entry['adjacent']
+
+    @property
+    def neighbor_indices(self):
+        """Returns the cell indices of the cells adjacent to the cell, in the order of `adjacent`. Off-grid neighbors
+        are -1."""
+        return self.parentgrid.blueprint.neighbors[self.cell_index].tolist()
+
+    @property
+    def quadrant_index(self):
+        """Returns the index of the cell's quadrant"""
+        return self.entry['quadrant_index']
+
+    @quadrant_index.setter
+    def quadrant_index(self, value):
+        """Sets the index of the cell's quadrant"""
+        self.entry['quadrant_index'] = value
+
+    @property
+    def terrain_str(self):
+        """Returns the terrain name of the cell"""
+        return self.store.get_terrain_str(self.cell_index)
+
+    @terrain_str.setter
+    def terrain_str(self, value):
+        """Sets the terrain name of the cell"""
+        self.store.set_terrain_str(self.cell_index, value)
+
+    @property
+    def terrain_raw(self):
+        """Returns the raw terrain value of the cell"""
+        return self.store.get_terrain_raw(self.cell_index)
+
+    @terrain_raw.setter
+    def terrain_raw(self, value):
+        """Sets the raw terrain value of the cell"""
+        self.store.set_terrain_raw(self.cell_index, value)
+
+    @property
+    def terrain_int(self):
+        """Returns the terrain integer of the cell"""
+        return int(self.store.terrain_int[self.cell_index])
+
+    @terrain_int.setter
+    def terrain_int(self, value):
+        """Sets the terrain integer of the cell"""
+        self.store.terrain_int[self.cell_index] = value
+
+    @property
+    def terrain_color(self):
+        """Returns the terrain color of the cell"""
+        return self.store.get_terrain_color(self.cell_index)
+
+    @terrain_color.setter
+    def terrain_color(self, value):
+        """Sets the terrain color of the cell"""
+        self.store.set_terrain_color(self.cell_index, value)
+
+    @property
+    def terrain_char(self):
+        """Returns the terrain character of the cell"""
+        return str(self.store.terrain_char[self.cell_index])
+
+    @terrain_char.setter
+    def terrain_char(self, value):
+        """Sets the terrain character of the cell"""
+        self.store.terrain_char[self.cell_index] = value or ' '
+
+    @property
+    def overlay_color(self):
+        """Returns the overlay color of the cell"""
+        return self.store.extra(self.cell_index, 'overlay_color')
+
+    @overlay_color.setter
+    def overlay_color(self, value):
+        """Sets the overlay color of the cell"""
+        self.store.set_extra(self.cell_index, 'overlay_color', value)
+
+    @property
+    def stored_overlay_color(self):
+        """Returns the stored overlay color of the cell"""
+        return self.store.extra(self.cell_index, 'stored_overlay_color')
+
+    @stored_overlay_color.setter
+    def stored_overlay_color(self, value):
+        """Sets the stored overlay color of the cell"""
+        self.store.set_extra(self.cell_index, 'stored_overlay_color', value)
+
+    @property
+    def groups(self):
+        """Returns the groups of the cell"""
+        extras = self.store.extras.setdefault(self.cell_index, {})
+        return extras.setdefault('groups', {})
+
+    @groups.setter
+    def groups(self, value):
+        """Sets the groups of the cell"""
+        self.store.set_extra(self.cell_index, 'groups', value)
+
+    @property
+    def neighborhood(self):
+        """Returns the neighborhood of the cell"""
+        return self.store.extra(self.cell_index, 'neighborhood', _Neighborhood)
+
+    @neighborhood.setter
+    def neighborhood(self, value):
+        """Sets the neighborhood of the cell"""
+        self.store.set_extra(self.cell_index, 'neighborhood', value)
 
     @property
     def row(self):
         """Returns the row of the cell"""
-        return self.parentgrid.get_row_by_name(self.row_name)
-    
+        return self.parentgrid.rows[self.row_index]
+
     @property
     def col(self):
         """Returns the column of the cell"""
-        return self.parentgrid.get_col_by_name(self.col_name)
+        return self.parentgrid.cols[self.col_index]
 
     @property
     def in_zone(self):
         """Returns True if the cell is in a zone, False otherwise"""
         return self.entry_zone is not None
-    
+
     @property
     def in_region(self):
         """Returns True if the cell is in a region, False otherwise"""
@@ -560,42 +576,42 @@ class Cell(AbstractCell, metaclass=CellEventMeta):
     @property
     def landmass_index(self):
         """Returns the landmass index of the cell"""
-        return self._landmass_index
+        return self.store.get_index(self.store.landmass_index, self.cell_index)
 
     @landmass_index.setter
     def landmass_index(self, value):
         """Sets the landmass index of the cell"""
-        self._landmass_index = value
+        self.store.landmass_index[self.cell_index] = -1 if value is None else value
 
     @property
     def body_of_water_index(self):
         """Returns the body of water index of the cell"""
-        return self._body_of_water_index
-    
+        return self.store.get_index(self.store.body_of_water_index, self.cell_index)
+
     @body_of_water_index.setter
     def body_of_water_index(self, value):
         """Sets the body of water index of the cell"""
-        self._body_of_water_index = value
+        self.store.body_of_water_index[self.cell_index] = -1 if value is None else value
 
     @property
     def is_coastal(self):
         """Returns True if the cell is coastal, False otherwise"""
-        return self._is_coastal
-    
+        return bool(self.store.is_coastal[self.cell_index])
+
     @is_coastal.setter
     def is_coastal(self, value):
         """Sets the is_coastal value of the cell"""
-        self._is_coastal = value
-        
+        self.store.is_coastal[self.cell_index] = value
+
     @property
     def shape(self):
         """Returns the shape of the cell"""
-        return self._shape
-    
+        return self.store.extra(self.cell_index, 'shape')
+
     @shape.setter
     def shape(self, value):
         """Sets the shape of the cell"""
-        self._shape = value
+        self.store.set_extra(self.cell_index, 'shape', value)
 
     def __lt__(self, other):
         return self.cell_index < other.cell_index
@@ -621,7 +637,7 @@ class Cell(AbstractCell, metaclass=CellEventMeta):
         return self.cell_index >= other.cell_index
     
     def __hash__(self):
-        return hash(self.designation)
+        return hash(self.cell_index)
         
     def cell_decorator(self, func):
         """Decorator for cell methods that require the cell as an argument"""
@@ -634,18 +650,18 @@ class Cell(AbstractCell, metaclass=CellEventMeta):
         clearance_zone = GridGroup(self.parentgrid, f'{self.designation}_clearance_zone', [])
         clearance_in_row = []
         clearance_in_col = []
-        for cell in self.row[self.row.index(self) - self.clearance_left:self.row.index(self) + self.clearance_right + 1]:
+        for cell in self.row[self.col_index - self.clearance_left:self.col_index + self.clearance_right + 1]:
             clearance_in_row.append(cell)
             clearance_zone.add_cell(cell)
-        for cell in self.col[self.col.index(self) - self.clearance_down:self.col.index(self) + self.clearance_up + 1]:
+        for cell in self.col[self.row_index - self.clearance_down:self.row_index + self.clearance_up + 1]:
             clearance_in_col.append(cell)
             clearance_zone.add_cell(cell)
         for cell in clearance_in_row:
-            for celly in cell.col[cell.col.index(cell) - cell.clearance_down:cell.col.index(cell) + cell.clearance_up + 1]:
+            for celly in cell.col[cell.row_index - cell.clearance_down:cell.row_index + cell.clearance_up + 1]:
                 if celly.passable and celly != cell:
                     clearance_zone.add_cell(celly)
         for cell in clearance_in_col:
-            for cellx in cell.row[cell.row.index(cell) - cell.clearance_left:cell.row.index(cell) + cell.clearance_right + 1]:
+            for cellx in cell.row[cell.col_index - cell.clearance_left:cell.col_index + cell.clearance_right + 1]:
                 if cellx.passable and cellx != cell:
                     clearance_zone.add_cell(cellx)
         for cell in clearance_zone.cells:
@@ -724,11 +740,13 @@ class Cell(AbstractCell, metaclass=CellEventMeta):
         """Sets the cell as occupied by an occupant. Updates the occupant attribute."""
         self.occupant = occupant
         self.add_unit(occupant)
+        self.parentgrid.entity_hash.insert(occupant, self.cell_index)
         self.occupied = True
 
     def on_vacate(self):
         """Sets the cell as unoccupied. Updates the occupant attribute. Handles the on_vacate event."""
         self.remove_unit(self.occupant)
+        self.parentgrid.entity_hash.remove(self.occupant, self.cell_index)
         self.occupant = None
         self.occupied = False
 
@@ -767,8 +785,13 @@ class Cell(AbstractCell, metaclass=CellEventMeta):
         otype = f'{grid_object.object_type}s'
         if self.entry_object[f'{otype}'] is None:
             self.entry_object[f'{otype}'] = {}
+        previous = self.entry_object[f'{otype}'].get(grid_object.name)
+        if grid_object.name not in self.entry_object[f'{otype}']:
+            self.parentgrid.object_index.add(otype, self.cell_index)
+        elif previous is not grid_object:
+            self.parentgrid.occupancy.remove(previous, self.cell_index)
         self.entry_object[f'{otype}'].update({grid_object.name: grid_object})
-        self.parentgrid.dictObject[self.col_index][self.row_index] = self.entry_object
+        self.parentgrid.occupancy.add(grid_object, self.cell_index, otype)
         if otype == 'items':
             if hasattr(grid_object, 'tile_color') and getattr(self.parentgrid, 'scene', None) is not None:
                 self.overlay_color = grid_object.tile_color
@@ -787,10 +810,12 @@ class Cell(AbstractCell, metaclass=CellEventMeta):
         """Removes a GridObject from the cell. Updates the entry_object attribute. Also updates the grid array.
         """
         otype = f'{grid_object.object_type}s'
-        if self.entry_object[f'{otype}'][grid_object.name] is not None:
+        stored = self.entry_object[f'{otype}'][grid_object.name]
+        if stored is not None:
             self.entry_object[f'{otype}'][grid_object.name] = None
             del self.entry_object[f'{otype}'][grid_object.name]
-            self.parentgrid.dictObject[self.col_index][self.row_index] = self.entry_object
+            self.parentgrid.object_index.remove(otype, self.cell_index)
+            self.parentgrid.occupancy.remove(stored, self.cell_index)
             if otype == 'structures':
                 self.on_destruct()
                 if hasattr(grid_object, 'tile_color') and getattr(self.parentgrid, 'scene', None) is not None:
@@ -828,20 +853,27 @@ class Cell(AbstractCell, metaclass=CellEventMeta):
         utype = 'players'
         if self.entry_unit[f'{utype}'] is None:
             self.entry_unit[f'{utype}'] = {}
+        previous = self.entry_unit[f'{utype}'].get(unit.name)
+        if unit.name not in self.entry_unit[f'{utype}']:
+            self.parentgrid.unit_index.add(utype, self.cell_index)
+        elif previous is not unit:
+            self.parentgrid.occupancy.remove(previous, self.cell_index)
         self.entry_unit[f'{utype}'].update({unit.name: unit})
-        self.parentgrid.dictUnit[self.col_index][self.row_index] = self.entry_unit
+        self.parentgrid.occupancy.add(unit, self.cell_index, utype)
         
         
     def remove_unit(self, unit):
         """Removes a GridUnit from the cell. Updates the entry_unit attribute. Also updates the grid array."""
         # utype = f'{unit.actor_type}s'
         utype = 'players'
-        if self.entry_unit[f'{utype}'][unit.name] is not None:
+        stored = self.entry_unit[f'{utype}'][unit.name]
+        if stored is not None:
             self.entry_unit[f'{utype}'][unit.name] = None
             del self.entry_unit[f'{utype}'][unit.name]
+            self.parentgrid.unit_index.remove(utype, self.cell_index)
+            self.parentgrid.occupancy.remove(stored, self.cell_index)
         if self.entry_unit[f'{utype}'] == {}:
             self.entry_unit[f'{utype}'] = None
-        self.parentgrid.dictUnit[self.col_index][self.row_index][2] = self.entry_unit
             
 
                     
@@ -897,18 +929,9 @@ class Cell(AbstractCell, metaclass=CellEventMeta):
         for key in self.entry.keys():
             if key not in list(self.entry.keys())[:5]:
                 self.entry[key] = getattr(self, key)
-        self.size = self.parentgrid.cell_size
-        self.width = self.size
-        self.height = self.size
-        self.refresh()
-        
-
-    def init_array(self):
-        self.array = self.parentgrid.grid_array[self.col_index, self.row_index]
-
 
-    def refresh(self, dt):
-        self.parentgrid.grid_array[self.file_index, self.rank_index] = self.array
+    def refresh(self, dt = None):
+        """Refreshes the cell. The cell array is a view onto the grid array, so there is nothing to write back."""
         
     def _request_shape(self):
         """Requests the shape of the cell from the parent grid."""
@@ -0,0 +1,178 @@
+from __future__ import annotations
+
+from typing import Optional as _Optional, Any as _Any, Callable as _Callable
+
+import numpy as np
+
+_NO_COLOR = (0, 0, 0, 0)
+
+
+class CellStore:
+    """A structure-of-arrays store holding the state of every cell in a grid.
+
+    Every attribute is a flat, typed NumPy array with one entry per cell, addressed by cell index
+    (`row_index * col_count + col_index`). `Cell` objects are lightweight views onto a single index of these arrays and
+    are created on demand, so a grid no longer keeps one Python object per cell alive.
+
+    Missing values are encoded in-band: `-1` for landmass and body of water indices, `NaN` for the raw terrain value
+    and a fully transparent colour for a cell without a terrain colour. Terrain names are interned into
+    `terrain_names` and referenced per cell by `terrain_id`.
+
+    Attributes that are rarely set (occupants, overlays, groups, ...) are kept in `extras`, a sparse mapping of cell
+    index to attribute dictionary, so they only cost memory for the cells that actually use them.
+
+    Passability, movement costs and terrain should be changed through `set_passable`, `set_cost_in`, `set_cost_out`
+    and `set_terrain_str`, which notify the observers registered with `subscribe` (such as the grid's path engine and
+    terrain index) of the change.
+    """
+
+    def __init__(self, row_count: int, col_count: int, cell_size: int) -> None:
+        self.row_count = row_count
+        self.col_count = col_count
+        self.cell_size = cell_size
+        self.size = row_count * col_count
+        cell_index = np.arange(self.size, dtype=np.int32)
+        self.row_index = cell_index // col_count
+        self.col_index = cell_index % col_count
+        self.x = self.col_index * np.int32(cell_size)
+        self.y = self.row_index * np.int32(cell_size)
+        self.terrain_id = np.zeros(self.size, dtype=np.uint8)
+        self.terrain_int = np.zeros(self.size, dtype=np.int16)
+        self.terrain_raw = np.full(self.size, np.nan, dtype=np.float32)
+        self.terrain_color = np.zeros((self.size, 4), dtype=np.uint8)
+        self.terrain_char = np.full(self.size, ' ', dtype='<U1')
+        self.passable = np.ones(self.size, dtype=np.bool_)
+        self.cost_in = np.ones(self.size, dtype=np.float32)
+        self.cost_out = np.ones(self.size, dtype=np.float32)
+        self.landmass_index = np.full(self.size, -1, dtype=np.int32)
+        self.body_of_water_index = np.full(self.size, -1, dtype=np.int32)
+        self.is_coastal = np.zeros(self.size, dtype=np.bool_)
+        self.terrain_names: list[_Optional[str]] = []
+        self._terrain_ids: dict[_Optional[str], int] = {}
+        self.extras: dict[int, dict[str, _Any]] = {}
+        self._observers: list[_Callable[[str, int], None]] = []
+
+    def __len__(self) -> int:
+        return self.size
+
+    @classmethod
+    def from_blueprint(cls, blueprint) -> CellStore:
+        """Creates a store for the cells described by a blueprint, loading passability and terrain in bulk."""
+        store = cls(blueprint.row_count, blueprint.col_count, blueprint.cell_size)
+        store.passable[:] = blueprint.dictGrid.get_passable().astype(np.bool_)
+        store.load_terrain(blueprint.dictTerrain, blueprint.cell_list)
+        return store
+
+    def load_terrain(self, dict_terrain: dict[str, dict[str, _Any]], cell_list: list[str]) -> None:
+        """Loads the terrain columns from a dictionary of terrain records keyed by designation. A `TerrainDict` is
+        loaded from its columns without building a record per cell."""
+        if hasattr(dict_terrain, 'columns'):
+            self._load_terrain_columns(dict_terrain.columns())
+            return
+        records = [dict_terrain[cell] for cell in cell_list]
+        self.terrain_id[:] = [self.intern_terrain(record['str']) for record in records]
+        self.terrain_int[:] = [record['int'] if record['int'] is not None else 0 for record in records]
+        self.terrain_raw[:] = [record['raw'] if record['raw'] is not None else np.nan for record in records]
+        self.terrain_color[:] = [_as_rgba(record['color']) for record in records]
+        self.terrain_char[:] = [record.get('char') or ' ' for record in records]
+        self.cost_in[:] = [record['cost_in'] for record in records]
+        self.cost_out[:] = [record['cost_out'] for record in records]
+
+    def _load_terrain_columns(self, columns: dict[str, _Any]) -> None:
+        terrain_ids = np.array([self.intern_terrain(name) for name in columns['names']], dtype=np.uint8)
+        self.terrain_id[:] = terrain_ids[columns['ids']]
+        self.terrain_int[:] = columns['int']
+        self.terrain_raw[:] = columns['raw']
+        self.terrain_color[:] = columns['color']
+        self.terrain_char[:] = columns['char']
+        self.cost_in[:] = columns['cost_in']
+        self.cost_out[:] = columns['cost_out']
+
+    def subscribe(self, observer: _Callable[[str, int], None]) -> None:
+        """Registers a callable that is called with the column name and cell index whenever the passability, a
+        movement cost or the terrain of a cell is set through the store."""
+        self._observers.append(observer)
+
+    def unsubscribe(self, observer: _Callable[[str, int], None]) -> None:
+        """Removes a callable registered with `subscribe`."""
+        self._observers.remove(observer)
+
+    def _notify(self, column: str, index: int) -> None:
+        for observer in self._observers:
+            observer(column, index)
+
+    def set_passable(self, index: int, passable: bool) -> None:
+        """Sets the passability of a cell."""
+        self.passable[index] = passable
+        self._notify('passable', index)
+
+    def set_cost_in(self, index: int, cost: float) -> None:
+        """Sets the cost to move into a cell."""
+        self.cost_in[index] = cost
+        self._notify('cost_in', index)
+
+    def set_cost_out(self, index: int, cost: float) -> None:
+        """Sets the cost to move out of a cell."""
+        self.cost_out[index] = cost
+        self._notify('cost_out', index)
+
+    def intern_terrain(self, terrain_str: _Optional[str]) -> int:
+        """Returns the terrain id for a terrain name, registering the name if it has not been seen before."""
+        terrain_id = self._terrain_ids.get(terrain_str)
+        if terrain_id is None:
+            terrain_id = len(self.terrain_names)
+            self.terrain_names.append(terrain_str)
+            self._terrain_ids[terrain_str] = terrain_id
+        return terrain_id
+
+    def get_terrain_id(self, terrain_str: _Optional[str]) -> _Optional[int]:
+        """Returns the terrain id for a terrain name, or None if no cell has ever had that terrain."""
+        return self._terrain_ids.get(terrain_str)
+
+    def get_terrain_str(self, index: int) -> _Optional[str]:
+        """Returns the terrain name of a cell."""
+        return self.terrain_names[self.terrain_id[index]]
+
+    def set_terrain_str(self, index: int, terrain_str: _Optional[str]) -> None:
+        """Sets the terrain name of a cell."""
+        self.terrain_id[index] = self.intern_terrain(terrain_str)
+        self._notify('terrain_id', index)
+
+    def get_terrain_raw(self, index: int) -> _Optional[float]:
+        """Returns the raw terrain value of a cell, or None if the cell has none."""
+        raw = float(self.terrain_raw[index])
+        return None if raw != raw else raw
+
+    def set_terrain_raw(self, index: int, raw: _Optional[float]) -> None:
+        """Sets the raw terrain value of a cell."""
+        self.terrain_raw[index] = np.nan if raw is None else raw
+
+    def get_terrain_color(self, index: int) -> _Optional[tuple[int, int, int, int]]:
+        """Returns the terrain colour of a cell as an RGBA tuple, or None if the cell has none."""
+        color = tuple(self.terrain_color[index].tolist())
+        return None if color == _NO_COLOR else color
+
+    def set_terrain_color(self, index: int, color: _Optional[tuple[int, ...]]) -> None:
+        """Sets the terrain colour of a cell."""
+        self.terrain_color[index] = _as_rgba(color)
+
+    def get_index(self, column: np.ndarray, index: int) -> _Optional[int]:
+        """Returns an index column entry (landmass, body of water) of a cell, or None if it is unset."""
+        value = int(column[index])
+        return None if value < 0 else value
+
+    def extra(self, index: int, name: str, default: _Any = None) -> _Any:
+        """Returns a sparse attribute of a cell."""
+        extras = self.extras.get(index)
+        return default if extras is None else extras.get(name, default)
+
+    def set_extra(self, index: int, name: str, value: _Any) -> None:
+        """Sets a sparse attribute of a cell."""
+        self.extras.setdefault(index, {})[name] = value
+
+
+def _as_rgba(color: _Optional[tuple[int, ...]]) -> tuple[int, int, int, int]:
+    if color is None:
+        return _NO_COLOR
+    color = tuple(color)
+    return color + (255,) * (4 - len(color))
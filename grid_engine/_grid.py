@@ -7,16 +7,46 @@ import pyglet as _pyglet
 from .__log__ import logger as _logger, log_method as _log_method
 
 from ._terraform import Terraformer
-from ._cell import Cell as _Cell
+from ._cell import Cell as _Cell, CellStore as _CellStore
 from ._blueprint import Blueprint as _Blueprint
+from ._pathfinding import (
+    PathEngine as _PathEngine,
+    PathCache as _PathCache,
+    HierarchicalPathfinder as _HierarchicalPathfinder,
+    JumpPointSearch as _JumpPointSearch,
+    FlowField as _FlowField,
+    Reachability as _Reachability,
+    PathResult as _PathResult,
+    FOUND as _FOUND,
+    UNREACHABLE as _UNREACHABLE,
+    COST_LIMIT as _COST_LIMIT,
+    solve_jobs as _solve_jobs
+)
+from ._spatial import (
+    label_components as _label_components,
+    component_labels as _component_labels,
+    component_members as _component_members,
+    coastal_mask as _coastal_mask,
+    BucketIndex as _BucketIndex,
+    CellPool as _CellPool,
+    rectangle_indices as _rectangle_indices,
+    disk_indices as _disk_indices,
+    polygon_indices as _polygon_indices,
+    perimeter_indices as _perimeter_indices,
+    indices_to_mask as _indices_to_mask,
+    Clearance as _Clearance,
+    OccupancyIndex as _OccupancyIndex,
+    SpatialHash as _SpatialHash
+)
 from ._utility import QuietDict as _QuietDict
 
 import pickle as _pickle
 import itertools as _itertools
-import heapq as _heapq
 import os as _os
 import math as _math
 
+import numpy as _np
+
 from pymunk import Vec2d as _Vec2d
 
 from abc import ABC as _ABC
@@ -26,6 +56,9 @@ from uuid import uuid4 as _uuid4
 from subprocess import call as _call
 
 from collections import deque as _deque
+from collections.abc import Mapping as _Mapping, Sequence as _Sequence
+
+from numbers import Integral as _Integral
 
 from random import choice as _choice
 
@@ -109,8 +142,293 @@ def load_grid(num: _Optional[int] = None, grid_id: _Optional[str] = None):
         return _pickle.load(f)
 
 
+class _CellItems(_Mapping):
+    """A read-only mapping of designation to cell for every cell in a grid."""
+
+    def __init__(self, cells: _Cells) -> None:
+        self._cells = cells
+
+    def __getitem__(self, designation: str) -> _Cell:
+        return self._cells[designation]
+
+    def __iter__(self):
+        return iter(self._cells)
+
+    def __len__(self) -> int:
+        return len(self._cells)
+
+    def values(self):
+        return self._cells.values()
+
+    def items(self):
+        return zip(self._cells, self._cells.values())
+
+
 class _Cells(_QuietDict):
-    pass
+    """All cells in the grid. No cell objects are held; every lookup returns a new `Cell` view onto the grid's
+    `CellStore`. Cells can be looked up by designation, by cell index or by an (x, y) tuple of column and row indices.
+    """
+
+    def __init__(self, grid: Grid) -> None:
+        self.grid = grid
+        self._row_count = grid.blueprint.row_count
+        self._col_count = grid.blueprint.col_count
+
+    @property
+    def items(self) -> _CellItems:
+        """A mapping of designation to cell."""
+        return _CellItems(self)
+
+    def __len__(self) -> int:
+        return self._row_count * self._col_count
+
+    def __getitem__(self, key: _Union[str, int, tuple[int, int], _Cell]) -> _Optional[_Cell]:
+        if isinstance(key, _Cell):
+            return key
+        elif isinstance(key, str):
+            return _Cell(self.index_of(key), self.grid)
+        elif isinstance(key, _Integral):
+            index = int(key) + len(self) if key < 0 else int(key)
+            if not 0 <= index < len(self):
+                raise IndexError(f'Cell index {key} out of range.')
+            return _Cell(index, self.grid)
+        elif isinstance(key, tuple):
+            x, y = key
+            if not (0 <= x < self._col_count and 0 <= y < self._row_count):
+                raise IndexError(f'Cell position {key} out of range.')
+            return _Cell(y * self._col_count + x, self.grid)
+        return None
+
+    def __setitem__(self, key, value):
+        raise TypeError('The cells of a grid are fixed by its blueprint.')
+
+    def __delitem__(self, key):
+        raise TypeError('The cells of a grid are fixed by its blueprint.')
+
+    def __iter__(self):
+        return iter(self.grid.blueprint.cell_list)
+
+    def __contains__(self, key) -> bool:
+        if isinstance(key, _Cell):
+            return key.parentgrid is self.grid
+        if isinstance(key, str):
+            try:
+                self.index_of(key)
+            except KeyError:
+                return False
+            return True
+        return isinstance(key, _Integral) and 0 <= key < len(self)
+
+    def __repr__(self):
+        return f"{self.__class__.__name__}({len(self)} items)"
+
+    def index_of(self, designation: str) -> int:
+        """Returns the cell index of a designation. Raises a KeyError if the designation is not on the grid."""
+        return self.grid.blueprint.dictGrid.index_of(designation)
+
+    def values(self):
+        """Returns an iterator over every cell in cell index order."""
+        grid = self.grid
+        return (_Cell(index, grid) for index in range(len(self)))
+
+
+class _CellSequence(_Sequence):
+    """A read-only sequence of cells backed by an array of cell indices. Cells are created on access, so a landmass or
+    body of water of any size only holds its indices."""
+
+    def __init__(self, grid: Grid, indices: _np.ndarray) -> None:
+        self.grid = grid
+        self._indices = indices
+
+    @property
+    def indices(self) -> _np.ndarray:
+        """The cell index of every cell in the sequence."""
+        return self._indices
+
+    def __getitem__(self, key: _Union[int, slice]) -> _Union[_Cell, _CellSequence]:
+        if isinstance(key, slice):
+            return _CellSequence(self.grid, self._indices[key])
+        return _Cell(int(self._indices[key]), self.grid)
+
+    def __len__(self) -> int:
+        return len(self._indices)
+
+    def __iter__(self):
+        grid = self.grid
+        return (_Cell(index, grid) for index in self._indices.tolist())
+
+    def __contains__(self, cell) -> bool:
+        if isinstance(cell, _Cell):
+            return cell.parentgrid is self.grid and bool((self._indices == cell.cell_index).any())
+        return False
+
+    def __repr__(self):
+        return f"{self.__class__.__name__}({len(self)} items)"
+
+
+class _GridLine(_CellSequence):
+    """A row or column of a grid. The cells of a line are evenly spaced in cell index order, so a line holds only its
+    first cell index, its stride and its length, and finding a cell or the position of a cell is arithmetic."""
+
+    def __init__(self, grid: Grid, line_index: int, start: int, step: int, count: int) -> None:
+        self.grid = grid
+        self.blueprint = grid.blueprint
+        self.line_index = line_index
+        self._start = start
+        self._step = step
+        self._count = count
+        self._line_indices = None
+
+    @property
+    def indices(self) -> _np.ndarray:
+        """The cell index of every cell in the line."""
+        if self._line_indices is None:
+            self._line_indices = _np.arange(self._start, self._start + self._step * self._count, self._step)
+        return self._line_indices
+
+    @property
+    def _indices(self) -> _np.ndarray:
+        return self.indices
+
+    def __getitem__(self, key: _Union[int, slice]) -> _Union[_Cell, _CellSequence]:
+        if isinstance(key, slice):
+            return _CellSequence(self.grid, self.indices[key])
+        position = int(key) + self._count if key < 0 else int(key)
+        if not 0 <= position < self._count:
+            raise IndexError(f'Cell position {key} out of range.')
+        return _Cell(self._start + self._step * position, self.grid)
+
+    def __len__(self) -> int:
+        return self._count
+
+    def __iter__(self):
+        grid = self.grid
+        return (_Cell(index, grid) for index in range(self._start, self._start + self._step * self._count, self._step))
+
+    def __contains__(self, cell) -> bool:
+        return isinstance(cell, _Cell) and cell.parentgrid is self.grid and self._position(cell.cell_index) is not None
+
+    def __repr__(self):
+        return f"{self.__class__.__name__}({self.line_index}, {self._count} cells)"
+
+    def _position(self, cell_index: int) -> _Optional[int]:
+        position, offset = divmod(cell_index - self._start, self._step)
+        return position if offset == 0 and 0 <= position < self._count else None
+
+    def index(self, cell: _Cell, *args) -> int:
+        """Returns the position of a cell in the line. Raises a ValueError if the cell is not in the line."""
+        position = self._position(cell.cell_index) if isinstance(cell, _Cell) and cell.parentgrid is self.grid else None
+        if position is None:
+            raise ValueError(f'{cell} is not in {self}')
+        return position
+
+
+class _Row(_GridLine):
+    """A row of a grid."""
+
+    @property
+    def row_index(self) -> int:
+        """The index of the row."""
+        return self.line_index
+
+    @property
+    def height(self) -> float:
+        """The y coordinate of the row."""
+        return self.line_index * self.grid.cell_size
+
+
+class _Column(_GridLine):
+    """A column of a grid."""
+
+    @property
+    def col_index(self) -> int:
+        """The index of the column."""
+        return self.line_index
+
+    @property
+    def width(self) -> float:
+        """The x coordinate of the column."""
+        return self.line_index * self.grid.cell_size
+
+
+class _GridLines(_Sequence):
+    """The rows or the columns of a grid. Each line is created on first access, and can be looked up by index, e.g.
+    `grid.rows[0]`, or by name as an attribute, e.g. `grid.rows.rowa` or `grid.cols.col00001`."""
+
+    def __init__(self, grid: Grid, prefix: str, names: list[str]) -> None:
+        self.grid = grid
+        self._prefix = prefix
+        self._names = names
+        self._lookup = None
+        self._lines = [None] * len(names)
+
+    def __getitem__(self, key: _Union[int, slice]) -> _Union[_GridLine, list[_GridLine]]:
+        if isinstance(key, slice):
+            return [self[index] for index in range(*key.indices(len(self)))]
+        index = int(key) + len(self) if key < 0 else int(key)
+        line = self._lines[index]
+        if line is None:
+            row_count, col_count = self.grid.blueprint.row_count, self.grid.blueprint.col_count
+            if self._prefix == 'row':
+                line = _Row(self.grid, index, index * col_count, 1, col_count)
+            else:
+                line = _Column(self.grid, index, index, col_count, row_count)
+            self._lines[index] = line
+        return line
+
+    def __len__(self) -> int:
+        return len(self._names)
+
+    def __getattr__(self, name: str) -> _GridLine:
+        prefix = self.__dict__.get('_prefix')
+        if prefix is None or not name.startswith(prefix):
+            raise AttributeError(name)
+        index = self.index_of(name[len(prefix):])
+        if index is None:
+            raise AttributeError(name)
+        return self[index]
+
+    def __repr__(self):
+        return f"{self.__class__.__name__}({len(self)} {self._prefix}s)"
+
+    def index_of(self, name: str) -> _Optional[int]:
+        """Returns the index of a line by its name, or None if there is no line of that name."""
+        if self._lookup is None:
+            self._lookup = {line_name: index for index, line_name in enumerate(self._names)}
+        return self._lookup.get(name)
+
+    def index(self, line: _GridLine, *args) -> int:
+        """Returns the index of a line of the grid."""
+        if isinstance(line, _GridLine) and line.grid is self.grid and self[line.line_index] is line:
+            return line.line_index
+        raise ValueError(f'{line} is not in {self}')
+
+
+class _Quadrant(_QuietDict):
+    """A quadrant of a grid, holding the number of cells in the quadrant, their designations and their cell indices.
+    """
+
+    def __init__(self, quadrant_index: int, info: dict) -> None:
+        super().__init__()
+        self.quadrant_index = quadrant_index
+        self.update(info)
+
+    def __int__(self) -> int:
+        return self.quadrant_index
+
+    @property
+    def indices(self) -> _np.ndarray:
+        """The cell index of every cell in the quadrant."""
+        return self['indices']
+
+
+class _Quadrants(list):
+    """The quadrants of a grid, which can be looked up by index or as an attribute, e.g. `grid.quadrants.quad0`."""
+
+    def __getattr__(self, name: str) -> _Quadrant:
+        if name.startswith('quad') and name[4:].isdigit() and int(name[4:]) < len(self):
+            return self[int(name[4:])]
+        raise AttributeError(name)
 
 
 class _AbstractGrid(_QuietDict, _ABC):
@@ -119,10 +437,26 @@ class _AbstractGrid(_QuietDict, _ABC):
     _with_terrain = None
     _blueprint = None
     _terraformer = None
+    _path_engine = None
+    _path_cache = None
+    _path_hierarchy = None
+    _jump_point_search = None
+    _reachability = None
+    _terrain_index = None
+    _object_index = None
+    _unit_index = None
+    _occupancy = None
+    _entity_hash = None
+    entity_bucket_size = 8
+    _cell_pools = None
+    _clearance = None
+    rng = _random
+    path_expansions = 0
     _grid_plan = None
     _init_cell_size = None
     _cell_size = None
     _cells = None
+    _store = None
     _rows = None
     _cols = None
     _quadrants = None
@@ -141,7 +475,7 @@ class _AbstractGrid(_QuietDict, _ABC):
             noise_octaves=None,
             noise_roughness=None
     ) -> None:
-        super(_AbstractGrid, self).__init__()
+        pass
 
     @property
     def grid_id(self) -> str:
@@ -171,20 +505,135 @@ class _AbstractGrid(_QuietDict, _ABC):
         if blueprint is not None:
             self._blueprint = blueprint
 
+    @property
+    def path_engine(self) -> _PathEngine:
+        """The pathfinding engine of the grid. It is created on first use."""
+        if self._path_engine is None:
+            self._path_engine = _PathEngine(self.blueprint.neighbors, self.blueprint.col_count, self.store)
+        return self._path_engine
+
+    @property
+    def path_cache(self) -> _PathCache:
+        """The cache of path search results used by `get_path`. It is created on first use."""
+        if self._path_cache is None:
+            self._path_cache = _PathCache(self.path_engine)
+        return self._path_cache
+
+    @property
+    def path_hierarchy(self) -> _HierarchicalPathfinder:
+        """The hierarchical pathfinder used by `get_path` for hierarchical queries. It is created on first use with
+        clusters of 16 by 16 cells."""
+        if self._path_hierarchy is None:
+            self._path_hierarchy = _HierarchicalPathfinder(
+                    self.path_engine, self.blueprint.row_count, self.blueprint.col_count
+            )
+        return self._path_hierarchy
+
+    @path_hierarchy.setter
+    def path_hierarchy(self, path_hierarchy: _Optional[_HierarchicalPathfinder] = None) -> None:
+        self._path_hierarchy = path_hierarchy
+
+    @property
+    def jump_point_search(self) -> _JumpPointSearch:
+        """The Jump Point Search used by `get_path` for 'jps' queries. It is created on first use."""
+        if self._jump_point_search is None:
+            self._jump_point_search = _JumpPointSearch(
+                    self.path_engine, self.blueprint.row_count, self.blueprint.col_count
+            )
+        return self._jump_point_search
+
+    @property
+    def reachability(self) -> _Reachability:
+        """The connected groups of passable cells used by `get_path` to answer unreachable queries without searching.
+        It is created on first use, from the landmass labels of the grid when they are up to date."""
+        if self._reachability is None:
+            self._reachability = _Reachability(self.path_engine, getattr(self, 'landmass_labels', None))
+        return self._reachability
+
+    @property
+    def terrain_index(self) -> _BucketIndex:
+        """The spatial index of cells by terrain name. It is built on first use and follows terrain changes made
+        through the cells."""
+        if self._terrain_index is None:
+            index = _BucketIndex(self.blueprint.row_count, self.blueprint.col_count)
+            terrain_id = self.store.terrain_id
+            order = _np.argsort(terrain_id, kind='stable')
+            ids, starts = _np.unique(terrain_id[order], return_index=True)
+            for terrain, cells in zip(ids.tolist(), _np.split(order, starts[1:])):
+                index.add_many(self.store.terrain_names[terrain], cells)
+            self._indexed_terrain = terrain_id.copy()
+            self._terrain_index = index
+            self.store.subscribe(self._on_terrain_change)
+        return self._terrain_index
+
+    def _on_terrain_change(self, column: str, index: int) -> None:
+        if column != 'terrain_id' or self._terrain_index is None:
+            return
+        old, new = int(self._indexed_terrain[index]), int(self.store.terrain_id[index])
+        if old != new:
+            terrain_names = self.store.terrain_names
+            self._terrain_index.remove(terrain_names[old], index)
+            self._terrain_index.add(terrain_names[new], index)
+            self._indexed_terrain[index] = new
+
+    @property
+    def clearance(self) -> _Clearance:
+        """The number of consecutive passable cells from every cell in each of the four directions, read by the
+        clearance properties of the cells. It is built on first use and follows passability changes made through the
+        cells."""
+        if self._clearance is None:
+            self._clearance = _Clearance(self.blueprint.row_count, self.blueprint.col_count, self.store.passable)
+            self.store.subscribe(self._on_clearance_change)
+        return self._clearance
+
+    def _on_clearance_change(self, column: str, index: int) -> None:
+        if column == 'passable' and self._clearance is not None:
+            self._clearance.update(index, self.store.passable)
+
+    @property
+    def object_index(self) -> _BucketIndex:
+        """The spatial index of cells by the type of the objects on them ('items', 'structures', ...), kept up to date
+        by `Cell.add_object` and `Cell.remove_object`."""
+        if self._object_index is None:
+            self._object_index = _BucketIndex(self.blueprint.row_count, self.blueprint.col_count)
+        return self._object_index
+
+    @property
+    def unit_index(self) -> _BucketIndex:
+        """The spatial index of cells by the type of the units on them, kept up to date by `Cell.add_unit` and
+        `Cell.remove_unit`."""
+        if self._unit_index is None:
+            self._unit_index = _BucketIndex(self.blueprint.row_count, self.blueprint.col_count)
+        return self._unit_index
+
+    @property
+    def occupancy(self) -> _OccupancyIndex:
+        """The sparse index of the objects and units on the cells of the grid, by cell and by entity, kept up to date
+        by `Cell.add_object`, `Cell.remove_object`, `Cell.add_unit` and `Cell.remove_unit`. Entities are held under
+        their type ('items', 'structures', 'players', ...)."""
+        if self._occupancy is None:
+            self._occupancy = _OccupancyIndex(len(self.cells))
+        return self._occupancy
+
+    @property
+    def entity_hash(self) -> _SpatialHash:
+        """The spatial hash of the entities occupying cells, bucketed into blocks of `entity_bucket_size` cells, for
+        proximity queries on moving units. It is kept up to date by `Cell.on_occupy` and `Cell.on_vacate`; batched
+        moves can be applied with `entity_hash.move_many`."""
+        if self._entity_hash is None:
+            self._entity_hash = _SpatialHash(self.blueprint.row_count, self.blueprint.col_count, self.entity_bucket_size)
+        return self._entity_hash
+
     @property
     def terraformer(self) -> type[Terraformer]:
         """The terraformer of the grid."""
         return self._terraformer
 
     @property
-    def grid_array(self):
-        """The grid array of the grid."""
+    def grid_array(self) -> list:
+        """The layers of the grid, from the terrain layer to the fog of war layer. Provided by the blueprint."""
         return self.blueprint.array
 
-    @grid_array.setter
-    def grid_array(self, grid_array):
-        self.blueprint.array = grid_array
-
     @property
     def grid_plan(self) -> _Optional[dict[str, dict[str, _Any]]]:
         """The dictionary of grid data for the grid. Provided by the blueprint."""
@@ -201,8 +650,14 @@ class _AbstractGrid(_QuietDict, _ABC):
 
     @dictTerrain.setter
     def dictTerrain(self, dictTerrain: _Optional[dict[str, dict[str, _Any]]] = None) -> None:
-        for cell in self.cells.values():
-            cell.entry_terrain = self.grid_array[cell.col_index, cell.row_index, 0]
+        self.blueprint.dictTerrain = dictTerrain
+        self.store.load_terrain(dictTerrain, self.blueprint.cell_list)
+        if self._path_engine is not None:
+            self._path_engine.rebuild()
+        if self._terrain_index is not None:
+            self.store.unsubscribe(self._on_terrain_change)
+            self._terrain_index = None
+        self._drop_cell_pools('terrain')
 
     @property
     def dictObject(self) -> _Optional[dict[str, dict[str, _Any]]]:
@@ -211,8 +666,7 @@ class _AbstractGrid(_QuietDict, _ABC):
 
     @dictObject.setter
     def dictObject(self, dictObject: _Optional[dict[str, dict[str, _Any]]] = None) -> None:
-        for cell in self.cells.values():
-            cell.entry_object = self.grid_array[cell.col_index, cell.row_index, 1]
+        self.blueprint.dictObject = dictObject
 
     @property
     def dictUnit(self) -> _Optional[dict[str, dict[str, _Any]]]:
@@ -221,8 +675,7 @@ class _AbstractGrid(_QuietDict, _ABC):
 
     @dictUnit.setter
     def dictUnit(self, dictUnit: _Optional[dict[str, dict[str, _Any]]] = None) -> None:
-        for cell in self.cells.values():
-            cell.entry_unit = self.grid_array[cell.col_index, cell.row_index, 2]
+        self.blueprint.dictUnit = dictUnit
 
     @property
     def dictZone(self) -> _Optional[dict[str, dict[str, _Any]]]:
@@ -231,8 +684,7 @@ class _AbstractGrid(_QuietDict, _ABC):
 
     @dictZone.setter
     def dictZone(self, dictZone: _Optional[dict[str, dict[str, _Any]]] = None) -> None:
-        for cell in self.cells.values():
-            cell.entry_zone = self.grid_array[cell.col_index, cell.row_index, 3]
+        self.blueprint.dictZone = dictZone
 
     @property
     def dictEffect(self) -> _Optional[dict[str, dict[str, _Any]]]:
@@ -241,8 +693,7 @@ class _AbstractGrid(_QuietDict, _ABC):
 
     @dictEffect.setter
     def dictEffect(self, dictEffect: _Optional[dict[str, dict[str, _Any]]] = None) -> None:
-        for cell in self.cells.values():
-            cell.entry_effect = self.grid_array[cell.col_index, cell.row_index, 4]
+        self.blueprint.dictEffect = dictEffect
 
     @property
     def dictFow(self) -> _Optional[dict[str, dict[str, _Any]]]:
@@ -251,8 +702,7 @@ class _AbstractGrid(_QuietDict, _ABC):
 
     @dictFow.setter
     def dictFow(self, dictFow: _Optional[dict[str, dict[str, _Any]]] = None) -> None:
-        for cell in self.cells.values():
-            cell.entry_fow = self.grid_array[cell.col_index, cell.row_index, 5]
+        self.blueprint.dictFow = dictFow
 
     @property
     def init_cell_size(self):
@@ -274,8 +724,8 @@ class _AbstractGrid(_QuietDict, _ABC):
 
     @property
     def cells(self) -> type[_Cells]:
-        """A subclass of QuietDict representing all cells in the grid. Keys are cell designations, values are _Cell
-        objects."""
+        """A subclass of QuietDict representing all cells in the grid. Keys are cell designations or cell indices,
+        values are _Cell views onto the grid's store."""
         return self._cells
 
     @cells.setter
@@ -283,13 +733,23 @@ class _AbstractGrid(_QuietDict, _ABC):
         self._cells = cells
 
     @property
-    def rows(self) -> list[list[_Cell,]]:
-        """A dynamically generated list of all rows in the grid. The list contains Row objects, which are dynamically
-        generated lists of _Cell objects."""
+    def store(self) -> _Optional[_CellStore]:
+        """The columnar store holding the data of every cell in the grid."""
+        return self._store
+
+    @property
+    def items(self) -> _CellItems:
+        """A mapping of designation to cell for every cell in the grid."""
+        return self.cells.items
+
+    @property
+    def rows(self) -> _GridLines:
+        """All rows in the grid, in order. Each row is a view onto the cell indices of the row, and can also be looked
+        up by name, e.g. `grid.rows.rowa`."""
         return self._rows
 
     @rows.setter
-    def rows(self, rows: _Optional[list[list[_Cell,]]] = None) -> None:
+    def rows(self, rows: _Optional[_GridLines] = None) -> None:
         self._rows = rows
 
     @rows.deleter
@@ -297,13 +757,13 @@ class _AbstractGrid(_QuietDict, _ABC):
         del self._rows
 
     @property
-    def cols(self) -> list[list[_Cell,]]:
-        """A dynamically generated list of all columns in the grid. The list contains Column objects, which are
-        dynamically generated lists of _Cell objects."""
+    def cols(self) -> _GridLines:
+        """All columns in the grid, in order. Each column is a view onto the cell indices of the column, and can also
+        be looked up by name, e.g. `grid.cols.col00001`."""
         return self._cols
 
     @cols.setter
-    def cols(self, cols: _Optional[list[list[_Cell,]]] = None) -> None:
+    def cols(self, cols: _Optional[_GridLines] = None) -> None:
         self._cols = cols
 
     @cols.deleter
@@ -311,17 +771,18 @@ class _AbstractGrid(_QuietDict, _ABC):
         del self._cols
 
     @property
-    def quadrants(self) -> list[type[_QuietDict]]:
-        """A dynamically generated list of all quadrants in the grid. The list contains Quadrant objects, which are
-        subclasses of QuietDict. The quadrant data can be accessed by quadrant number, e.g. `grid.quadrants.quad0`.
+    def quadrants(self) -> _Quadrants:
+        """A list of all quadrants in the grid. The quadrant data can be accessed by quadrant number, e.g.
+        `grid.quadrants.quad0`.
 
         grid.quadrants.quad0['cell_count']/[0] returns the number of cells in the quadrant.
         grid.quadrants.quad0['cells']/[1] returns a list of all cells in the quadrant.
+        grid.quadrants.quad0.indices returns the cell indices of the cells in the quadrant.
         """
         return self._quadrants
 
     @quadrants.setter
-    def quadrants(self, quadrants: _Optional[list[type[_QuietDict]]] = None) -> None:
+    def quadrants(self, quadrants: _Optional[_Quadrants] = None) -> None:
         self._quadrants = quadrants
 
     @quadrants.deleter
@@ -389,10 +850,19 @@ class _AbstractGrid(_QuietDict, _ABC):
         self._selection = value
 
     def __getitem__(self, key: int | str | tuple[int, int] = None):
-        if super().__getitem__(key) is None and isinstance(key, tuple):
-            return self.cols[key[0]][key[1]]
-        else:
-            return super().__getitem__(key)
+        return self.cells[key]
+
+    def __len__(self):
+        return len(self.cells)
+
+    def __iter__(self):
+        return iter(self.cells)
+
+    def __contains__(self, key):
+        return key in self.cells
+
+    def values(self):
+        return self.cells.values()
 
 
 class Grid(_AbstractGrid, _ABC):
@@ -406,7 +876,9 @@ class Grid(_AbstractGrid, _ABC):
             with_terrain: _Optional[bool] = None,
             noise_scale: _Optional[float] = None,
             noise_octaves: _Optional[int] = None,
-            noise_roughness: _Optional[float] = None
+            noise_roughness: _Optional[float] = None,
+            noise_workers: _Optional[int] = None,
+            noise_seed: _Optional[int] = None
     ):
         """
         Initializes the grid object. If no blueprint is provided, a terrain grid blueprint is generated.
@@ -420,6 +892,9 @@ class Grid(_AbstractGrid, _ABC):
             noise_scale (_Optional[float], optional): The scale of the Perlin noise. Defaults to None.
             noise_octaves (_Optional[int],optional): The number of octaves for the Perlin noise. Defaults to None.
             noise_roughness (_Optional[float],optional): The roughness of the Perlin noise. Defaults to None.
+            noise_workers (_Optional[int],optional): The number of processes used to generate the Perlin noise.
+        Defaults to None.
+            noise_seed (_Optional[int],optional): The seed of the terrain heightmap. Defaults to None.
         """
         if gblueprint is not None:
             x, y = gblueprint.grid_dimensions
@@ -442,7 +917,9 @@ class Grid(_AbstractGrid, _ABC):
                     self.grid_id,
                     noise_scale,
                     noise_octaves,
-                    noise_roughness
+                    noise_roughness,
+                    noise_workers,
+                    noise_seed
             ) if self._with_terrain else _Blueprint.BaseGridBlueprint(
                     cell_size,
                     dimensions,
@@ -452,20 +929,10 @@ class Grid(_AbstractGrid, _ABC):
         super(Grid, self).__init__()
         self._init_cell_size = cell_size if cell_size is not None else self.blueprint._cell_size
         self.cell_size = cell_size if cell_size is not None else self.blueprint._cell_size
-        self.cells = _Cells()
-        for i, cell in enumerate(self.grid_plan.keys()):
-            print(f'Creating cells         {round((i / len(self.grid_plan)) * 100)}%', end='\r')
-            self.cells[cell] = _Cell(cell, parentgrid=self)
-            self.update({cell: self.cells[cell]})
+        print('Creating cells ...')
+        self._store = _CellStore.from_blueprint(self.blueprint)
+        self.cells = _Cells(self)
         print(f'Created cells          100%')
-        self.dictTerrain = self.blueprint.dictTerrain
-        self.dictObject = self.blueprint.dictObject
-        self.dictUnit = self.blueprint.dictUnit
-        self.dictZone = self.blueprint.dictZone
-        self.dictEffect = self.blueprint.dictEffect
-        self.dictFow = self.blueprint.dictFow
-        for cell in self.cells.items.values():
-            cell.init_array()
         self.rows = None
         self.cols = None
         self.quadrants = None
@@ -476,10 +943,6 @@ class Grid(_AbstractGrid, _ABC):
         self._last_row = None
         self._get_first_last()
         self.selection = None
-        for row in self.rows:
-            row.row_index = self.rows.index(row)
-        for col in self.cols:
-            col.col_index = self.cols.index(col)
         if self.with_terrain:
             self.landmasses, self.islands = self._find_landmasses()
             self.landmass_count = len(self.landmasses)
@@ -538,82 +1001,40 @@ class Grid(_AbstractGrid, _ABC):
         self._set_up_rank()
         self._set_up_file()
         self._set_up_quadrants()
-        self._set_up_cells()
 
     def _set_up_rank(self):
-        """Sets up the rank attribute. A `rows` attribute is assigned a type value, with a base of type[list]. The
-        `rows` attribute is then instantiated. The `rows` attribute is then assigned an attribute for each row in the
-        grid, with a base of type[list]. Each row attribute is then instantiated. Finally, each row attribute is
-        appended to the `rows` object.
-        
-        Effectively, this creates a list of lists, with each list representing a row in the grid. But, each row is
-        accessible by attribute.
-        
+        """Sets up the rows of the grid. Each row is a view onto the cell indices of the row, created on first access,
+        so setting up the rows costs nothing per cell.
+
         Example:
             ```grid.rows.rowa``` returns the first row in the grid.
             ```grid.rows[0]``` returns the first row in the grid.
         """
-        setattr(self, 'rows', type('rows', (list,), {'blueprint': self.blueprint}))
-        exec('self.rows = self.rows()')
-        for height, row in enumerate(self.blueprint._rank):
-            setattr(
-                self.rows, f'row{row}',
-                type('Row', (list,), {'blueprint': self.blueprint, 'height': height * self.cell_size})
-                )
-            exec(f'self.rows.row{row} = self.rows.row{row}()')
-            exec(f'self.rows.append(self.rows.row{row})')
+        self.rows = _GridLines(self, 'row', self.blueprint.rank)
 
     def _set_up_file(self):
-        """Sets up the file attribute. A `cols` attribute is assigned a type value, with a base of type[list]. The
-        `cols` attribute is then instantiated. The `cols` attribute is then assigned an attribute for each column in
-        the grid, with a base of type[list]. Each column attribute is then instantiated. Finally, each col attribute
-        is appended to the `cols` object.
-        
-        Effectively, this creates a list of lists, with each list representing a column in the grid. But, each column
-        is accessible by attribute.
-        
+        """Sets up the columns of the grid. Each column is a view onto the cell indices of the column, created on
+        first access, so setting up the columns costs nothing per cell.
+
         Example:
             ```grid.cols.col00001``` returns the first column in the grid
             ```grid.cols[0] returns the first column in the grid
-            """
-        setattr(self, 'cols', type('cols', (list,), {'blueprint': self.blueprint}))
-        exec('self.cols = self.cols()')
-        for width, col in enumerate(self.blueprint._file):
-            setattr(
-                self.cols, f'col{col}',
-                type('Column', (list,), {'blueprint': self.blueprint, 'width': width * self.cell_size})
-                )
-            exec(f'self.cols.col{col} = self.cols.col{col}()')
-            exec(f'self.cols.append(self.cols.col{col})')
-
-    def _set_up_cells(self):
-        """Append each cell to its row and column created in `_set_up_rank` and `_set_up_file` respectively."""
-        for d, c in self.cells.items.items():
-            getattr(self.rows, f'row{d[:-5]}').append(c)
-            getattr(self.cols, f'col{d[-5:]}').append(c)
+        """
+        self.cols = _GridLines(self, 'col', self.blueprint.file)
 
     def _set_up_quadrants(self):
-        """Sets up the quadrants attribute. A `quadrants` attribute is assigned a type value, with a base of type[
-        list]. The `quadrants` attribute is then instantiated. The `quadrants` attribute is then assigned an
-        attribute for each quadrant in the grid, with a base of type[QuietDict]. Each quadrant attribute is then
-        instantiated. Each quadrant attribute is appended to the `quadrants` object. Finally, each quadrant attribute
-        is updated with the quadrant data from the blueprint.
-        
+        """Sets up the quadrants of the grid from the quadrant data of the blueprint.
+
         Example:
             ```grid.quadrants.quad0``` returns the first quadrant in the grid.
             ```grid.quadrants.quad0['cell_count']``` returns the number of cells in the first quadrant.
             ```grid.quadrants.quad0['cells']``` returns a list of all cells in the first quadrant.
         """
-        setattr(self, 'quadrants', type('quadrants', (list,), {}))
-        exec('self.quadrants = self.quadrants()')
+        self.quadrants = _Quadrants()
         for quadrant, info in self.blueprint.quadrants.items():
-            setattr(
-                self.quadrants, f'quad{quadrant}',
-                type('Quadrant', (_QuietDict,), {'__int__': lambda self: int(quadrant)})
-                )
-            exec(f'self.quadrants.quad{quadrant} = self.quadrants.quad{quadrant}()')
-            exec(f'self.quadrants.append(self.quadrants.quad{quadrant})')
-            exec(f'self.quadrants.quad{quadrant}.update({info})')
+            if 'indices' not in info:
+                info = dict(info, indices=_np.array([self.cells.index_of(cell) for cell in info['cells']], dtype=_np.int64))
+            self.quadrants.append(_Quadrant(int(quadrant), info))
 
     @_log_method
     def get_cell(self, cell_designation: _Optional[str] = None) -> _Optional[_Cell]:
@@ -627,10 +1048,18 @@ class Grid(_AbstractGrid, _ABC):
     def get_cell_by_index(self, index: _Optional[int] = None) -> _Optional[_Cell]:
         """Returns a cell object by its index in the cell list."""
         try:
-            return self.cells[self.blueprint._cell_list[index]]
-        except KeyError:
+            return self.cells[index]
+        except IndexError:
             return None
 
+    def get_cell_index(self, cell: _Union[int, str, _Cell]) -> int:
+        """Returns the cell index of a cell given by its cell index, designation or _Cell object."""
+        if isinstance(cell, _Cell):
+            return cell.cell_index
+        elif isinstance(cell, str):
+            return self.cells.index_of(cell)
+        return int(cell)
+
     @_log_method
     def get_cell_by_relative_indices(
             self,
@@ -655,7 +1084,7 @@ class Grid(_AbstractGrid, _ABC):
         r, f = (ref + ind).int_tuple
         r, f = max(0, r), max(0, f)
         r, f = min(r, self.blueprint.row_count - 1), min(f, self.blueprint.col_count - 1)
-        return self.grid_array[r, f, 0]['designation']
+        return self.cells[r * self.blueprint.col_count + f].designation
 
     @_log_method
     def get_nearest_cell_with(
@@ -676,7 +1105,9 @@ class Grid(_AbstractGrid, _ABC):
             qualifications (dict, optional): The qualifications for the entry. Defaults to None.
             
         Returns:
-            _Cell: The nearest cell with the specified attribute value.
+            _Cell: The nearest cell with the specified attribute value, or None if no cell has it. Queries on
+            'terrain_str' and 'any' object or unit queries are answered from `terrain_index`, `object_index` and
+            `unit_index` by searching outwards from the reference cell; other queries scan every cell.
             
         Example:
             ```grid.get_nearest_cell_with('a00001', 'passable', True)``` returns the nearest passable cell to cell
@@ -725,44 +1156,106 @@ class Grid(_AbstractGrid, _ABC):
                     return True
             return False
 
-        count = 0
-        nearest = {'cell': None, 'distance': None}
-        for cellb in self.cells.values():
-            if not count:
-                nearest['cell'] = [cellb]
-                nearest['distance'] = self.get_distance(cella, cellb.designation)
-                count += 1
-                continue
-            elif not qualifications and not by_entry:
+        cella = self.get_cell_index(cella)
+        keys, index = self._nearest_index_keys(attr_name, val, by_entry, qualifications)
+        if index is not None:
+            nearest = index.nearest_ties(cella, keys)
+            return self.cells[_choice(nearest)] if nearest else None
+        nearest = {'cell': [], 'distance': float('inf')}
+        for cellb in self._nearest_candidates(by_entry, qualifications):
+            if not qualifications and not by_entry:
                 if getattr(cellb, attr_name) == val:
-                    distance = self.get_distance(cella, cellb.designation)
+                    distance = self.get_distance(cella, cellb.cell_index)
                     nearest = check_nearest(nearest, cellb, distance)
             elif by_entry and qualifications:
-                entries = list(qualifications.keys())
-                qualifiers = list(qualifications.values())
                 if check_qualifications(qualifications, cellb):
-                    distance = self.get_distance(cella, cellb.designation)
+                    distance = self.get_distance(cella, cellb.cell_index)
                     nearest = check_nearest(nearest, cellb, distance)
-                else:
-                    continue
+        if not nearest['cell']:
+            return None
         if len(nearest['cell']) == 1:
             return nearest['cell'][0]
         else:
             return _choice(nearest['cell'])
 
+    def _nearest_candidates(self, by_entry: bool, qualifications: _Optional[dict]):
+        """Returns the cells a scanning `get_nearest_cell_with` query has to check: only the cells holding objects or
+        units when every qualification is on the object or unit entries, and every cell otherwise."""
+        if not (by_entry and qualifications) or not set(qualifications) <= {'object', 'unit'}:
+            return self.cells.values()
+        kinds = [kind for entry in qualifications for kind in self.blueprint.layer_attributes[entry]]
+        return (self.cells[cell_index] for cell_index in self.occupancy.cells(kinds).tolist())
+
+    def _nearest_index_keys(
+            self,
+            attr_name: _Optional[str],
+            val: _Any,
+            by_entry: bool,
+            qualifications: _Optional[dict]
+    ) -> tuple[list, _Optional[_BucketIndex]]:
+        """Returns the spatial index and its keys that answer a `get_nearest_cell_with` query, or an empty list and
+        None if the query needs a scan."""
+        if not by_entry and attr_name == 'terrain_str':
+            return [val], self.terrain_index
+        if by_entry and qualifications and len(qualifications) == 1:
+            (entry, qualifier), = qualifications.items()
+            if qualifier == 'any' and entry in ('object', 'unit'):
+                index = self.object_index if entry == 'object' else self.unit_index
+                return index.keys(), index
+        return [], None
+
+    def get_nearest_cells(
+            self,
+            cella: _Union[int, str, _Cell],
+            layer: str,
+            category: _Optional[str] = None,
+            k: int = 1,
+            max_distance: _Optional[float] = None
+    ) -> list[_Cell]:
+        """
+        Returns the cells nearest to a cell that have a terrain, or hold objects or units of a type, from the spatial
+        indexes of the grid.
+
+        Args:
+            cella: The cell to measure from.
+            layer (str): 'terrain', 'object' or 'unit'.
+            category (Optional[str]): The terrain name, or the object or unit type ('items', 'structures', 'players',
+                ...). Defaults to None, which matches objects or units of any type; a terrain must be given.
+            k (int): The number of cells to return. Defaults to 1.
+            max_distance (Optional[float]): The furthest distance, in cells, to look. Defaults to None.
+
+        Returns:
+            list[_Cell]: Up to `k` cells, nearest first.
+
+        Example:
+            ```python
+            wells = grid.get_nearest_cells('a00001', 'object', 'structures', k=3)
+            print([cell.designation for cell in wells])
+            # Output: ['a00004', 'c00002', 'f00007']
+            ```
+        """
+        if layer == 'terrain':
+            index, keys = self.terrain_index, [category]
+        elif layer in ('object', 'unit'):
+            index = self.object_index if layer == 'object' else self.unit_index
+            keys = index.keys() if category is None else [category]
+        else:
+            raise ValueError(f'Unknown layer: {layer}')
+        cell_indices = index.nearest(self.get_cell_index(cella), keys, k, max_distance)
+        return [self.cells[cell_index] for cell_index in cell_indices]
+
     @_log_method
     def get_row_by_index(self, index: _Optional[int] = None) -> _Optional[list[_Cell,]]:
         """Returns a row by its index in the row list."""
-        return self.blueprint.rank[index]
+        return self.rows[index]
 
     @_log_method
     def get_row_by_height(self, height: _Optional[int] = None) -> _Optional[list[_Cell,]]:
-        """Returns a row by its height(y coordinate)."""
-        if self.cell_size == 1:
-            return height
-        for i in range(len(self.rows)):
-            if self.rows[i].height <= height < self.rows[i + 1].height:
-                return self.get_row_by_index(i)
+        """Returns a row by its height(y coordinate), or None if the height is outside the grid."""
+        row_index = int(height // self.cell_size)
+        if 0 <= row_index < self.blueprint.row_count:
+            return self.get_row_by_index(row_index)
+        return None
 
     @_log_method
     def get_row_by_name(self, row_name: _Optional[str] = None) -> _Optional[list[_Cell,]]:
@@ -772,28 +1265,61 @@ class Grid(_AbstractGrid, _ABC):
     @_log_method
     def get_col_by_index(self, index: _Optional[int] = None) -> _Optional[list[_Cell,]]:
         """Returns a column by its index in the column list."""
-        return self.blueprint.file[index]
+        return self.cols[index]
 
     @_log_method
     def get_col_by_width(self, width: _Optional[int] = None) -> _Optional[list[_Cell,]]:
-        """Returns a column by its width(x coordinate)."""
-        if self.cell_size == 1:
-            return width
-        for i in range(len(self.cols)):
-            if i == len(self.cols) - 1 or self.cols[i].width <= width < self.cols[i + 1].width:
-                return self.get_col_by_index(i)
+        """Returns a column by its width(x coordinate), or None if the width is outside the grid."""
+        col_index = int(width // self.cell_size)
+        if 0 <= col_index < self.blueprint.col_count:
+            return self.get_col_by_index(col_index)
+        return None
 
     @_log_method
     def get_col_by_name(self, col_name: _Optional[str] = None) -> _Optional[list[_Cell,]]:
         """Returns a column by its name."""
         return getattr(self.cols, f'col{col_name}')
 
-    @_log_method
     def get_cell_by_position(self, x: _Optional[int], y: _Optional[int]) -> _Optional[_Cell]:
-        """Returns a cell by its position on the grid."""
-        r = self.get_row_by_height(y)
-        f = self.get_col_by_width(x)
-        return self.get_cell(f'{r}{f}')
+        """Returns the cell containing a position on the grid, or None if the position is outside the grid. The cell
+        is found by dividing the position by the cell size, without scanning the rows or columns."""
+        cell_index = self.get_cell_index_by_position(x, y)
+        return None if cell_index < 0 else self.cells[cell_index]
+
+    def get_cell_index_by_position(self, x: _Optional[int], y: _Optional[int]) -> int:
+        """Returns the cell index of the cell containing a position on the grid, or -1 if the position is outside the
+        grid."""
+        col_index, row_index = int(x // self.cell_size), int(y // self.cell_size)
+        col_count = self.blueprint.col_count
+        if 0 <= col_index < col_count and 0 <= row_index < self.blueprint.row_count:
+            return row_index * col_count + col_index
+        return -1
+
+    def get_cell_indices_by_position(self, x: _Any, y: _Any) -> _np.ndarray:
+        """
+        Returns the cell indices of the cells containing many positions on the grid at once.
+
+        Args:
+            x (array-like): The x coordinates of the positions.
+            y (array-like): The y coordinates of the positions, of the same shape as `x`.
+
+        Returns:
+            np.ndarray: The cell index of the cell containing every position, in the shape of `x`, with -1 for
+                positions outside the grid.
+
+        Example:
+            ```python
+            # A grid of 10 by 10 pixel cells, 10 cells wide
+            cell_indices = grid.get_cell_indices_by_position([0, 25, -5], [0, 12, 3])
+            print(cell_indices)
+            # Output: [ 0 12 -1]
+            ```
+        """
+        col_index = _np.floor_divide(_np.asarray(x), self.cell_size).astype(_np.int64)
+        row_index = _np.floor_divide(_np.asarray(y), self.cell_size).astype(_np.int64)
+        col_count, row_count = self.blueprint.col_count, self.blueprint.row_count
+        inside = (col_index >= 0) & (col_index < col_count) & (row_index >= 0) & (row_index < row_count)
+        return _np.where(inside, row_index * col_count + col_index, -1)
 
     @_log_method
     def get_cell_by_rank_file(self, rank: _Optional[int], file: _Optional[int]) -> _Optional[_Cell]:
@@ -803,23 +1329,154 @@ class Grid(_AbstractGrid, _ABC):
         # for cell in r:
         #     if cell in f:
         #         return cell
-        return self.cells[self.grid_array[rank, file, 0]['designation']]
+        return self.cells[rank * self.blueprint.col_count + file]
+
+    # The cell attributes that `random_cell` can draw from a maintained pool, and the pool predicate of each.
+    _POOL_PREDICATES = {
+            'passable':       'passable',
+            'terrain_str':    'terrain',
+            'landmass_index': 'landmass',
+            'is_coastal':     'coastal'
+    }
+
+    def seed_random(self, seed: _Optional[int] = None) -> None:
+        """Gives the grid its own random number generator for `random_cell` and `sample_cells`, seeded with `seed`.
+        Until this is called they draw from the global `random` module."""
+        self.rng = _random.Random(seed)
+
+    def cell_pool(self, predicate: str, value: _Any) -> _CellPool:
+        """
+        Returns the pool of cells matching a predicate, which is built on first use and then kept up to date.
+
+        Args:
+            predicate (str): 'passable', 'terrain' (a terrain name), 'landmass' (a landmass index) or 'coastal'.
+            value: The value the cells must have.
+
+        Returns:
+            CellPool: The matching cells. Passable and terrain pools follow changes made through the cells; landmass
+                and coastal pools are rebuilt when the landmasses are.
+        """
+        if self._cell_pools is None:
+            self._cell_pools = {}
+            self.store.subscribe(self._on_pool_change)
+        key = (predicate, value)
+        pool = self._cell_pools.get(key)
+        if pool is None:
+            pool = self._cell_pools[key] = _CellPool.from_mask(self._pool_mask(predicate, value))
+        return pool
+
+    def _pool_mask(self, predicate: str, value: _Any) -> _np.ndarray:
+        store = self.store
+        if predicate == 'passable':
+            return store.passable == bool(value)
+        if predicate == 'terrain':
+            terrain_id = store.get_terrain_id(value)
+            if terrain_id is None:
+                return _np.zeros(len(store), dtype=_np.bool_)
+            return store.terrain_id == terrain_id
+        if predicate == 'landmass':
+            return store.landmass_index == (-1 if value is None else value)
+        if predicate == 'coastal':
+            return store.is_coastal == bool(value)
+        raise ValueError(f'Unknown cell pool predicate: {predicate}')
+
+    def _on_pool_change(self, column: str, index: int) -> None:
+        predicate = {'passable': 'passable', 'terrain_id': 'terrain'}.get(column)
+        if predicate is None:
+            return
+        for (pool_predicate, value), pool in self._cell_pools.items():
+            if pool_predicate == predicate:
+                if predicate == 'passable':
+                    pool.set(index, bool(self.store.passable[index]) == bool(value))
+                else:
+                    pool.set(index, self.store.get_terrain_str(index) == value)
+
+    def _drop_cell_pools(self, *predicates: str) -> None:
+        if self._cell_pools:
+            for key in [key for key in self._cell_pools if key[0] in predicates]:
+                del self._cell_pools[key]
+
+    def sample_cells(
+            self,
+            k: int = 1,
+            replace: bool = False,
+            rng: _Optional[_random.Random] = None,
+            **predicates: _Any
+    ) -> list[_Cell]:
+        """
+        Returns `k` random cells matching all of the given predicates, drawn from maintained cell pools without
+        rejecting any draw.
+
+        Args:
+            k (int): The number of cells to draw. Defaults to 1.
+            replace (bool): Whether a cell may be drawn more than once. Defaults to False.
+            rng (Optional[random.Random]): The random number generator to draw with. Defaults to `rng`, which is the
+                global `random` module unless `seed_random` was called.
+            **predicates: Any of passable=bool, terrain=str, landmass=int and coastal=bool. See `cell_pool`.
+
+        Returns:
+            list[_Cell]: The cells drawn.
+
+        Raises:
+            ValueError: If no cell matches the predicates, or fewer than `k` do and `replace` is False.
+
+        Example:
+            ```python
+            grid.seed_random(7)
+            cells = grid.sample_cells(3, passable=True, coastal=True)
+            print([cell.designation for cell in cells])
+            # Output: ['d00017', 'a00040', 'k00003']
+            ```
+        """
+        rng = self.rng if rng is None else rng
+        candidates = self._pool_candidates(predicates)
+        count = len(self.cells) if candidates is None else len(candidates)
+        if not count:
+            raise ValueError(f'No cells match {predicates}')
+        if replace:
+            picks = [rng.randrange(count) for _ in range(k)]
+        elif k > count:
+            raise ValueError(f'Cannot draw {k} cells from the {count} cells matching {predicates}')
+        else:
+            picks = rng.sample(range(count), k)
+        if candidates is not None:
+            picks = candidates[picks].tolist()
+        return [self.cells[pick] for pick in picks]
+
+    def _pool_candidates(self, predicates: dict[str, _Any]) -> _Optional[_np.ndarray]:
+        """Returns the cell indices matching all of the predicates, found by filtering the smallest of their pools
+        against the others, or None if there are no predicates."""
+        if not predicates:
+            return None
+        pools = sorted((self.cell_pool(predicate, value) for predicate, value in predicates.items()), key=len)
+        candidates = pools[0].members
+        for pool in pools[1:]:
+            candidates = candidates[pool.contains_many(candidates)]
+        return candidates
 
     @_log_method
     def random_cell(
             self,
             attr: _Optional[tuple[str, _Any]] = None,
             attrs: _Optional[tuple[tuple[str, _Any]]] = None,
-            landmass_index: _Optional[int] = None
+            landmass_index: _Optional[int] = None,
+            rng: _Optional[_random.Random] = None
     ) -> _Optional[_Cell]:
         """Returns a _random cell. If an attribute is provided, the cell must have that attribute. If multiple
         attributes are provided, the cell must have all attributes. If a landmass index is provided, the cell must be
         in that landmass.
+
+        Passability, terrain string, landmass index and coastal conditions are drawn from the cell pools of
+        `sample_cells`; any other attribute is matched by checking every cell once.
         
         Args:
             attr (_Optional[tuple[str, _Any]], optional): The attribute. Defaults to None.
             attrs (_Optional[tuple[tuple[str, _any]]], optional): The attributes. Defaults to None.
             landmass_index (_Optional[int], optional): The landmass index. Defaults to None.
+            rng (_Optional[random.Random], optional): The random number generator to draw with. Defaults to `rng`.
+
+        Raises:
+            ValueError: If no cell matches.
             
         Example:
             ```grid.random_cell(attr=('passable', True))``` returns a _random passable cell.
@@ -827,34 +1484,44 @@ class Grid(_AbstractGrid, _ABC):
             cell with terrain string 'GRASS'.
             ```grid.random_cell(landmass_index=0)``` returns a _random cell in the first landmass.
         """
+        rng = self.rng if rng is None else rng
+        conditions = list(attrs) if attrs is not None else [attr] if attr is not None else []
+        predicates = {}
         if landmass_index is not None:
-            cell = _choice(self.landmasses[landmass_index]['landmass_cells'])
-        elif attrs is not None:
-            cell = self.cells[_choice(self.blueprint.cell_list)]
-            while any(getattr(cell, attr[0]) != attr[1] for attr in attrs):
-                cell = self.cells[_choice(self.blueprint.cell_list)]
-        elif attr is not None:
-            cell = self.cells[_choice(self.blueprint.cell_list)]
-            while getattr(cell, attr[0]) != attr[1]:
-                cell = self.cells[_choice(self.blueprint.cell_list)]
-        else:
-            cell = self.cells[_choice(self.blueprint.cell_list)]
-        return cell
+            predicates['landmass'] = landmass_index
+        others = []
+        for name, value in conditions:
+            if name in self._POOL_PREDICATES:
+                predicates[self._POOL_PREDICATES[name]] = value
+            else:
+                others.append((name, value))
+        if not others:
+            if not predicates:
+                return self.cells[rng.randrange(len(self.cells))]
+            return self.sample_cells(1, rng=rng, **predicates)[0]
+        candidates = self._pool_candidates(predicates)
+        candidates = range(len(self.cells)) if candidates is None else candidates.tolist()
+        matches = [cell for cell in map(self.cells.__getitem__, candidates)
+                   if all(getattr(cell, name) == value for name, value in others)]
+        if not matches:
+            raise ValueError(f'No cells match {conditions}')
+        return matches[rng.randrange(len(matches))]
 
     @_log_method
     def random_row(self) -> _Optional[list[_Cell,]]:
         """Returns a _random row."""
-        return _choice([getattr(self.rows, f'row{r}') for r in self.blueprint.rank])
+        return _choice(self.rows)
 
     @_log_method
     def random_col(self) -> _Optional[list[_Cell,]]:
         """Returns a _random column."""
-        return _choice([getattr(self.cols, f'col{c}') for c in self.blueprint.file])
+        return _choice(self.cols)
 
     @_log_method
-    def get_adjacent(self, cell_designation: _Optional[str] = None) -> _Optional[list[_Cell,]]:
-        """Returns a list of all adjacent cells to the specified cell."""
-        return [self.cells[adj] for adj in self.cells[cell_designation].adjacent]
+    def get_adjacent(self, cell_designation: _Optional[_Union[int, str, _Cell]] = None) -> _Optional[list[_Cell,]]:
+        """Returns a list of all adjacent cells to the specified cell. Off-grid neighbors are None."""
+        neighbors = self.blueprint.neighbors[self.get_cell_index(cell_designation)].tolist()
+        return [self.cells[adj] if adj >= 0 else None for adj in neighbors]
 
     # @_log_method
     # def get_neighbors(self, cell_designation: _Optional[str] = None) -> _Optional[list[_Cell,]]:
@@ -869,10 +1536,7 @@ class Grid(_AbstractGrid, _ABC):
             ) -> _Optional[int]:
         """Returns the distance between two cells. If no measurement is provided, the distance is in units. If
         measurement is 'cells', the distance is in cells."""
-        if isinstance(cella, _Cell):
-            cella = cella.designation
-        if isinstance(cellb, _Cell):
-            cellb = cellb.designation
+        cella, cellb = self.get_cell_index(cella), self.get_cell_index(cellb)
         m = measurement if measurement is not None else "units"
         if m == "units":
             return self._heuristic(cella, cellb)
@@ -883,39 +1547,181 @@ class Grid(_AbstractGrid, _ABC):
     def get_path(
             self,
             cella: _Optional[_Union[_Cell, str]] = None,
-            cellb: _Optional[_Union[_Cell, str]] = None
-    ) -> _Optional[tuple[list[_Cell,], int]]:
-        """Returns a list of cells representing the shortest path between two cells and the cost of the path."""
+            cellb: _Optional[_Union[_Cell, str]] = None,
+            use_cache: bool = True,
+            method: str = 'astar',
+            max_expansions: _Optional[int] = None,
+            max_cost: _Optional[float] = None
+    ) -> _PathResult:
+        """
+        Returns the shortest path between two cells as a `PathResult`, carrying the designations of the cells of the
+        path, its cost, the number of cells the search expanded and the status of the search. The result unpacks into
+        the path and cost.
+
+        Cells in different connected groups of passable cells are answered as unreachable at once, without searching.
+
+        Args:
+            cella: The cell to start from.
+            cellb: The cell to reach.
+            use_cache (bool): Whether to look the path up in, and store it in, `path_cache`. Defaults to True.
+            method (str): The search to use: 'astar' for A*, 'bidirectional' for A* grown from both ends, which expands
+                fewer cells on long paths, 'jps' for Jump Point Search, which is fastest across uniform-cost terrain
+                and falls back to weighted A* elsewhere, or 'hpa' for hierarchical pathfinding, which is fastest over
+                long distances but only near-optimal. Defaults to 'astar'.
+            max_expansions (Optional[int]): The number of cells an 'astar' or 'bidirectional' search may expand before
+                giving up with the status 'expansion_limit'. Defaults to None.
+            max_cost (Optional[float]): The highest path cost an 'astar' or 'bidirectional' search looks for; if no
+                path is that cheap, the status is 'cost_limit'. Defaults to None.
+
+        The number of cells expanded is also left in `path_expansions`; it is 0 when the path came from the cache.
+
+        Example:
+            ```python
+            result = grid.get_path('a00001', 'd00004', method='bidirectional', max_expansions=10000)
+            print(result.status, result.path, result.cost)
+            # Output: found ['b00002', 'c00003', 'd00004'] 6.0
+            ```
+        """
         _logger.gridengine(f'getting path from {cella} --> {cellb}')
-        if isinstance(cella, _Cell):
-            cella = cella.designation
-        if isinstance(cellb, _Cell):
-            cellb = cellb.designation
-        _logger.gridengine('Using A* algorithm')
-        path, cost = self._astar(cella, cellb)
-        path.remove(cella)
-        if cost == float('inf'):
-            return [], cost
-        for count, step in enumerate(path):
-            if not self[step].passable:
-                path = path[:count]
-                cost = sum([self[step].cost_in + self[step].cost_out for step in path])
-                break
-        return path, cost
+        start, goal = self.get_cell_index(cella), self.get_cell_index(cellb)
+        if method not in ('astar', 'bidirectional', 'jps', 'hpa'):
+            raise ValueError(f'Unknown pathfinding method: {method}')
+        if method in ('jps', 'hpa') and (max_expansions is not None or max_cost is not None):
+            raise ValueError(f'Search budgets are not supported by the {method} method')
+        self.path_expansions = 0
+        if not self.reachability.connected(start, goal):
+            return _PathResult([], float('inf'), 0, _UNREACHABLE)
+        if use_cache:
+            try:
+                result = self.path_cache.get(start, goal, method)
+            except KeyError:
+                pass
+            else:
+                if result is not None and max_cost is not None and result[1] > max_cost:
+                    return _PathResult([], float('inf'), 0, _COST_LIMIT)
+                return self._path_result(result, 0, _FOUND if result is not None else _UNREACHABLE)
+        if method == 'hpa':
+            _logger.gridengine('Using HPA* algorithm')
+            search = self.path_hierarchy
+            result = search.search(start, goal)
+        elif method == 'jps':
+            _logger.gridengine('Using Jump Point Search')
+            search = self.jump_point_search
+            result = search.search(start, goal)
+        elif method == 'bidirectional':
+            _logger.gridengine('Using bidirectional A* algorithm')
+            search = self.path_engine
+            result = search.bidirectional_search(start, goal, max_expansions, max_cost)
+        else:
+            _logger.gridengine('Using A* algorithm')
+            search = self.path_engine
+            result = self._astar(start, goal, max_expansions, max_cost)
+        self.path_expansions = search.expansions
+        status = _FOUND if result is not None else getattr(search, 'status', _UNREACHABLE)
+        if use_cache and status in (_FOUND, _UNREACHABLE):
+            self.path_cache.put(start, goal, method, result)
+        return self._path_result(result, search.expansions, status)
+
+    def get_paths_from(
+            self,
+            source: _Union[int, str, _Cell],
+            targets: list[_Union[int, str, _Cell]],
+            workers: _Optional[int] = None
+    ) -> list[_PathResult]:
+        """Returns the shortest path from one cell to each of many as a `PathResult`, like `get_path`. A single
+        Dijkstra tree is grown from the source until every target is reached."""
+        return self.get_paths([(source, target) for target in targets], workers)
+
+    def get_paths(
+            self,
+            pairs: list[tuple[_Union[int, str, _Cell], _Union[int, str, _Cell]]],
+            workers: _Optional[int] = None
+    ) -> list[_PathResult]:
+        """
+        Returns the shortest path between each pair of cells as a `PathResult`, like `get_path`. The results do not
+        count expansions, since the cells expanded for a start cell are shared between its targets.
+
+        Pairs are grouped by start cell and every group is answered from one Dijkstra tree, so the work for a start
+        cell is shared between all of its targets.
+
+        Args:
+            pairs (list[tuple]): The start and end cell of every path.
+            workers (Optional[int]): The number of worker processes to share the groups between. The cost grid is
+                handed to them through shared memory. Defaults to None, which finds the paths in the current process.
+
+        Returns:
+            list[PathResult]: The result of every pair, in the order of `pairs`.
+        """
+        jobs: dict[int, list[int]] = {}
+        job_numbers: dict[int, int] = {}
+        slots = []
+        for start, goal in pairs:
+            start = self.get_cell_index(start)
+            if start not in jobs:
+                job_numbers[start] = len(jobs)
+                jobs[start] = []
+            slots.append((job_numbers[start], len(jobs[start])))
+            jobs[start].append(self.get_cell_index(goal))
+        results = _solve_jobs(self.path_engine, list(jobs.items()), workers)
+        return [
+            self._path_result(results[job][target], 0, _FOUND if results[job][target] is not None else _UNREACHABLE)
+            for job, target in slots
+        ]
+
+    def flow_field(self, goal: _Union[int, str, _Cell], max_cost: _Optional[float] = None) -> _FlowField:
+        """
+        Returns a flow field towards a goal cell: the cost of the cheapest path to the goal from every cell and the next
+        cell to step to on the way, as NumPy arrays.
+
+        Any number of units heading to the same goal can follow the field with one O(1) lookup per step instead of a
+        path search each. The field keeps itself up to date as cells change, recomputing only the cells whose way to
+        the goal was affected.
+
+        Args:
+            goal: The cell to reach.
+            max_cost (Optional[float]): The highest path cost to compute; cells further away are left unreachable.
+                Defaults to None, which computes the whole grid.
+
+        Returns:
+            FlowField: The field, with `cost`, `next_cell` and `directions` arrays.
+
+        Example:
+            ```python
+            field = grid.flow_field('a00001', max_cost=200)
+            step = field.next_step(grid.get_cell_index('d00004'))
+            print(grid.blueprint.cell_list[step], field.cost_to_goal(step))
+            # Output: c00003 4.0
+            field.close()
+            ```
+        """
+        return _FlowField(self.path_engine, self.get_cell_index(goal), max_cost)
+
+    def _path_result(self, result: _Optional[tuple[list[int], float]], expansions: int, status: str) -> _PathResult:
+        """Wraps a path of cell indices, including its start, and its cost in a `PathResult` of designations."""
+        path, cost = self._path_designations(result)
+        return _PathResult(path, cost, expansions, status)
+
+    def _path_designations(self, result: _Optional[tuple[list[int], float]]) -> tuple[list[str], float]:
+        """Converts a path of cell indices, including its start, to the designations after the start and its cost."""
+        if result is None:
+            return [], float('inf')
+        path, cost = result
+        cell_list = self.blueprint.cell_list
+        return [cell_list[step] for step in path[1:]], cost
 
     @_log_method
-    def get_walk(self, start_cell: _Union[str, _Cell] = None, end_cell: _Union[str, _Cell] = None):
-        if isinstance(start_cell, _Cell):
-            start_cell = start_cell.designation
-        if isinstance(end_cell, _Cell):
-            end_cell = end_cell.designation
+    def get_walk(self, start_cell: _Union[int, str, _Cell] = None, end_cell: _Union[int, str, _Cell] = None):
+        start_cell, end_cell = self.get_cell_index(start_cell), self.get_cell_index(end_cell)
+        neighbors = self.blueprint.neighbors
+        passable = self.store.passable
+        cell_list = self.blueprint.cell_list
         walk_cells = [start_cell]
         if start_cell != end_cell:
             current_distance = self.get_distance(start_cell, end_cell, 'cells')
             while current_distance > 1:
-                current_cell = self.cells[walk_cells[-1]]
-                adjacent_cells = [adjacent_cell for adjacent_cell in current_cell.adjacent if
-                                  self.cells[adjacent_cell].passable and adjacent_cell not in walk_cells]
+                current_cell = walk_cells[-1]
+                adjacent_cells = [adjacent_cell for adjacent_cell in neighbors[current_cell].tolist() if
+                                  adjacent_cell >= 0 and passable[adjacent_cell] and adjacent_cell not in walk_cells]
                 if not adjacent_cells:
                     walk_cells.pop(-1)
                     break
@@ -925,8 +1731,8 @@ class Grid(_AbstractGrid, _ABC):
                 check_ = 0
                 while self.get_distance(next_cell, end_cell) > current_distance + 2 and check_ < 8:
                     print(
-                        f'Current distance: {current_distance} | Current cell: {current_cell.designation} | Next '
-                        f'cell: {next_cell}',
+                        f'Current distance: {current_distance} | Current cell: {cell_list[current_cell]} | Next '
+                        f'cell: {cell_list[next_cell]}',
                         end='\r'
                         )
                     direction += 1
@@ -936,7 +1742,7 @@ class Grid(_AbstractGrid, _ABC):
                     continue
                 walk_cells.append(next_cell)
                 current_distance = self.get_distance(next_cell, end_cell)
-            return walk_cells
+            return [cell_list[walk_cell] for walk_cell in walk_cells]
 
     @_log_method
     def get_direction(
@@ -945,12 +1751,9 @@ class Grid(_AbstractGrid, _ABC):
             cellb: _Optional[_Union[_Cell, str]] = None
     ) -> _Optional[str]:
         """Returns the direction from cell A to cell B."""
-        if isinstance(cella, _Cell):
-            cella = cella.designation
-        if isinstance(cellb, _Cell):
-            cellb = cellb.designation
+        cella, cellb = self.get_cell_index(cella), self.get_cell_index(cellb)
         cellA = self.cells[cella]
-        if cellb in cellA.adjacent:
+        if cellb in cellA.neighbor_indices:
             cellB = self.cells[cellb]
             for direction, adjacent in _DIRECTIONS.items():
                 if cellB == getattr(cellA, adjacent):
@@ -958,48 +1761,171 @@ class Grid(_AbstractGrid, _ABC):
         return _get_vector_direction(self.cells[cella].coordinates, self.cells[cellb].coordinates)
 
     @_log_method
-    def get_area(self, center_cell: _Optional[_Union[_Cell, str]] = None, radius: _Optional[int] = None):
-        """Returns a list of cells in the area around the center cell."""
-        area_zone = []
+    def get_area(self, center_cell: _Optional[_Union[_Cell, str, int]] = None, radius: _Optional[int] = None):
+        """Returns a list of cells in the area around the center cell, in cell index order."""
+        return [self.cells[cell] for cell in self.region_disk(center_cell, radius).tolist()]
 
-        if isinstance(center_cell, str):
-            center_cell = self.cells[center_cell]
+    @_log_method
+    def get_perimeter(self, area_cells: _Optional[list[_Cell,]] = None):
+        """Returns a list of the cells bordering an area, in cell index order."""
+        return [self.cells[cell] for cell in self.region_perimeter(area_cells).tolist()]
 
-        i1 = self.cols.index(center_cell.col)
-        i2 = center_cell.col.index(center_cell)
+    @_log_method
+    def get_sub(self, bottom_left, top_right):
+        """Returns a list of the cells between two (row index, column index) corners, in cell index order."""
+        return [self.cells[cell] for cell in self.region_rectangle(bottom_left, top_right).tolist()]
 
-        min_i1 = max(i1 - radius, 0)
-        max_i1 = min(i1 + radius, len(self.cols) - 1)
+    def _region_result(self, indices: _np.ndarray, as_mask: bool) -> _np.ndarray:
+        return _indices_to_mask(indices, len(self.cells)) if as_mask else indices
 
-        min_i2 = max(i2 - radius, 0)
-        max_i2 = min(i2 + radius, len(center_cell.col) - 1)
+    def _region_indices(self, region: _Any) -> _np.ndarray:
+        """Returns the cell indices of a region given as an index array, a boolean mask or a collection of cells."""
+        if isinstance(region, _np.ndarray):
+            return _np.flatnonzero(region) if region.dtype == _np.bool_ else region.astype(_np.int64)
+        if isinstance(region, _CellSequence):
+            return region.indices
+        return _np.array([self.get_cell_index(cell) for cell in region], dtype=_np.int64)
 
-        for i in range(min_i1, max_i1 + 1):
-            col = self.cols[i]
-            area_zone.extend(col[j] for j in range(min_i2, max_i2 + 1))
-        area_zone = set(area_zone)
-        return sorted(area_zone, key=lambda cell: cell.designation)
+    def region_rectangle(
+            self,
+            corner_a: tuple[int, int],
+            corner_b: tuple[int, int],
+            as_mask: bool = False
+    ) -> _np.ndarray:
+        """
+        Returns the cells between two (row index, column index) corners, inclusive and clipped to the grid.
 
-    @_log_method
-    def get_perimeter(self, area_cells: _Optional[list[_Cell,]] = None):
-        perimeter_cells = []
-        for cell in self.cells.values():
-            perimeter_cells.extend(
-                    cell
-                    for adjacent in cell.adjacent
-                    if self.cells[adjacent] in area_cells and cell not in area_cells
-            )
-        perimeter_cells = set(perimeter_cells)
-        return sorted(perimeter_cells, key=lambda cell: cell.designation)
+        Args:
+            corner_a (tuple[int, int]): One corner of the rectangle.
+            corner_b (tuple[int, int]): The opposite corner.
+            as_mask (bool): Whether to return a boolean mask over every cell instead of cell indices. Defaults to False.
 
-    @_log_method
-    def get_sub(self, bottom_left, top_right):
-        return [
-                cell
-                for cell in self.cells.values()
-                if bottom_left[0] <= cell.row_index <= top_right[0]
-                   and bottom_left[1] <= cell.col_index <= top_right[1]
-        ]
+        Returns:
+            np.ndarray: The cell indices of the rectangle in cell index order, or its mask.
+
+        Example:
+            ```python
+            cell_indices = grid.region_rectangle((0, 0), (1, 2))
+            print([grid.cells[i].designation for i in cell_indices])
+            # Output: ['a00001', 'a00002', 'a00003', 'b00001', 'b00002', 'b00003']
+            ```
+        """
+        blueprint = self.blueprint
+        indices = _rectangle_indices(blueprint.row_count, blueprint.col_count, corner_a, corner_b)
+        return self._region_result(indices, as_mask)
+
+    def region_disk(
+            self,
+            center_cell: _Union[int, str, _Cell],
+            radius: float,
+            metric: str = 'chebyshev',
+            as_mask: bool = False
+    ) -> _np.ndarray:
+        """
+        Returns the cells within a distance, in cells, of a center cell.
+
+        Args:
+            center_cell: The center of the disk.
+            radius (float): The largest distance of a cell in the disk.
+            metric (str): 'chebyshev', for which the disk is a square, or 'euclidean'. Defaults to 'chebyshev'.
+            as_mask (bool): Whether to return a boolean mask over every cell instead of cell indices. Defaults to False.
+
+        Returns:
+            np.ndarray: The cell indices of the disk in cell index order, or its mask.
+        """
+        blueprint = self.blueprint
+        center = divmod(self.get_cell_index(center_cell), blueprint.col_count)
+        indices = _disk_indices(blueprint.row_count, blueprint.col_count, center, radius, metric)
+        return self._region_result(indices, as_mask)
+
+    def region_polygon(self, vertices: list[tuple[int, int]], as_mask: bool = False) -> _np.ndarray:
+        """
+        Returns the cells inside a polygon, including the cells on its edges.
+
+        Args:
+            vertices (list[tuple[int, int]]): The (row index, column index) of every vertex of the polygon, in order.
+            as_mask (bool): Whether to return a boolean mask over every cell instead of cell indices. Defaults to False.
+
+        Returns:
+            np.ndarray: The cell indices of the polygon in cell index order, or its mask.
+        """
+        blueprint = self.blueprint
+        indices = _polygon_indices(blueprint.row_count, blueprint.col_count, vertices)
+        return self._region_result(indices, as_mask)
+
+    def region_perimeter(self, region: _Any, inner: bool = False, as_mask: bool = False) -> _np.ndarray:
+        """
+        Returns the perimeter of a region, found by dilating or eroding the mask of the region.
+
+        Args:
+            region: The region, as cell indices, a boolean mask or a collection of cells.
+            inner (bool): Whether to return the cells of the region on its border instead of the cells around it.
+                Defaults to False.
+            as_mask (bool): Whether to return a boolean mask over every cell instead of cell indices. Defaults to False.
+
+        Returns:
+            np.ndarray: The cell indices of the perimeter in cell index order, or its mask.
+
+        Example:
+            ```python
+            area = grid.region_disk('c00003', 1)
+            print(len(grid.region_perimeter(area)), len(grid.region_perimeter(area, inner=True)))
+            # Output: 16 8
+            ```
+        """
+        blueprint = self.blueprint
+        indices = _perimeter_indices(blueprint.row_count, blueprint.col_count, self._region_indices(region), inner)
+        return self._region_result(indices, as_mask)
+
+    def _get_connected_cells(self, center_index: int, passable: list[bool]) -> list[int]:
+        """
+        Finds and returns the indices of all cells connected to the center cell that share its passability.
+
+        Args:
+            center_index: The cell index of the center cell.
+            passable: The passable value of every cell, by cell index.
+
+        Returns:
+            List of cell indices connected to the center cell.
+        """
+        neighbors = self.blueprint.neighbors
+        value = passable[center_index]
+        connected_cells = {center_index}
+        queue = _deque([center_index])
+        while queue:
+            current_cell = queue.popleft()
+            for neighbor in neighbors[current_cell].tolist():
+                if neighbor >= 0 and neighbor not in connected_cells and passable[neighbor] == value:
+                    connected_cells.add(neighbor)
+                    queue.append(neighbor)
+        return list(connected_cells)
+
+    def _label_components(self) -> None:
+        """
+        Labels every connected group of passable cells and every connected group of impassable cells in one pass, and
+        marks the cells adjacent to the ocean.
+
+        The labels are numbered in order of the first cell of each group and stored in `landmass_labels` and
+        `water_labels` (-1 for cells of the other kind), with the size of each label in `landmass_sizes` and
+        `water_sizes`. Coastal cells are stored in `coastal_mask`.
+        """
+        passable = self.store.passable
+        neighbors = self.blueprint.neighbors
+        roots = _label_components(neighbors, passable)
+        self.landmass_labels, self.landmass_sizes = _component_labels(roots, passable)
+        self.water_labels, self.water_sizes = _component_labels(roots, ~passable)
+        ocean = self.store.get_terrain_id('OCEAN')
+        if ocean is None:
+            self.coastal_mask = _np.zeros(len(passable), dtype=_np.bool_)
+        else:
+            self.coastal_mask = _coastal_mask(neighbors, self.store.terrain_id == ocean)
+
+    def _find_components(self, passable: bool) -> list[_np.ndarray]:
+        """Returns the cell indices of every connected group of cells with the given passability."""
+        self._label_components()
+        if passable:
+            return _component_members(self.landmass_labels, self.landmass_sizes)
+        return _component_members(self.water_labels, self.water_sizes)
 
     def _get_landmass_cells(self, center_cell):
         """
@@ -1013,73 +1939,44 @@ class Grid(_AbstractGrid, _ABC):
         Returns:
             List of cells belonging to the same landmass as the center cell.
         """
-        landmass_cells = set()
-        visited = set()
-        queue = _deque([center_cell])
-
-        while (
-                queue
-                and len(landmass_cells)
-                < self.blueprint.row_count * self.blueprint.col_count
-        ):
-            current_cell = queue.popleft()
-
-            # Check if the current cell is part of the landmass and not visited.
-            if current_cell.passable and current_cell.designation not in visited:
-                landmass_cells.add(current_cell)
-                visited.add(current_cell.designation)
-
-                # Add adjacent land cells to the queue for exploration.
-                for neighbor in current_cell.adjacent:
-                    if neighbor is not None:
-                        if neighbor not in visited:
-                            neighbor_cell = self.cells[neighbor]
-                            if neighbor_cell.passable:
-                                queue.append(neighbor_cell)
-        return list(landmass_cells)
+        return [
+                self.cells[index]
+                for index in self._get_connected_cells(center_cell.cell_index, self.store.passable.tolist())
+        ]
 
     def _find_landmasses(self):
         """
-        Finds and returns all landmasses on the grid.
+        Finds and returns all landmasses on the grid. Landmasses of fewer than 100 cells are returned as islands.
 
         Returns:
-            List of landmasses, where each landmass is a list of cells.
+            Dictionary of landmasses and dictionary of islands, keyed by the number of the landmass.
         """
-        landmasses = []
-        visited = set()
         print('Finding landmasses ...')
-        for cell in self.cells.values():
-            if cell.passable and cell.designation not in visited:
-                landmass = self._get_landmass_cells(cell)
-                landmasses.append(landmass)
-                visited.update(cell.designation for cell in landmass)
+        self._label_components()
+        members = _component_members(self.landmass_labels, self.landmass_sizes)
         landmasses = {
                 i: {
-                        'landmass_cells': landmass,
-                        'coastal_cells':  self._find_coastal_cells(landmass)
+                        'landmass_cells': _CellSequence(self, landmass),
+                        'coastal_cells':  _CellSequence(self, landmass[self.coastal_mask[landmass]])
                 }
-                for i, landmass in enumerate(landmasses)
+                for i, landmass in enumerate(members)
         }
         print('Separating islands from landmasses ...')
-        islands = {
-                i: {
-                        'island_cells':  landmass['landmass_cells'],
-                        'coastal_cells': landmass['coastal_cells'],
-                }
-                for i, landmass in landmasses.items()
-                if len(landmass['landmass_cells']) < 100
-        }
-        for i in islands:
-            del landmasses[i]
+        islands = {}
+        for i in _np.flatnonzero(self.landmass_sizes < 100).tolist():
+            island = landmasses.pop(i)
+            islands[i] = {
+                    'island_cells':  island['landmass_cells'],
+                    'coastal_cells': island['coastal_cells'],
+            }
         print('Done.')
         return landmasses, islands
 
     def _set_landmass_cells(self):
+        self._drop_cell_pools('landmass', 'coastal')
         for i, landmass in self.landmasses.items():
-            for cell in landmass['landmass_cells']:
-                cell.landmass_index = i
-            for cell in landmass['coastal_cells']:
-                cell.is_coastal = True
+            self.store.landmass_index[landmass['landmass_cells'].indices] = i
+            self.store.is_coastal[landmass['coastal_cells'].indices] = True
 
     def _get_largest_landmass(self):
         largest_land = 0
@@ -1118,54 +2015,46 @@ class Grid(_AbstractGrid, _ABC):
         Returns:
             List of cells that are adjacent to the ocean.
         """
-        coastal_cells = set()
-        for landmass_cell in landmass_cells:
-            for neighbor in landmass_cell.adjacent:
-                if neighbor is not None:
-                    neighbor_cell = self.cells[neighbor]
-                    if neighbor_cell.terrain_str == 'OCEAN':
-                        coastal_cells.add(landmass_cell)
-        return list(coastal_cells)
+        ocean = self.store.get_terrain_id('OCEAN')
+        if ocean is None or not landmass_cells:
+            return []
+        cell_indices = _np.array([cell.cell_index for cell in landmass_cells], dtype=_np.int32)
+        neighbors = self.blueprint.neighbors[cell_indices]
+        coastal = ((neighbors >= 0) & (self.store.terrain_id[neighbors] == ocean)).any(axis=1)
+        return [self.cells[index] for index in cell_indices[coastal].tolist()]
 
     def _find_bodies_of_water(self):
-        visited = set()
-        bodies_of_water = []
-        for cell in self.cells.values():
-            if not cell.passable and cell.designation not in visited:
-                body_of_water = self._get_body_of_water(cell)
-                bodies_of_water.append(body_of_water)
-                visited.update(cell.designation for cell in body_of_water)
+        """
+        Finds and returns all bodies of water on the grid, and classifies them by size into oceans (more than 1000
+        cells), seas (between 500 and 1000 cells) and lakes (between 100 and 500 cells).
+
+        Returns:
+            Dictionaries of bodies of water, oceans, seas and lakes, keyed by the number of the body of water.
+        """
+        if not hasattr(self, 'water_labels'):
+            self._label_components()
+        members = _component_members(self.water_labels, self.water_sizes)
         bodies_of_water = {
                 i: {
-                        'body_of_water_cells': body_of_water,
-                        'coastal_cells':       self._find_coastal_cells(body_of_water)
-                }
-                for i, body_of_water in enumerate(bodies_of_water)
-        }
-        oceans = {
-                i: {
-                        'ocean_cells':   body_of_water['body_of_water_cells'],
-                        'coastal_cells': body_of_water['coastal_cells'],
-                }
-                for i, body_of_water in bodies_of_water.items()
-                if len(body_of_water['body_of_water_cells']) > 1000
-        }
-        seas = {
-                i: {
-                        'sea_cells':     body_of_water['body_of_water_cells'],
-                        'coastal_cells': body_of_water['coastal_cells'],
-                }
-                for i, body_of_water in bodies_of_water.items()
-                if 500 < len(body_of_water['body_of_water_cells']) < 1000
-        }
-        lakes = {
-                i: {
-                        'lake_cells':    body_of_water['body_of_water_cells'],
-                        'coastal_cells': body_of_water['coastal_cells'],
+                        'body_of_water_cells': _CellSequence(self, body_of_water),
+                        'coastal_cells':       _CellSequence(self, body_of_water[self.coastal_mask[body_of_water]])
                 }
-                for i, body_of_water in bodies_of_water.items()
-                if 100 < len(body_of_water['body_of_water_cells']) < 500
+                for i, body_of_water in enumerate(members)
         }
+        sizes = self.water_sizes
+
+        def classify(kind, selected):
+            return {
+                    i: {
+                            f'{kind}_cells': bodies_of_water[i]['body_of_water_cells'],
+                            'coastal_cells': bodies_of_water[i]['coastal_cells'],
+                    }
+                    for i in _np.flatnonzero(selected).tolist()
+            }
+
+        oceans = classify('ocean', sizes > 1000)
+        seas = classify('sea', (500 < sizes) & (sizes < 1000))
+        lakes = classify('lake', (100 < sizes) & (sizes < 500))
         return bodies_of_water, oceans, seas, lakes
 
     def delete_bodies_of_water(self):
@@ -1185,118 +2074,51 @@ class Grid(_AbstractGrid, _ABC):
         Returns:
             List of cells belonging to the same body of water as the center cell.
         """
-        body_of_water_cells = set()
-        visited = set()
-        queue = _deque([center_cell])
-
-        while (
-                queue
-                and len(body_of_water_cells)
-                < self.blueprint.row_count * self.blueprint.col_count
-        ):
-            current_cell = queue.popleft()
-
-            # Check if the current cell is part of the body of water and not visited.
-            if not current_cell.passable and current_cell.designation not in visited:
-                body_of_water_cells.add(current_cell)
-                visited.add(current_cell.designation)
-
-                # Add adjacent water cells to the queue for exploration.
-                for neighbor in current_cell.adjacent:
-                    if neighbor is not None:
-                        if neighbor not in visited:
-                            neighbor_cell = self.cells[neighbor]
-                            if not neighbor_cell.passable:
-                                queue.append(neighbor_cell)
-        return list(body_of_water_cells)
+        return [
+                self.cells[index]
+                for index in self._get_connected_cells(center_cell.cell_index, self.store.passable.tolist())
+        ]
 
     def _set_water_cells(self):
         for i, body_of_water in self.bodies_of_water.items():
-            for cell in body_of_water['body_of_water_cells']:
-                cell.body_of_water_index = i
-                
+            self.store.body_of_water_index[body_of_water['body_of_water_cells'].indices] = i
+
     def _fix_minute_water_bodies(self):
-        for i, cell in enumerate(self.cells.values()):
-            if not cell.passable:
-                total_neighbors = 0
-                passable_neighbors = 0
-                model_cell = None
-                for neighbor in cell.adjacent:
-                    if neighbor is not None:
-                        total_neighbors += 1
-                        if self.cells[neighbor].passable:
-                            passable_neighbors += 1
-                            model_cell = self.cells[neighbor]
-                if passable_neighbors == total_neighbors:
-                    cell.passable = True
-                    cell.terrain_str = self.dictTerrain[model_cell.designation]['str']
-                    cell.terrain_raw = self.dictTerrain[model_cell.designation]['raw']
-                    cell.terrain_int = self.dictTerrain[model_cell.designation]['int']
-                    cell.terrain_color = self.dictTerrain[model_cell.designation]['color']
-                    cell._cost_in = self.dictTerrain[model_cell.designation]['cost_in']
-                    cell._cost_out = self.dictTerrain[model_cell.designation]['cost_out']
-
-    def _heuristic(self, cella: _Union[str, _Cell], cellb: _Union[str, _Cell]):
-        """Estimates the distance between two cells using Manhattan distance"""
-        _logger.gridengine(f'Calculating heuristic from {cella} --> {cellb}')
-        if isinstance(cella, _Cell):
-            cella = cella.designation
-        if isinstance(cellb, _Cell):
-            cellb = cellb.designation
-        cell_a_coords = self.cells[cella].coordinates
-        cell_b_coords = self.cells[cellb].coordinates
-        (x1, y1) = cell_a_coords
-        (x2, y2) = cell_b_coords
-        _logger.gridengine(f'_Cell A coordinates: {cell_a_coords}')
-        _logger.gridengine(f'_Cell B coordinates: {cell_b_coords}')
-        _logger.gridengine(f'Heuristic: {round(_math.hypot(abs(x1 - x2), abs(y1 - y2)))}')
-        return round(_math.hypot(abs(x1 - x2), abs(y1 - y2)))
+        passable = self.store.passable
+        neighbors = self.blueprint.neighbors
+        for index in _np.flatnonzero(~passable).tolist():
+            adjacent = [neighbor for neighbor in neighbors[index].tolist() if neighbor >= 0]
+            passable_neighbors = [neighbor for neighbor in adjacent if passable[neighbor]]
+            if len(passable_neighbors) == len(adjacent):
+                cell = self.cells[index]
+                model_terrain = self.dictTerrain[self.blueprint.cell_list[passable_neighbors[-1]]]
+                cell.passable = True
+                cell.terrain_str = model_terrain['str']
+                cell.terrain_raw = model_terrain['raw']
+                cell.terrain_int = model_terrain['int']
+                cell.terrain_color = model_terrain['color']
+                cell.cost_in = model_terrain['cost_in']
+                cell.cost_out = model_terrain['cost_out']
+
+    def _heuristic(self, cella: _Union[int, str, _Cell], cellb: _Union[int, str, _Cell]):
+        """Estimates the distance between two cells using the straight-line distance between their coordinates"""
+        row_a, col_a = divmod(self.get_cell_index(cella), self.blueprint.col_count)
+        row_b, col_b = divmod(self.get_cell_index(cellb), self.blueprint.col_count)
+        cell_size = self.blueprint.cell_size
+        return round(_math.hypot((col_a - col_b) * cell_size, (row_a - row_b) * cell_size))
 
     # Define the _cost function
-    def _cost(self, current, next_step):
+    def _cost(self, current: int, next_step: int):
         """Returns the cost to move from the current cell to the next_step cell"""
-        _logger.gridengine(f'Calculating cost from {current} --> {next_step}')
-        cell = self.cells[next_step]
-        cost = self.cells[current].cost_out
-        cost += float("inf") if (cell is None or not cell.passable or current not in cell.adjacent) else cell.cost_in
+        store = self.store
+        cost = float(store.cost_out[current])
+        cost += float(store.cost_in[next_step]) if store.passable[next_step] else float("inf")
         return cost
 
     # Implement A* algorithm
-    def _astar(self, start, goal):
-        goal_coords = self.cells[goal].coordinates
-        _logger.gridengine(f'Goal coordinates: {goal_coords}')
-        """Finds the shortest path from start to goal in the given graph using A* algorithm"""
-        frontier = [(0, start)]  # A priority queue of nodes to explore
-        came_from = {}  # A dictionary that maps nodes to their parent nodes
-        cost_so_far = {start: 0}  # A dictionary that maps nodes to the _cost of the best known path to that node
-        graph = self.blueprint._graph
-
-        while frontier:
-            _, current = _heapq.heappop(frontier)
-            current_coords = self.cells[current].coordinates
-            if current_coords == goal_coords:
-                # We have found the goal, reconstruct the path and return it
-                path = [current]
-                while current in came_from:
-                    current = came_from[current]
-                    path.append(current)
-                path.reverse()
-                return (path, cost_so_far[goal])
-
-            for next_step in graph[current]:
-                if next_step is not None:
-                    # For each neighbor of the current node, 
-                    # calculate the _cost of the path from the start node to that neighbor
-                    new_cost = cost_so_far[current] + self._cost(current, next_step)
-                    if next_step not in cost_so_far or new_cost < cost_so_far[
-                        next_step  # If the new path is better than the old path
-                    ]:
-                        cost_so_far[next_step] = new_cost  # Update the cost of the path to the neighbor
-                        priority = new_cost + self._heuristic(goal, next_step)  # Calculate the priority of the neighbor
-                        _heapq.heappush(frontier, (priority, next_step))  # Add the neighbor to the frontier
-                        came_from[next_step] = current  # Update the neighbor's parent to the current node
-
-        return None  # We didn't find a path
+    def _astar(self, start: int, goal: int, max_expansions: _Optional[int] = None, max_cost: _Optional[float] = None):
+        """Finds the shortest path from start to goal using A* algorithm. Cells are addressed by cell index."""
+        return self.path_engine.search(start, goal, max_expansions=max_expansions, max_cost=max_cost)
 
     def _cast_grid(self, scene):
         """Cast the grid to the scene. Each cell is represented as a _pyglet.shapes.Rectangle object."""
@@ -1327,7 +2149,7 @@ class Grid(_AbstractGrid, _ABC):
                 "cell_size": self.cell_size,
         }
         cells_dict = {}
-        for cell_designation, cell in self.cells.items():
+        for cell_designation, cell in self.cells.items.items():
             cell_dict = cell.__json__()
             cells_dict[cell_designation] = cell_dict
 
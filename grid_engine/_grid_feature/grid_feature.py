@@ -2,6 +2,8 @@ from __future__ import annotations
 from abc import ABCMeta, ABC, abstractmethod
 from grid_engine._utility import QuietDict
 
+import numpy as np
+
 from typing import Optional, List, Tuple, Any, Union, AnyStr
 
 class Grid(ABC):
@@ -22,25 +24,47 @@ class AbstractGridFeature(QuietDict, ABC):
         self.title = title
         self.initiate_feature()
 
+    @property
+    def cells(self) -> List[Cell]:
+        """The cells of the feature, in the order they were added. Cells are keyed by cell index, so membership, adding
+        and removing a cell are O(1)."""
+        return list(self._cells.values())
+
+    @cells.setter
+    def cells(self, cells: List[Cell]):
+        self._cells = {}
+        for cell in cells:
+            self._cells.setdefault(cell.cell_index, cell)
+
+    @property
+    def indices(self) -> np.ndarray:
+        """The cell indices of the cells of the feature, in the order they were added."""
+        return np.fromiter(self._cells, dtype=np.int64, count=len(self._cells))
+
+    def mask(self) -> np.ndarray:
+        """Returns a boolean mask over every cell of the grid of the cells of the feature."""
+        mask = np.zeros(len(self.grid.cells), dtype=np.bool_)
+        mask[self.indices] = True
+        return mask
+
     def initiate_feature(self):
-        for cell in self.cells:
+        for cell in self._cells.values():
             cell.join_feature(self.title, self)
 
     def add_cell(self, cell: Cell):
-        self.cells.append(cell)
-        cell.join_feature(self.title, self)
+        if cell.cell_index not in self._cells:
+            self._cells[cell.cell_index] = cell
+            cell.join_feature(self.title, self)
 
     def remove_cell(self, cell: Cell):
-        if cell in self.cells:
-            self.cells.remove(cell)
-        else:
+        if self._cells.pop(getattr(cell, 'cell_index', None), None) is None:
             return False
 
     def in_feature(self, cell: Cell):
-        return cell in self.cells
+        return getattr(cell, 'cell_index', None) in self._cells
 
     def __json__(self):
-        cells_designations = [cell.designation for cell in self.cells]
+        cells_designations = [cell.designation for cell in self._cells.values()]
         return {
             "title": self.title,
             "cells": cells_designations,
@@ -63,17 +87,16 @@ class AbstractGridFeature(QuietDict, ABC):
 
     def __sub__(self, other):
         if isinstance(other, AbstractGridFeature):
-            for cell in self.cells.copy():
-                if cell in other.cells:
-                    self.remove_cell(cell)
+            for cell_index in self._cells.keys() & other._cells.keys():
+                del self._cells[cell_index]
 
     def __add__(self, other):
         if isinstance(other, AbstractGridFeature):
-            for cell in other.cells:
+            for cell in other._cells.values():
                 self.add_cell(cell)
 
     def __len__(self):
-        return len(self.cells)
+        return len(self._cells)
 
     def __iter__(self):
         return iter(self.cells)
@@ -82,13 +105,17 @@ class AbstractGridFeature(QuietDict, ABC):
         return self.cells[key]
 
     def __setitem__(self, key, value):
-        self.cells[key] = value
+        cells = self.cells
+        cells[key] = value
+        self.cells = cells
 
     def __delitem__(self, key):
-        del self.cells[key]
+        cells = self.cells
+        del cells[key]
+        self.cells = cells
 
     def __contains__(self, item):
-        return item in self.cells
+        return self.in_feature(item)
 
     def __reversed__(self):
         return reversed(self.cells)
@@ -1,6 +1,10 @@
 from abc import ABC as _ABC
 from typing import Union as _Union, Optional as _Optional
 
+import numpy as _np
+
+from .._spatial import neighborhood as _neighborhood, neighborhoods as _neighborhoods
+
 
 class Grid:
     pass
@@ -15,56 +19,130 @@ class GridGroup(_ABC):
     A class to represent a group of cells on the grid. A grid group is a collection of cells that share a common property or characteristic.
     The grid group is an explicit property of the grid, whereas a grid feature is an implicit property of the grid. A good example of a grid group
     is an AoE spell, which is a collection of cells that are affected by the spell, or a village, town or city.
+
+    The cells of a group are keyed by cell index in the order they were added, so adding, removing and looking up a cell is O(1), and a
+    cell is only ever held once. Groups can be combined with `|`, `&` and `-` into new groups.
+
+    Example:
+        ```python
+        village = GridGroup(grid, 'village', ['a00001', 'a00002', 'a00003'])
+        spell = GridGroup(grid, 'fireball', [2, 3, 4])
+        print(len(village & spell), village.in_group('a00001'), spell.in_group('a00001'))
+        # Output: 2 True False
+        ```
     """
 
     def __init__(self, grid: Grid, title: str, cells: list, legacy: bool = False):
         self.grid = grid
         self.title = title
-        self.cells = [grid.cells[cell] for cell in cells]
+        self._cells = {}
+        for cell in cells:
+            cell = grid.cells[cell]
+            self._cells.setdefault(cell.cell_index, cell)
         self.legacy = legacy
         self.initiate_group()
 
+    @property
+    def cells(self) -> list:
+        """A list of the cells in the group, in the order they were added."""
+        return list(self._cells.values())
+
+    @cells.setter
+    def cells(self, cells: list):
+        """Sets the cells in the group."""
+        self._cells = {}
+        for cell in cells:
+            cell = self.grid.cells[cell]
+            self._cells.setdefault(cell.cell_index, cell)
+
+    @property
+    def indices(self) -> _np.ndarray:
+        """The cell indices of the cells in the group, in the order they were added."""
+        return _np.fromiter(self._cells, dtype=_np.int64, count=len(self._cells))
+
+    def mask(self) -> _np.ndarray:
+        """Returns a boolean mask over every cell of the grid of the cells in the group."""
+        mask = _np.zeros(len(self.grid.cells), dtype=_np.bool_)
+        mask[self.indices] = True
+        return mask
+
     def initiate_group(self):
         """Adds the group to the cells in the group."""
-        for cell in self.cells:
+        for cell in self._cells.values():
             cell.join_group(self.title, self)
 
     def add_cell(self, cell: Cell):
-        """Adds a cell to the group and adds the group to the cell."""
+        """Adds a cell to the group and adds the group to the cell. A cell already in the group is not added again."""
+        cell = self.grid.cells[cell]
+        if cell.cell_index not in self._cells:
+            self._cells[cell.cell_index] = cell
+            cell.join_group(self.title, self)
 
-        self.cells.append(cell)
-        cell.join_group(self.title, self)
+    def in_group(self, cell: _Union[str, int, Cell]) -> bool:
+        """Checks if a cell is in the group. The cell can be given as a cell, a designation or a cell index."""
+        cell_index = self._cell_index(cell)
+        return cell_index is not None and cell_index in self._cells
 
-    def in_group(self, cell: _Union[str, Cell]):
-        """Checks if a cell is in the group"""
-        if isinstance(cell, str):
-            cell = self.grid.cells[cell]
-        cell_designations = [cell.designation for cell in self.cells]
-        if (
-            isinstance(cell, str)
-            and cell in cell_designations
-            or not isinstance(cell, str)
-            and isinstance(cell, Cell)
-            and cell in self.cells
-        ):
-            return True
-
-        elif isinstance(cell, (str, Cell)):
-            return False
-            
     def remove_cell(self, cell):
         """Removes a cell from the group"""
-        if self.in_group(cell):
-            self.cells.remove(cell)
-        else:
+        cell_index = self._cell_index(cell)
+        if cell_index is None or self._cells.pop(cell_index, None) is None:
             return False
 
+    def _cell_index(self, cell: _Union[str, int, Cell]) -> _Optional[int]:
+        try:
+            cell = self.grid.cells[cell]
+        except (KeyError, IndexError):
+            return None
+        return None if cell is None else cell.cell_index
+
+    def union(self, other: 'GridGroup', title: _Optional[str] = None) -> 'GridGroup':
+        """Returns a new group of the cells in either group."""
+        cells = dict(self._cells)
+        for cell_index, cell in other._cells.items():
+            cells.setdefault(cell_index, cell)
+        return GridGroup(self.grid, title or f'{self.title}|{other.title}', list(cells.values()))
+
+    def intersection(self, other: 'GridGroup', title: _Optional[str] = None) -> 'GridGroup':
+        """Returns a new group of the cells in both groups."""
+        cells = [cell for cell_index, cell in self._cells.items() if cell_index in other._cells]
+        return GridGroup(self.grid, title or f'{self.title}&{other.title}', cells)
+
+    def difference(self, other: 'GridGroup', title: _Optional[str] = None) -> 'GridGroup':
+        """Returns a new group of the cells in this group but not in the other."""
+        cells = [cell for cell_index, cell in self._cells.items() if cell_index not in other._cells]
+        return GridGroup(self.grid, title or f'{self.title}-{other.title}', cells)
+
+    def __or__(self, other):
+        if isinstance(other, GridGroup):
+            return self.union(other)
+        return NotImplemented
+
+    def __and__(self, other):
+        if isinstance(other, GridGroup):
+            return self.intersection(other)
+        return NotImplemented
+
+    def __sub__(self, other):
+        if isinstance(other, GridGroup):
+            return self.difference(other)
+        return NotImplemented
+
+    def __len__(self):
+        return len(self._cells)
+
+    def __iter__(self):
+        return iter(list(self._cells.values()))
+
+    def __contains__(self, cell):
+        return self.in_group(cell)
+
     def __json__(self):
         """
         Serializes the GridGroup object as a JSON object.
         """
         
-        cells_designations = [cell.designation for cell in self.cells]
+        cells_designations = [cell.designation for cell in self._cells.values()]
         return {
             "title": self.title,
             "cells": cells_designations,
@@ -73,15 +151,22 @@ class GridGroup(_ABC):
 
 
 class GridNeighborhood:
-    """A class to represent a neighborhood of cells.
+    """A class to represent a neighborhood of cells: every cell within a Chebyshev distance (radius) of a focus cell,
+    not counting the focus cell itself.
+
+    The neighborhood is computed as an array of cell indices from a cached offset stencil for its radius, so its cost
+    is proportional to the number of cells in it. `GridNeighborhood.batch` computes the neighborhoods of many focus
+    cells at once.
 
     Args:
         grid (Grid): The grid object to which the neighborhood belongs.
         focus (Cell): The cell object that is the focus of the neighborhood.
+        radius (int): The Chebyshev distance, in cells, of the farthest neighbors. Defaults to 1.
 
     Attributes:
         grid (Grid): The grid object to which the neighborhood belongs.
         focus (Cell): The cell object that is the focus of the neighborhood.
+        indices (np.ndarray): The cell indices of the neighborhood, in cell index order.
         cell_addresses (list): A list of cell objects that are the addresses of the neighborhood.
         neighbors (list): A list of objects that are the occupants of the cells in the neighborhood
     """
@@ -92,27 +177,50 @@ class GridNeighborhood:
                  radius: _Optional[int] = None,
             ):
         self.grid = grid
-        self.focus = focus
+        self.focus = grid.cells[focus]
         self.radius = radius if radius is not None else 1
         self.neighbors = None
+        self.indices = _neighborhood(
+                grid.blueprint.row_count, grid.blueprint.col_count, self.focus.cell_index, self.radius
+        )
         self.cell_addresses = self.get_cell_addresses()
         
     def __call__(self):
         return self.cell_addresses
 
+    def __contains__(self, cell) -> bool:
+        cell = self.grid.cells[cell]
+        distance = max(abs(cell.row_index - self.focus.row_index), abs(cell.col_index - self.focus.col_index))
+        return 0 < distance <= self.radius
+
     def get_cell_addresses(self):
-        addresses = [self.grid.cells[address] for address in self.focus.adjacent]
-        if self.radius == 1:
-            return addresses
-        for _ in range(self.radius):
-            level = []
-            for address in addresses:
-                extension = [self.grid.cells[adj] for adj in address.adjacent if self.grid.cells[adj] not in addresses]
-                level.extend(extension)
-            level = set(level)
-            level = list(level)
-            addresses.extend(level)
-        return addresses
+        """Returns the cells of the neighborhood, in cell index order."""
+        cells = self.grid.cells
+        return [cells[cell_index] for cell_index in self.indices.tolist()]
 
     def update(self):
-        self.neighbors = [address.occupant for address in self.cell_addresses if address.occupied]
+        """Collects the units standing in the neighborhood from the occupancy index of the grid."""
+        self.neighbors = self.grid.occupancy.in_region(self.indices, self.grid.blueprint.layer_attributes['unit'])
+
+    @staticmethod
+    def batch(grid: Grid, foci: list, radius: int = 1, include_focus: bool = False) -> _np.ndarray:
+        """Returns the neighborhoods of many focus cells at once, for area effects and perception checks.
+
+        Args:
+            grid (Grid): The grid of the focus cells.
+            foci (list): The focus cells, as cells, designations or cell indices.
+            radius (int): The Chebyshev distance, in cells, of the farthest neighbors. Defaults to 1.
+            include_focus (bool): Whether each neighborhood includes its focus cell. Defaults to False.
+
+        Returns:
+            np.ndarray: An (M, S) array with a row of cell indices per focus cell; neighbors off the grid are -1.
+
+        Example:
+            ```python
+            rows = GridNeighborhood.batch(grid, [archer.cell, mage.cell], radius=3)
+            print(rows.shape)
+            # Output: (2, 48)
+            ```
+        """
+        cell_indices = [grid.cells[focus].cell_index for focus in foci]
+        return _neighborhoods(grid.blueprint.row_count, grid.blueprint.col_count, cell_indices, radius, include_focus)
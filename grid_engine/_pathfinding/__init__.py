@@ -0,0 +1,8 @@
+from ._result import PathResult, FOUND, UNREACHABLE, EXPANSION_LIMIT, COST_LIMIT
+from ._engine import PathEngine, octile_distance, shortest_path_tree, trace_path
+from ._batch import SharedCostGrid, solve_jobs
+from ._cache import PathCache
+from ._hierarchy import HierarchicalPathfinder
+from ._jps import JumpPointSearch
+from ._flow_field import FlowField
+from ._reachability import Reachability
@@ -0,0 +1,102 @@
+from __future__ import annotations
+
+import itertools
+from concurrent.futures import ProcessPoolExecutor
+from multiprocessing.shared_memory import SharedMemory
+from typing import Dict, List, Optional, Sequence, Tuple
+
+import numpy as np
+
+from ._engine import PathEngine, shortest_path_tree, _tree_paths
+
+# A source cell index and the target cell indices to find paths to from it.
+Job = Tuple[int, List[int]]
+
+
+class SharedCostGrid:
+    """
+    The neighbor table and cost grid of a path engine, copied into shared memory.
+
+    Worker processes attach to the shared blocks by name through `descriptor` instead of receiving a copy of the
+    arrays. Use it as a context manager; the shared memory is released on exit.
+    """
+
+    _ARRAYS = ('neighbors', 'enter_cost', 'leave_cost')
+
+    def __init__(self, engine: PathEngine) -> None:
+        self._blocks = []
+        self.descriptor: Dict[str, Tuple[str, tuple, str]] = {}
+        for name in self._ARRAYS:
+            array = np.ascontiguousarray(getattr(engine, name))
+            block = SharedMemory(create=True, size=max(array.nbytes, 1))
+            np.ndarray(array.shape, array.dtype, buffer=block.buf)[...] = array
+            self._blocks.append(block)
+            self.descriptor[name] = (block.name, array.shape, array.dtype.str)
+
+    def close(self) -> None:
+        """Releases the shared memory."""
+        for block in self._blocks:
+            block.close()
+            block.unlink()
+        self._blocks = []
+
+    def __enter__(self) -> SharedCostGrid:
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+
+def _solve_shared(descriptor: Dict[str, Tuple[str, tuple, str]], jobs: List[Job]) -> List[List[Optional[Tuple[List[int], float]]]]:
+    blocks = {name: SharedMemory(name=block_name) for name, (block_name, _, _) in descriptor.items()}
+    try:
+        arrays = {
+                name: np.ndarray(shape, np.dtype(dtype), buffer=blocks[name].buf)
+                for name, (_, shape, dtype) in descriptor.items()
+        }
+        size = len(arrays['neighbors'])
+        g_score = np.empty(size)
+        parent = np.empty(size, dtype=np.int32)
+        closed = np.empty(size, dtype=np.bool_)
+        results = []
+        for source, targets in jobs:
+            shortest_path_tree(
+                    arrays['neighbors'], arrays['enter_cost'], arrays['leave_cost'], g_score, parent, closed, source,
+                    targets
+            )
+            results.append(_tree_paths(g_score, parent, targets))
+        del arrays
+    finally:
+        for block in blocks.values():
+            block.close()
+    return results
+
+
+def solve_jobs(engine: PathEngine, jobs: Sequence[Job], workers: Optional[int] = None) -> List[List[Optional[Tuple[List[int], float]]]]:
+    """
+    Finds the paths of many single-source jobs, growing one Dijkstra tree per job.
+
+    Args:
+        engine (PathEngine): The engine whose cost grid is searched.
+        jobs (Sequence[Tuple[int, List[int]]]): The source cell index and target cell indices of every job.
+        workers (Optional[int]): The number of worker processes to share the jobs between. The cost grid is handed to
+            them through shared memory. Defaults to None, which solves the jobs in the current process.
+
+    Returns:
+        List[List[Optional[Tuple[List[int], float]]]]: For every job, the result of `PathEngine.paths_from`.
+
+    Example:
+        ```python
+        results = solve_jobs(grid.path_engine, [(0, [10, 20]), (5, [30])], workers=4)
+        print([len(paths) for paths in results])
+        # Output: [2, 1]
+        ```
+    """
+    jobs = list(jobs)
+    if workers is None or workers < 2 or len(jobs) < 2:
+        return [engine.paths_from(source, targets) for source, targets in jobs]
+    chunk_size = -(-len(jobs) // workers)
+    chunks = [jobs[i:i + chunk_size] for i in range(0, len(jobs), chunk_size)]
+    with SharedCostGrid(engine) as shared, ProcessPoolExecutor(max_workers=workers) as executor:
+        results = list(executor.map(_solve_shared, itertools.repeat(shared.descriptor), chunks))
+    return list(itertools.chain.from_iterable(results))
@@ -0,0 +1,120 @@
+from __future__ import annotations
+
+from collections import OrderedDict
+from typing import Dict, Hashable, List, Optional, Set, Tuple
+
+from ._engine import PathEngine
+
+# The key of a cached path: the start and goal cell indices and the cost profile the path was searched with.
+PathKey = Tuple[int, int, Hashable]
+CachedResult = Optional[Tuple[List[int], float]]
+
+_MISSING = object()
+
+
+class PathCache:
+    """
+    A least-recently-used cache of path search results, keyed by start, goal and cost profile.
+
+    The cache listens to the cost grid of a `PathEngine`. When a cell gets more expensive or impassable, only the
+    cached paths that pass through it are dropped, found through an index of cell to cached paths. When a cell gets
+    cheaper or passable, a cached path is only dropped if a path through that cell could beat it, which is decided
+    with the engine's admissible heuristic; unreachable results are always dropped.
+
+    Hits, misses, evictions (entries dropped because the cache is full) and invalidations are counted.
+    """
+
+    def __init__(self, engine: PathEngine, maxsize: int = 1024) -> None:
+        self.engine = engine
+        self.maxsize = maxsize
+        self._entries: OrderedDict[PathKey, CachedResult] = OrderedDict()
+        self._keys_by_cell: Dict[int, Set[PathKey]] = {}
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.invalidations = 0
+        engine.subscribe(self._on_cost_change)
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def __contains__(self, key: PathKey) -> bool:
+        return key in self._entries
+
+    @property
+    def stats(self) -> Dict[str, int]:
+        """The counters of the cache and its current size."""
+        return {
+                'hits':          self.hits,
+                'misses':        self.misses,
+                'evictions':     self.evictions,
+                'invalidations': self.invalidations,
+                'size':          len(self._entries),
+                'maxsize':       self.maxsize
+        }
+
+    def get(self, start: int, goal: int, profile: Hashable = None, default=_MISSING):
+        """Returns the cached result for a search, counting a hit or a miss. Returns `default` on a miss, or raises a
+        KeyError if no default is given."""
+        key = (start, goal, profile)
+        result = self._entries.get(key, _MISSING)
+        if result is _MISSING:
+            self.misses += 1
+            if default is _MISSING:
+                raise KeyError(key)
+            return default
+        self.hits += 1
+        self._entries.move_to_end(key)
+        return result
+
+    def put(self, start: int, goal: int, profile: Hashable, result: CachedResult) -> None:
+        """Caches the result of a search, evicting the least recently used entry if the cache is full."""
+        if self.maxsize <= 0:
+            return
+        key = (start, goal, profile)
+        if key in self._entries:
+            self._discard(key)
+        elif len(self._entries) >= self.maxsize:
+            self._discard(next(iter(self._entries)))
+            self.evictions += 1
+        self._entries[key] = result
+        if result is not None:
+            for cell_index in result[0]:
+                self._keys_by_cell.setdefault(cell_index, set()).add(key)
+
+    def clear(self) -> None:
+        """Drops every cached result. The counters are kept."""
+        self._entries.clear()
+        self._keys_by_cell.clear()
+
+    def invalidate_cell(self, cell_index: int, cheaper: bool = True) -> None:
+        """Drops the cached results that a change to the costs of a cell may have made wrong."""
+        for key in list(self._keys_by_cell.get(cell_index, ())):
+            self._discard(key)
+            self.invalidations += 1
+        if not cheaper:
+            return
+        engine = self.engine
+        for key, result in list(self._entries.items()):
+            start, goal, _ = key
+            if result is None or engine.heuristic(start, cell_index) + engine.heuristic(cell_index, goal) < result[1]:
+                self._discard(key)
+                self.invalidations += 1
+
+    def _discard(self, key: PathKey) -> None:
+        result = self._entries.pop(key)
+        if result is None:
+            return
+        for cell_index in result[0]:
+            keys = self._keys_by_cell.get(cell_index)
+            if keys is not None:
+                keys.discard(key)
+                if not keys:
+                    del self._keys_by_cell[cell_index]
+
+    def _on_cost_change(self, cell_index: Optional[int], cheaper: bool) -> None:
+        if cell_index is None:
+            self.invalidations += len(self._entries)
+            self.clear()
+        else:
+            self.invalidate_cell(cell_index, cheaper)
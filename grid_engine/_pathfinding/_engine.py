@@ -0,0 +1,436 @@
+from __future__ import annotations
+
+from heapq import heappush, heappop
+from typing import Callable, Iterable, List, Optional, Tuple
+
+import numpy as np
+
+from ._result import FOUND, UNREACHABLE, EXPANSION_LIMIT, COST_LIMIT
+
+_INF = float('inf')
+
+
+def octile_distance(row_delta: int, col_delta: int, straight: float, diagonal: float) -> float:
+    """
+    Returns the octile distance between two cells that are `row_delta` rows and `col_delta` columns apart, for
+    straight steps costing `straight` and diagonal steps costing `diagonal`.
+
+    Example:
+        ```python
+        print(octile_distance(3, 5, 1.0, 1.5))
+        # Output: 6.5
+        ```
+    """
+    row_delta, col_delta = abs(row_delta), abs(col_delta)
+    return straight * (row_delta + col_delta) + (diagonal - 2 * straight) * min(row_delta, col_delta)
+
+
+def shortest_path_tree(
+        neighbors: np.ndarray,
+        enter_cost: np.ndarray,
+        leave_cost: np.ndarray,
+        g_score: np.ndarray,
+        parent: np.ndarray,
+        closed: np.ndarray,
+        source: int,
+        targets: Optional[Iterable[int]] = None
+) -> int:
+    """
+    Grows a Dijkstra shortest-path tree from a cell over a cost grid.
+
+    The cost to reach every cell is written to `g_score` and its predecessor to `parent`; cells whose cost is final are
+    marked in `closed`. The three arrays are reset first. If `targets` are given, the tree stops growing as soon as the
+    cost of every target is final, otherwise it covers every reachable cell.
+
+    Args:
+        neighbors (np.ndarray): The (N, 8) neighbor table of the grid, with -1 for neighbors off the grid.
+        enter_cost (np.ndarray): The cost to enter every cell, `inf` for impassable cells.
+        leave_cost (np.ndarray): The cost to leave every cell.
+        g_score (np.ndarray): A float64 array of N entries that receives the cost to reach every cell.
+        parent (np.ndarray): An int32 array of N entries that receives the predecessor of every cell.
+        closed (np.ndarray): A bool array of N entries that receives the cells whose cost is final.
+        source (int): The cell index at the root of the tree.
+        targets (Optional[Iterable[int]]): The cell indices the tree has to reach. Defaults to every cell.
+
+    Returns:
+        int: The number of cells expanded.
+    """
+    g_score.fill(np.inf)
+    closed.fill(False)
+    g, parents, done = memoryview(g_score), memoryview(parent), memoryview(closed)
+    enter, leave = memoryview(enter_cost), memoryview(leave_cost)
+    neighbors = memoryview(neighbors.reshape(-1))
+    remaining = None if targets is None else set(targets)
+    g[source] = 0.0
+    parents[source] = -1
+    frontier = [(0.0, source)]
+    expansions = 0
+    while frontier:
+        cost, current = heappop(frontier)
+        if done[current]:
+            continue
+        done[current] = True
+        if remaining is not None:
+            remaining.discard(current)
+            if not remaining:
+                break
+        expansions += 1
+        base = cost + leave[current]
+        for next_step in neighbors[current * 8:current * 8 + 8]:
+            if next_step < 0:
+                continue
+            new_cost = base + enter[next_step]
+            if new_cost < g[next_step]:
+                g[next_step] = new_cost
+                parents[next_step] = current
+                heappush(frontier, (new_cost, next_step))
+    return expansions
+
+
+def trace_path(parent: np.ndarray, cell_index: int) -> List[int]:
+    """Returns the cell indices from the root of a search to a cell it reached, by following `parent`."""
+    path = [cell_index]
+    while parent[cell_index] >= 0:
+        cell_index = int(parent[cell_index])
+        path.append(cell_index)
+    path.reverse()
+    return path
+
+
+class PathEngine:
+    """
+    An A* engine that works on cell indices.
+
+    The engine keeps a flat cost grid of the cells of a `CellStore`: the cost to enter every cell (`inf` for
+    impassable cells) and the cost to leave it. Moving from one cell to an adjacent one costs the leave cost of the
+    first plus the enter cost of the second. The cost grid is kept up to date by subscribing to the store, so a change
+    to one cell is an O(1) update.
+
+    The g-scores and parents of a search are held in preallocated NumPy arrays that are reused by every search. The
+    heuristic is the octile distance to the goal, scaled by the cheapest step on the grid so that it never overestimates
+    the cost of a path. Every step, straight or diagonal, costs the same in this cost model, so the diagonal factor
+    equals the straight one. Ties between equal estimates are broken towards the cell closer to the goal.
+    """
+
+    def __init__(self, neighbors: np.ndarray, col_count: int, store) -> None:
+        self.neighbors = neighbors
+        self.col_count = col_count
+        self.store = store
+        size = len(neighbors)
+        self.g_score = np.full(size, np.inf)
+        self.parent = np.full(size, -1, dtype=np.int32)
+        self._closed = np.zeros(size, dtype=np.bool_)
+        self._backward = None
+        self.expansions = 0
+        self.status = FOUND
+        self._listeners: List[Callable[[Optional[int], bool], None]] = []
+        self.rebuild()
+        store.subscribe(self._on_store_change)
+
+    def subscribe(self, listener: Callable[[Optional[int], bool], None]) -> None:
+        """Registers a callable that is called with a cell index, and whether any of its costs dropped, whenever the
+        cost grid entries of that cell change. It is called with None after the whole cost grid is rebuilt."""
+        self._listeners.append(listener)
+
+    def unsubscribe(self, listener: Callable[[Optional[int], bool], None]) -> None:
+        """Removes a callable registered with `subscribe`."""
+        self._listeners.remove(listener)
+
+    def rebuild(self) -> None:
+        """Rebuilds the whole cost grid from the store."""
+        store = self.store
+        self.enter_cost = np.where(store.passable, store.cost_in, np.inf).astype(np.float64)
+        self.leave_cost = store.cost_out.astype(np.float64)
+        self._set_min_step()
+        for listener in self._listeners:
+            listener(None, True)
+
+    def _set_min_step(self) -> None:
+        passable = np.isfinite(self.enter_cost)
+        if passable.any():
+            self.min_step = max(float(self.leave_cost[passable].min() + self.enter_cost[passable].min()), 0.0)
+        else:
+            self.min_step = 0.0
+
+    def _on_store_change(self, column: str, index: int) -> None:
+        if column != 'terrain_id':
+            self.update_cell(index)
+
+    def update_cell(self, index: int) -> None:
+        """Updates the cost grid entries of one cell from the store."""
+        store = self.store
+        enter = float(store.cost_in[index]) if store.passable[index] else _INF
+        leave = float(store.cost_out[index])
+        old_enter, old_leave = float(self.enter_cost[index]), float(self.leave_cost[index])
+        if enter == old_enter and leave == old_leave:
+            return
+        self.enter_cost[index] = enter
+        self.leave_cost[index] = leave
+        if enter != _INF and enter + leave < self.min_step:
+            self._set_min_step()
+        cheaper = enter < old_enter or leave < old_leave
+        for listener in self._listeners:
+            listener(index, cheaper)
+
+    def edge_cost(self, current: int, next_step: int) -> float:
+        """Returns the cost to move from one cell to an adjacent one."""
+        return float(self.leave_cost[current] + self.enter_cost[next_step])
+
+    def heuristic(self, cell_index: int, goal: int) -> float:
+        """Returns the octile estimate of the cost of a path between two cells."""
+        row, col = divmod(cell_index, self.col_count)
+        goal_row, goal_col = divmod(goal, self.col_count)
+        return octile_distance(row - goal_row, col - goal_col, self.min_step, self.min_step)
+
+    def search(
+            self,
+            start: int,
+            goal: int,
+            goal_test: Optional[Callable[[int], bool]] = None,
+            max_expansions: Optional[int] = None,
+            max_cost: Optional[float] = None
+    ) -> Optional[Tuple[List[int], float]]:
+        """
+        Finds the cheapest path between two cells with A*.
+
+        Args:
+            start (int): The cell index to start from.
+            goal (int): The cell index to search towards.
+            goal_test (Optional[Callable[[int], bool]]): If given, the search also stops at the first cell expanded
+                for which it returns True, and the path to that cell is returned.
+            max_expansions (Optional[int]): The number of cells the search may expand before giving up. Defaults to
+                None, which does not limit the search.
+            max_cost (Optional[float]): The highest path cost to search for. Cells whose estimated path cost exceeds
+                it are never queued. Defaults to None, which does not limit the search.
+
+        Returns:
+            Optional[Tuple[List[int], float]]: The cell indices of the path, including `start`, and its cost, or None if
+                no path was found. The number of cells expanded is left in `expansions` and the reason the search
+                stopped in `status`: one of 'found', 'unreachable', 'expansion_limit' or 'cost_limit'.
+
+        Example:
+            ```python
+            path, cost = grid.path_engine.search(0, 2 * grid.blueprint.col_count + 2)
+            print(path, cost)
+            # Output: [0, 1001, 2002] 4.0
+            ```
+        """
+        g_array, parent_array, closed_array = self.g_score, self.parent, self._closed
+        g_array.fill(np.inf)
+        closed_array.fill(False)
+        g, parent, closed = memoryview(g_array), memoryview(parent_array), memoryview(closed_array)
+        enter, leave = memoryview(self.enter_cost), memoryview(self.leave_cost)
+        neighbors = memoryview(self.neighbors.reshape(-1))
+        col_count = self.col_count
+        goal_row, goal_col = divmod(goal, col_count)
+        step = self.min_step
+        limit = -1 if max_expansions is None else max_expansions
+        bound = _INF if max_cost is None else max_cost
+        g[start] = 0.0
+        parent[start] = -1
+        frontier = [(0.0, 0.0, start)]
+        expansions = 0
+        found = None
+        status = UNREACHABLE
+        while frontier:
+            _, _, current = heappop(frontier)
+            if closed[current]:
+                continue
+            if current == goal or (goal_test is not None and goal_test(current)):
+                found = current
+                break
+            if expansions == limit:
+                status = EXPANSION_LIMIT
+                break
+            closed[current] = True
+            expansions += 1
+            base = g[current] + leave[current]
+            for next_step in neighbors[current * 8:current * 8 + 8]:
+                if next_step < 0:
+                    continue
+                new_cost = base + enter[next_step]
+                if new_cost < g[next_step]:
+                    g[next_step] = new_cost
+                    parent[next_step] = current
+                    row_delta, col_delta = divmod(next_step, col_count)
+                    row_delta = row_delta - goal_row if row_delta > goal_row else goal_row - row_delta
+                    col_delta = col_delta - goal_col if col_delta > goal_col else goal_col - col_delta
+                    estimate = step * (row_delta if row_delta > col_delta else col_delta)
+                    if new_cost + estimate > bound:
+                        status = COST_LIMIT
+                        continue
+                    heappush(frontier, (new_cost + estimate, estimate, next_step))
+        self.expansions = expansions
+        if found is None:
+            self.status = status
+            return None
+        self.status = FOUND
+        return self.reconstruct(found), g[found]
+
+    def bidirectional_search(
+            self,
+            start: int,
+            goal: int,
+            max_expansions: Optional[int] = None,
+            max_cost: Optional[float] = None
+    ) -> Optional[Tuple[List[int], float]]:
+        """
+        Finds the cheapest path between two cells with A* searches grown from both ends at once.
+
+        The forward search estimates the cost to the goal and the backward search the cost to the start, and the side
+        with the smaller frontier is expanded next. Every time a search reaches a cell the other has reached, the
+        cheapest path through that cell is recorded, and the searches stop once neither frontier can lead to a cheaper
+        path. Long paths are found after expanding far fewer cells than `search` needs, since the two searches only
+        have to cover about half of the distance each.
+
+        Args:
+            start (int): The cell index to start from.
+            goal (int): The cell index to reach.
+            max_expansions (Optional[int]): The number of cells the two searches may expand together before giving up.
+                Defaults to None, which does not limit the search.
+            max_cost (Optional[float]): The highest path cost to search for. Defaults to None, which does not limit the
+                search.
+
+        Returns:
+            Optional[Tuple[List[int], float]]: As for `search`. The number of cells expanded is left in `expansions`
+                and the reason the search stopped in `status`.
+
+        Example:
+            ```python
+            path, cost = grid.path_engine.bidirectional_search(0, len(grid.cells) - 1)
+            print(cost, grid.path_engine.expansions)
+            # Output: 1998.0 1412
+            ```
+        """
+        if start == goal:
+            self.expansions = 0
+            self.status = FOUND
+            return [start], 0.0
+        if self._backward is None:
+            size = len(self.neighbors)
+            self._backward = (np.empty(size), np.empty(size, dtype=np.int32), np.empty(size, dtype=np.bool_))
+        g_forward_array, g_backward_array = self.g_score, self._backward[0]
+        for array in (g_forward_array, g_backward_array):
+            array.fill(np.inf)
+        for array in (self._closed, self._backward[2]):
+            array.fill(False)
+        g_forward, g_backward = memoryview(g_forward_array), memoryview(g_backward_array)
+        parent, child = memoryview(self.parent), memoryview(self._backward[1])
+        closed_forward, closed_backward = memoryview(self._closed), memoryview(self._backward[2])
+        enter, leave = memoryview(self.enter_cost), memoryview(self.leave_cost)
+        neighbors = memoryview(self.neighbors.reshape(-1))
+        col_count = self.col_count
+        start_row, start_col = divmod(start, col_count)
+        goal_row, goal_col = divmod(goal, col_count)
+        step = self.min_step
+        limit = -1 if max_expansions is None else max_expansions
+        bound = _INF if max_cost is None else max_cost
+        g_forward[start] = 0.0
+        g_backward[goal] = 0.0
+        parent[start] = -1
+        child[goal] = -1
+        forward = [(0.0, start)]
+        backward = [(0.0, goal)]
+        best, meeting = _INF, -1
+        expansions = 0
+        status = UNREACHABLE
+        while forward and backward:
+            if forward[0][0] >= best or backward[0][0] >= best:
+                break
+            if expansions == limit:
+                status = EXPANSION_LIMIT
+                break
+            if len(forward) <= len(backward):
+                _, current = heappop(forward)
+                if closed_forward[current]:
+                    continue
+                closed_forward[current] = True
+                expansions += 1
+                base = g_forward[current] + leave[current]
+                for next_step in neighbors[current * 8:current * 8 + 8]:
+                    if next_step < 0:
+                        continue
+                    new_cost = base + enter[next_step]
+                    if new_cost < g_forward[next_step]:
+                        g_forward[next_step] = new_cost
+                        parent[next_step] = current
+                        through = new_cost + g_backward[next_step]
+                        if through < best:
+                            best, meeting = through, next_step
+                        row, col = divmod(next_step, col_count)
+                        row = row - goal_row if row > goal_row else goal_row - row
+                        col = col - goal_col if col > goal_col else goal_col - col
+                        estimate = new_cost + step * (row if row > col else col)
+                        if estimate > bound:
+                            status = COST_LIMIT
+                            continue
+                        heappush(forward, (estimate, next_step))
+            else:
+                _, current = heappop(backward)
+                if closed_backward[current]:
+                    continue
+                closed_backward[current] = True
+                expansions += 1
+                base = g_backward[current] + enter[current]
+                for previous in neighbors[current * 8:current * 8 + 8]:
+                    if previous < 0:
+                        continue
+                    new_cost = base + leave[previous]
+                    if new_cost < g_backward[previous]:
+                        g_backward[previous] = new_cost
+                        child[previous] = current
+                        through = new_cost + g_forward[previous]
+                        if through < best:
+                            best, meeting = through, previous
+                        if enter[previous] == _INF and previous != start:
+                            continue
+                        row, col = divmod(previous, col_count)
+                        row = row - start_row if row > start_row else start_row - row
+                        col = col - start_col if col > start_col else start_col - col
+                        estimate = new_cost + step * (row if row > col else col)
+                        if estimate > bound:
+                            status = COST_LIMIT
+                            continue
+                        heappush(backward, (estimate, previous))
+        self.expansions = expansions
+        if meeting < 0 or best > bound or status == EXPANSION_LIMIT:
+            self.status = COST_LIMIT if meeting >= 0 and best > bound else status
+            return None
+        self.status = FOUND
+        path = trace_path(self.parent, meeting)
+        cell_index = child[meeting]
+        while cell_index >= 0:
+            path.append(cell_index)
+            cell_index = child[cell_index]
+        return path, best
+
+    def reconstruct(self, cell_index: int) -> List[int]:
+        """Returns the path from the start of the last search to a cell it reached, following the parent array."""
+        return trace_path(self.parent, cell_index)
+
+    def paths_from(self, source: int, targets: Iterable[int]) -> List[Optional[Tuple[List[int], float]]]:
+        """
+        Finds the cheapest paths from one cell to many with a single Dijkstra tree.
+
+        Args:
+            source (int): The cell index to start from.
+            targets (Iterable[int]): The cell indices to find paths to.
+
+        Returns:
+            List[Optional[Tuple[List[int], float]]]: For every target, the cell indices of the path, including `source`,
+                and its cost, or None if no path of finite cost exists.
+        """
+        targets = list(targets)
+        self.expansions = shortest_path_tree(
+                self.neighbors, self.enter_cost, self.leave_cost, self.g_score, self.parent, self._closed, source,
+                targets
+        )
+        return _tree_paths(self.g_score, self.parent, targets)
+
+
+def _tree_paths(g_score: np.ndarray, parent: np.ndarray, targets: List[int]) -> List[Optional[Tuple[List[int], float]]]:
+    paths = []
+    for target in targets:
+        cost = float(g_score[target])
+        paths.append(None if cost == _INF else (trace_path(parent, target), cost))
+    return paths
@@ -0,0 +1,168 @@
+from __future__ import annotations
+
+from typing import Iterable, List, Optional, Set
+
+import numpy as np
+
+from ._engine import PathEngine
+
+_INF = float('inf')
+
+
+def _relax(
+        neighbors: np.ndarray,
+        enter_cost: np.ndarray,
+        leave_cost: np.ndarray,
+        cost: np.ndarray,
+        next_cell: np.ndarray,
+        active: np.ndarray,
+        max_cost: float
+) -> None:
+    """
+    Lowers the cost to the goal of the cells around `active` until no cost can be lowered further.
+
+    Every round relaxes, at once, the moves from each neighbor of the active cells into the active cell, and the cells
+    whose cost dropped become the next round's active cells. Costs above `max_cost` are left at `inf`.
+    """
+    while active.size:
+        into = np.repeat(active, 8)
+        cells = neighbors[active].ravel()
+        on_grid = cells >= 0
+        into, cells = into[on_grid], cells[on_grid]
+        candidate = leave_cost[cells] + enter_cost[into] + cost[into]
+        better = (candidate < cost[cells]) & (candidate <= max_cost)
+        into, cells, candidate = into[better], cells[better], candidate[better]
+        if not cells.size:
+            return
+        np.minimum.at(cost, cells, candidate)
+        best = candidate == cost[cells]
+        next_cell[cells[best]] = into[best]
+        active = np.unique(cells)
+
+
+class FlowField:
+    """
+    The cost to reach one goal cell from every cell of a grid, and the next cell to step to on the way.
+
+    The field is computed over the cost grid of a `PathEngine` by relaxing whole wavefronts of cells at once with NumPy,
+    which gives the same costs as a Dijkstra search from the goal. Agents sharing the goal sample the field in O(1) per
+    step with `next_step`, instead of each searching for a path.
+
+    The field listens to the engine's cost grid. When cells change, only the cells whose way to the goal ran through a
+    changed cell are recomputed, the next time the field is sampled or when `repair` is called. Call `close` once the
+    field is no longer needed so that it stops listening.
+    """
+
+    def __init__(self, engine: PathEngine, goal: int, max_cost: Optional[float] = None) -> None:
+        self.engine = engine
+        self.goal = goal
+        self.max_cost = _INF if max_cost is None else float(max_cost)
+        self._pending: Set[int] = set()
+        self._directions = None
+        self._compute()
+        engine.subscribe(self._on_cost_change)
+
+    def _compute(self) -> None:
+        size = len(self.engine.neighbors)
+        self.cost = np.full(size, np.inf)
+        self.next_cell = np.full(size, -1, dtype=np.int32)
+        self.cost[self.goal] = 0.0
+        self._relax(np.array([self.goal]))
+        self._directions = None
+
+    def _relax(self, active: np.ndarray) -> None:
+        engine = self.engine
+        _relax(engine.neighbors, engine.enter_cost, engine.leave_cost, self.cost, self.next_cell, active, self.max_cost)
+
+    def _on_cost_change(self, cell_index: Optional[int], cheaper: bool) -> None:
+        self._pending.add(-1 if cell_index is None else cell_index)
+
+    def close(self) -> None:
+        """Stops listening to changes to the engine's cost grid."""
+        self.engine.unsubscribe(self._on_cost_change)
+
+    @property
+    def directions(self) -> np.ndarray:
+        """The direction of the next step from every cell, as an index into the neighbor order of the grid (up-left,
+        up, up-right, right, down-right, down, down-left, left), or -1 where there is no next step."""
+        self._repair_pending()
+        if self._directions is None:
+            matches = self.engine.neighbors == self.next_cell[:, None]
+            self._directions = np.where(self.next_cell >= 0, matches.argmax(axis=1), -1).astype(np.int8)
+        return self._directions
+
+    def next_step(self, cell_index: int) -> Optional[int]:
+        """Returns the cell to step to from a cell, or None at the goal or where the goal cannot be reached."""
+        self._repair_pending()
+        next_cell = int(self.next_cell[cell_index])
+        return None if next_cell < 0 else next_cell
+
+    def cost_to_goal(self, cell_index: int) -> float:
+        """Returns the cost of the cheapest path from a cell to the goal, or inf if there is none."""
+        self._repair_pending()
+        return float(self.cost[cell_index])
+
+    def path_from(self, cell_index: int) -> Optional[List[int]]:
+        """Returns the cell indices of the path from a cell to the goal, including both, or None if there is none."""
+        self._repair_pending()
+        if self.cost[cell_index] == np.inf:
+            return None
+        path = [cell_index]
+        next_cell = self.next_cell
+        while path[-1] != self.goal:
+            path.append(int(next_cell[path[-1]]))
+        return path
+
+    def _repair_pending(self) -> None:
+        if self._pending:
+            self.repair()
+
+    def repair(self, cells: Optional[Iterable[int]] = None) -> None:
+        """
+        Brings the field up to date after the costs of some cells changed.
+
+        The cells whose way to the goal runs through a changed cell are found by walking the tree of next steps
+        backwards from the changed cells. Their costs are cleared and recomputed from the cells around them, together
+        with any cell that a cheaper changed cell now offers a better way to.
+
+        Args:
+            cells (Optional[Iterable[int]]): The cells that changed. Defaults to the changes reported by the engine
+                since the field was last brought up to date.
+        """
+        changed = self._pending if cells is None else set(cells) | self._pending
+        self._pending = set()
+        if not changed:
+            return
+        if -1 in changed:
+            self._compute()
+            return
+        changed = np.fromiter(changed, dtype=np.int64)
+        affected = self._descendants(changed)
+        self.cost[affected] = np.inf
+        self.next_cell[affected] = -1
+        self.cost[self.goal] = 0.0
+        neighbors = self.engine.neighbors
+        around = neighbors[np.concatenate((affected, changed))].ravel()
+        sources = np.unique(np.concatenate((around[around >= 0], changed, [self.goal])))
+        self._relax(sources[np.isfinite(self.cost[sources])])
+        self._directions = None
+
+    def _descendants(self, cells: np.ndarray) -> np.ndarray:
+        """Returns `cells` and every cell whose chain of next steps passes through one of them."""
+        order = np.argsort(self.next_cell, kind='stable')
+        sorted_next = self.next_cell[order]
+        found = np.zeros(len(self.next_cell), dtype=np.bool_)
+        found[cells] = True
+        frontier = cells
+        while frontier.size:
+            starts = np.searchsorted(sorted_next, frontier, side='left')
+            stops = np.searchsorted(sorted_next, frontier, side='right')
+            counts = stops - starts
+            if not counts.sum():
+                break
+            offsets = np.repeat(starts - np.concatenate(([0], np.cumsum(counts)[:-1])), counts)
+            children = order[np.arange(counts.sum()) + offsets]
+            children = children[~found[children]]
+            found[children] = True
+            frontier = children
+        return np.flatnonzero(found)
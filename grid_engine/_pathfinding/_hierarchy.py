@@ -0,0 +1,355 @@
+from __future__ import annotations
+
+from heapq import heappush, heappop
+from typing import Dict, Iterable, List, Optional, Set, Tuple
+
+import numpy as np
+
+from ._engine import PathEngine
+
+_INF = float('inf')
+
+# Border runs of open crossings this long or longer get a transition at each end instead of one in the middle.
+_LONG_ENTRANCE = 6
+
+
+class HierarchicalPathfinder:
+    """
+    Hierarchical pathfinding (HPA*) over square clusters of cells.
+
+    The grid is split into clusters of `cluster_size` by `cluster_size` cells, the generalisation of the blueprint's
+    quadrants to NxN tiles. Where two side by side clusters share a run of open crossings, an entrance is made of a pair
+    of cells, one on each side; those cells are the nodes of an abstract graph. Entrance cells of the same cluster are
+    joined by the cost of the cheapest path between them inside the cluster. A long query is answered on the abstract
+    graph first and then refined into cells with short searches, each bounded by one cluster.
+
+    Entrances are found for the whole grid up front with array operations. Distances inside a cluster are computed the
+    first time a search reaches that cluster, or for every cluster at once with `precompute`. When a cell changes
+    passability or cost, its cluster is marked dirty and its entrances and those of its neighbors are rebuilt before
+    the next search.
+
+    Paths are near-optimal: they are the cheapest path through the chosen entrances, not always the cheapest path.
+    """
+
+    def __init__(self, engine: PathEngine, row_count: int, col_count: int, cluster_size: int = 16) -> None:
+        self.engine = engine
+        self.row_count = row_count
+        self.col_count = col_count
+        self.cluster_size = cluster_size
+        self.cluster_rows = -(-row_count // cluster_size)
+        self.cluster_cols = -(-col_count // cluster_size)
+        self._borders: Dict[Tuple[int, int], List[Tuple[int, int]]] = {}
+        self._inter: Dict[int, Dict[int, float]] = {}
+        self._nodes: Dict[int, Set[int]] = {}
+        self._intra: Dict[int, Dict[int, Dict[int, float]]] = {}
+        self._dirty: Set[int] = set()
+        self.expansions = 0
+        for cluster in range(self.cluster_count):
+            for other in self._neighbor_clusters(cluster):
+                if other > cluster:
+                    self._build_border(cluster, other)
+        engine.subscribe(self._on_cost_change)
+
+    @property
+    def cluster_count(self) -> int:
+        """The number of clusters."""
+        return self.cluster_rows * self.cluster_cols
+
+    @property
+    def node_count(self) -> int:
+        """The number of entrance cells in the abstract graph."""
+        return len(self._inter)
+
+    def cluster_of(self, cell_index: int) -> int:
+        """Returns the cluster of a cell."""
+        row, col = divmod(cell_index, self.col_count)
+        return (row // self.cluster_size) * self.cluster_cols + col // self.cluster_size
+
+    def cluster_bounds(self, cluster: int) -> Tuple[int, int, int, int]:
+        """Returns the first row, last row plus one, first column and last column plus one of a cluster."""
+        cluster_row, cluster_col = divmod(cluster, self.cluster_cols)
+        size = self.cluster_size
+        return (
+                cluster_row * size, min((cluster_row + 1) * size, self.row_count),
+                cluster_col * size, min((cluster_col + 1) * size, self.col_count)
+        )
+
+    def cluster_nodes(self, cluster: int) -> Set[int]:
+        """Returns the entrance cells of a cluster."""
+        self._flush()
+        return set(self._nodes.get(cluster, ()))
+
+    def precompute(self) -> None:
+        """Computes the distances between the entrances of every cluster."""
+        self._flush()
+        for cluster in range(self.cluster_count):
+            self._intra_edges(cluster)
+
+    def mark_dirty(self, cell_index: Optional[int] = None) -> None:
+        """Marks the cluster of a cell, or every cluster if no cell is given, for rebuilding before the next search."""
+        if cell_index is None:
+            self._dirty.update(range(self.cluster_count))
+        else:
+            self._dirty.add(self.cluster_of(cell_index))
+
+    def _on_cost_change(self, cell_index: Optional[int], cheaper: bool) -> None:
+        self.mark_dirty(cell_index)
+
+    def _flush(self) -> None:
+        if not self._dirty:
+            return
+        affected = set()
+        for cluster in self._dirty:
+            affected.update(self._build_borders(cluster))
+        for cluster in affected:
+            self._intra.pop(cluster, None)
+        self._dirty.clear()
+
+    def _neighbor_clusters(self, cluster: int) -> List[int]:
+        cluster_row, cluster_col = divmod(cluster, self.cluster_cols)
+        neighbors = []
+        if cluster_col > 0:
+            neighbors.append(cluster - 1)
+        if cluster_col < self.cluster_cols - 1:
+            neighbors.append(cluster + 1)
+        if cluster_row > 0:
+            neighbors.append(cluster - self.cluster_cols)
+        if cluster_row < self.cluster_rows - 1:
+            neighbors.append(cluster + self.cluster_cols)
+        return neighbors
+
+    def _build_borders(self, cluster: int) -> Set[int]:
+        """Rebuilds the entrances on every border of a cluster and returns the clusters whose entrances changed."""
+        affected = {cluster}
+        for other in self._neighbor_clusters(cluster):
+            self._build_border(min(cluster, other), max(cluster, other))
+            affected.add(other)
+        return affected
+
+    def _build_border(self, cluster_a: int, cluster_b: int) -> None:
+        for cell_a, cell_b in self._borders.pop((cluster_a, cluster_b), ()):
+            self._unlink(cell_a, cell_b)
+        transitions = self._find_transitions(cluster_a, cluster_b)
+        for cell_a, cell_b in transitions:
+            self._link(cell_a, cell_b)
+        self._borders[cluster_a, cluster_b] = transitions
+
+    def _find_transitions(self, cluster_a: int, cluster_b: int) -> List[Tuple[int, int]]:
+        """Returns the transition cell pairs across the border between two side by side clusters, `cluster_a` being
+        the one to the left of or above `cluster_b`."""
+        row_start, row_stop, col_start, col_stop = self.cluster_bounds(cluster_a)
+        col_count = self.col_count
+        if cluster_b == cluster_a + 1 and cluster_b % self.cluster_cols:
+            along = np.arange(row_start, row_stop)
+            side_a = along * col_count + col_stop - 1
+            step = 1
+        else:
+            along = np.arange(col_start, col_stop)
+            side_a = (row_stop - 1) * col_count + along
+            step = col_count
+        side_b = side_a + step
+        open_a = np.isfinite(self.engine.enter_cost[side_a])
+        open_b = np.isfinite(self.engine.enter_cost[side_b])
+        straight = open_a & open_b
+        transitions = []
+        runs = np.flatnonzero(np.diff(np.concatenate(([0], straight.astype(np.int8), [0]))))
+        for first, stop in zip(runs[::2].tolist(), runs[1::2].tolist()):
+            if stop - first >= _LONG_ENTRANCE:
+                transitions.append((int(side_a[first]), int(side_b[first])))
+                transitions.append((int(side_a[stop - 1]), int(side_b[stop - 1])))
+            else:
+                middle = (first + stop - 1) // 2
+                transitions.append((int(side_a[middle]), int(side_b[middle])))
+        # Diagonal crossings between positions that have no straight crossing.
+        lone = ~(straight[:-1] | straight[1:])
+        for position in np.flatnonzero(lone & open_a[:-1] & open_b[1:]).tolist():
+            transitions.append((int(side_a[position]), int(side_b[position + 1])))
+        for position in np.flatnonzero(lone & open_a[1:] & open_b[:-1]).tolist():
+            transitions.append((int(side_a[position + 1]), int(side_b[position])))
+        return transitions
+
+    def _link(self, cell_a: int, cell_b: int) -> None:
+        engine = self.engine
+        self._inter.setdefault(cell_a, {})[cell_b] = engine.edge_cost(cell_a, cell_b)
+        self._inter.setdefault(cell_b, {})[cell_a] = engine.edge_cost(cell_b, cell_a)
+        self._nodes.setdefault(self.cluster_of(cell_a), set()).add(cell_a)
+        self._nodes.setdefault(self.cluster_of(cell_b), set()).add(cell_b)
+
+    def _unlink(self, cell_a: int, cell_b: int) -> None:
+        for cell, other in ((cell_a, cell_b), (cell_b, cell_a)):
+            edges = self._inter.get(cell)
+            if edges is None:
+                continue
+            edges.pop(other, None)
+            if not edges:
+                del self._inter[cell]
+                self._nodes[self.cluster_of(cell)].discard(cell)
+
+    def _intra_edges(self, cluster: int) -> Dict[int, Dict[int, float]]:
+        intra = self._intra.get(cluster)
+        if intra is None:
+            nodes = self._nodes.get(cluster, set())
+            bounds = self.cluster_bounds(cluster)
+            intra = self._intra[cluster] = {
+                    node: {
+                            other: cost
+                            for other, cost in self._local_costs(node, bounds, nodes).items() if other != node
+                    }
+                    for node in nodes
+            }
+        return intra
+
+    def _local_costs(
+            self,
+            source: int,
+            bounds: Tuple[int, int, int, int],
+            targets: Iterable[int],
+            reverse: bool = False
+    ) -> Dict[int, float]:
+        """Returns the cost from a cell to each target it reaches without leaving the given bounds. With `reverse`, the
+        costs are those from each target to the cell."""
+        return self._local_search(source, bounds, targets, reverse)[0]
+
+    def _local_search(
+            self,
+            source: int,
+            bounds: Tuple[int, int, int, int],
+            targets: Iterable[int],
+            reverse: bool = False
+    ) -> Tuple[Dict[int, float], Dict[int, int]]:
+        """Runs Dijkstra from a cell without leaving the given bounds until every target is reached, and returns the
+        cost of each target reached and the parent of every cell reached."""
+        row_start, row_stop, col_start, col_stop = bounds
+        col_count = self.col_count
+        enter, leave = memoryview(self.engine.enter_cost), memoryview(self.engine.leave_cost)
+        neighbors = memoryview(self.engine.neighbors.reshape(-1))
+        remaining = set(targets)
+        costs = {}
+        g = {source: 0.0}
+        parent = {source: -1}
+        done = set()
+        frontier = [(0.0, source)]
+        while frontier and remaining:
+            cost, current = heappop(frontier)
+            if current in done:
+                continue
+            done.add(current)
+            self.expansions += 1
+            if current in remaining:
+                remaining.discard(current)
+                costs[current] = cost
+            for next_step in neighbors[current * 8:current * 8 + 8]:
+                if next_step < 0 or next_step in done:
+                    continue
+                row, col = divmod(next_step, col_count)
+                if not (row_start <= row < row_stop and col_start <= col < col_stop):
+                    continue
+                if reverse:
+                    new_cost = cost + leave[next_step] + enter[current]
+                else:
+                    new_cost = cost + leave[current] + enter[next_step]
+                if new_cost < g.get(next_step, _INF):
+                    g[next_step] = new_cost
+                    parent[next_step] = current
+                    heappush(frontier, (new_cost, next_step))
+        return costs, parent
+
+    def search(self, start: int, goal: int) -> Optional[Tuple[List[int], float]]:
+        """
+        Finds a path between two cells through the abstract graph and refines it into cells.
+
+        Cells in the same or adjacent clusters are searched directly by the path engine. If the abstract graph holds no
+        route between the cells, the path engine is used as well, so a path is found whenever one exists.
+
+        Args:
+            start (int): The cell index to start from.
+            goal (int): The cell index to reach.
+
+        Returns:
+            Optional[Tuple[List[int], float]]: The cell indices of the path, including `start`, and its cost, or None if
+                no path of finite cost exists.
+
+        Example:
+            ```python
+            path, cost = grid.path_hierarchy.search(0, len(grid.cells) - 1)
+            print(path[0], path[-1])
+            # Output: 0 99999
+            ```
+        """
+        self._flush()
+        self.expansions = 0
+        start_cluster, goal_cluster = self.cluster_of(start), self.cluster_of(goal)
+        start_row, start_col = divmod(start_cluster, self.cluster_cols)
+        goal_row, goal_col = divmod(goal_cluster, self.cluster_cols)
+        if max(abs(start_row - goal_row), abs(start_col - goal_col)) <= 1:
+            return self._direct(start, goal)
+        abstract_path = self._abstract_search(start, goal, start_cluster, goal_cluster)
+        if abstract_path is None:
+            return self._direct(start, goal)
+        return self._refine(abstract_path) or self._direct(start, goal)
+
+    def _direct(self, start: int, goal: int) -> Optional[Tuple[List[int], float]]:
+        result = self.engine.search(start, goal)
+        self.expansions += self.engine.expansions
+        return result
+
+    def _abstract_search(self, start: int, goal: int, start_cluster: int, goal_cluster: int) -> Optional[List[int]]:
+        start_nodes = self._nodes.get(start_cluster, set())
+        goal_nodes = self._nodes.get(goal_cluster, set())
+        start_edges = self._local_costs(start, self.cluster_bounds(start_cluster), start_nodes)
+        goal_edges = self._local_costs(goal, self.cluster_bounds(goal_cluster), goal_nodes, reverse=True)
+        if not start_edges or not goal_edges:
+            return None
+        heuristic = self.engine.heuristic
+        g = {start: 0.0}
+        parent = {start: None}
+        done = set()
+        frontier = [(heuristic(start, goal), start)]
+        while frontier:
+            _, current = heappop(frontier)
+            if current in done:
+                continue
+            if current == goal:
+                path = []
+                while current is not None:
+                    path.append(current)
+                    current = parent[current]
+                path.reverse()
+                return path
+            done.add(current)
+            if current == start:
+                edges = start_edges.items()
+            else:
+                edges = list(self._intra_edges(self.cluster_of(current)).get(current, {}).items())
+                edges.extend(self._inter.get(current, {}).items())
+                if current in goal_edges:
+                    edges.append((goal, goal_edges[current]))
+            base = g[current]
+            for next_node, cost in edges:
+                new_cost = base + cost
+                if new_cost < g.get(next_node, _INF):
+                    g[next_node] = new_cost
+                    parent[next_node] = current
+                    heappush(frontier, (new_cost + heuristic(next_node, goal), next_node))
+        return None
+
+    def _refine(self, abstract_path: List[int]) -> Optional[Tuple[List[int], float]]:
+        """Expands an abstract path into cells. Every abstract edge either crosses a border between two adjacent cells
+        or stays inside one cluster, so each is refined with a search bounded by that cluster."""
+        engine = self.engine
+        path = [abstract_path[0]]
+        total = 0.0
+        for node, next_node in zip(abstract_path, abstract_path[1:]):
+            if next_node in engine.neighbors[node]:
+                path.append(next_node)
+                total += engine.edge_cost(node, next_node)
+                continue
+            costs, parent = self._local_search(node, self.cluster_bounds(self.cluster_of(node)), (next_node,))
+            if next_node not in costs:
+                return None
+            segment = [next_node]
+            while parent[segment[-1]] != node:
+                segment.append(parent[segment[-1]])
+            path.extend(reversed(segment))
+            total += costs[next_node]
+        return path, total
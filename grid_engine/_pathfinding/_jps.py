@@ -0,0 +1,288 @@
+from __future__ import annotations
+
+from heapq import heappush, heappop
+from typing import List, Optional, Tuple
+
+import numpy as np
+
+from ._engine import PathEngine
+
+_INF = float('inf')
+
+# The eight directions as (row step, column step), in the order of the rows of the jump distance table.
+_DIRECTIONS = ((-1, -1), (-1, 0), (-1, 1), (0, 1), (1, 1), (1, 0), (1, -1), (0, -1))
+_DIRECTION_INDEX = {direction: i for i, direction in enumerate(_DIRECTIONS)}
+
+
+def _shift(padded: np.ndarray, row_step: int, col_step: int) -> np.ndarray:
+    """Returns the value of the cell `row_step` rows and `col_step` columns away from every cell, from an array padded
+    with one cell of False on every side."""
+    rows, cols = padded.shape[0] - 2, padded.shape[1] - 2
+    return padded[1 + row_step:1 + row_step + rows, 1 + col_step:1 + col_step + cols]
+
+
+def _orient(array: np.ndarray, row_step: int, col_step: int, inverse: bool = False) -> np.ndarray:
+    """Flips and transposes a grid array so that the given direction points right (straight) or down-right
+    (diagonal), or undoes that with `inverse`."""
+    if row_step and col_step:
+        return array[::row_step, ::col_step]
+    if row_step:
+        return array.T[::row_step] if inverse else array[::row_step].T
+    return array[:, ::col_step]
+
+
+def _straight_distances(free: np.ndarray, stops: np.ndarray) -> np.ndarray:
+    """
+    Returns the jump distance to the right of every cell: the number of steps to the first stop cell if no blocked
+    cell comes before it, otherwise minus the number of free cells before the first blocked one.
+    """
+    rows, cols = free.shape
+    events = np.where(~free | stops, np.arange(cols), cols)
+    next_event = np.minimum.accumulate(events[:, ::-1], axis=1)[:, ::-1]
+    next_event = np.concatenate((next_event[:, 1:], np.full((rows, 1), cols)), axis=1)
+    steps = next_event - np.arange(cols)
+    padded_stops = np.concatenate((stops & free, np.zeros((rows, 1), dtype=bool)), axis=1)
+    is_stop = np.take_along_axis(padded_stops, next_event, axis=1)
+    return np.where(is_stop, steps, 1 - steps).astype(np.int32)
+
+
+def _diagonal_distances(free: np.ndarray, stops: np.ndarray) -> np.ndarray:
+    """Returns the jump distance down and to the right of every cell, in the encoding of `_straight_distances`."""
+    rows, cols = free.shape
+    distances = np.zeros((rows, cols), dtype=np.int32)
+    below = np.zeros(cols, dtype=np.int32)
+    for row in range(rows - 2, -1, -1):
+        next_free = free[row + 1, 1:]
+        next_stop = stops[row + 1, 1:]
+        next_distance = below[1:]
+        distances[row, :-1] = np.where(
+                ~next_free, 0, np.where(next_stop, 1, np.where(next_distance > 0, next_distance + 1, next_distance - 1))
+        )
+        below = distances[row]
+    return distances
+
+
+class JumpPointSearch:
+    """
+    Jump Point Search (JPS+) over the uniform-cost regions of a grid, with weighted A* everywhere else.
+
+    The most common pair of enter and leave costs among passable cells defines the uniform cells; every step between
+    two of them costs the same, straight or diagonal. For every uniform cell and each of the eight directions, the
+    distance to the next jump point (a cell with a forced neighbor or next to a non-uniform passable cell) or to the
+    next blocked cell is precomputed with array operations. A search then crosses open regions in a handful of
+    expansions, looking each jump up in O(1). Non-uniform cells are expanded like plain A*, one step to each neighbor at
+    its own cost. For the pruning rules, non-uniform cells count as blocked, and diagonal moves may cut corners as in
+    the rest of the engine.
+
+    When the engine's cost grid changes, the jump distances are recomputed before the next search.
+    """
+
+    def __init__(self, engine: PathEngine, row_count: int, col_count: int) -> None:
+        self.engine = engine
+        self.row_count = row_count
+        self.col_count = col_count
+        self.expansions = 0
+        self._dirty = True
+        engine.subscribe(self._on_cost_change)
+
+    def _on_cost_change(self, cell_index: Optional[int], cheaper: bool) -> None:
+        self._dirty = True
+
+    def rebuild(self) -> None:
+        """Chooses the uniform cost pair and recomputes the jump distances of the whole grid."""
+        engine = self.engine
+        passable = np.isfinite(engine.enter_cost)
+        if passable.any():
+            enter_values, enter_codes = np.unique(engine.enter_cost[passable], return_inverse=True)
+            leave_values, leave_codes = np.unique(engine.leave_cost[passable], return_inverse=True)
+            enter_code, leave_code = divmod(
+                    int(np.bincount(enter_codes * len(leave_values) + leave_codes).argmax()), len(leave_values)
+            )
+            self.uniform_enter, self.uniform_leave = float(enter_values[enter_code]), float(leave_values[leave_code])
+        else:
+            self.uniform_enter = self.uniform_leave = _INF
+        self.uniform = passable & (engine.enter_cost == self.uniform_enter) & (engine.leave_cost == self.uniform_leave)
+        neighbors = engine.neighbors
+        self.near_weighted = ((neighbors >= 0) & (passable & ~self.uniform)[neighbors]).any(axis=1)
+
+        shape = (self.row_count, self.col_count)
+        free = self.uniform.reshape(shape)
+        near_weighted = self.near_weighted.reshape(shape)
+        padded = np.pad(free, 1)
+        blocked = ~padded
+
+        def forced(row_step, col_step):
+            if row_step and col_step:
+                return (
+                        (_shift(blocked, 0, -col_step) & _shift(padded, row_step, -col_step)) |
+                        (_shift(blocked, -row_step, 0) & _shift(padded, -row_step, col_step))
+                )
+            if row_step:
+                return (
+                        (_shift(blocked, 0, 1) & _shift(padded, row_step, 1)) |
+                        (_shift(blocked, 0, -1) & _shift(padded, row_step, -1))
+                )
+            return (
+                    (_shift(blocked, 1, 0) & _shift(padded, 1, col_step)) |
+                    (_shift(blocked, -1, 0) & _shift(padded, -1, col_step))
+            )
+
+        distances = np.zeros((8,) + shape, dtype=np.int32)
+        for row_step, col_step in _DIRECTIONS:
+            if not (row_step and col_step):
+                stops = forced(row_step, col_step) | near_weighted
+                oriented = _straight_distances(_orient(free, row_step, col_step), _orient(stops, row_step, col_step))
+                distances[_DIRECTION_INDEX[row_step, col_step]] = _orient(oriented, row_step, col_step, True)
+        for row_step, col_step in _DIRECTIONS:
+            if row_step and col_step:
+                stops = (
+                        forced(row_step, col_step) | near_weighted |
+                        (distances[_DIRECTION_INDEX[row_step, 0]] > 0) | (distances[_DIRECTION_INDEX[0, col_step]] > 0)
+                )
+                oriented = _diagonal_distances(_orient(free, row_step, col_step), _orient(stops, row_step, col_step))
+                distances[_DIRECTION_INDEX[row_step, col_step]] = _orient(oriented, row_step, col_step, True)
+        self.jump_distances = distances.reshape(8, -1)
+        self._dirty = False
+
+    def search(self, start: int, goal: int) -> Optional[Tuple[List[int], float]]:
+        """
+        Finds the cheapest path between two cells.
+
+        Args:
+            start (int): The cell index to start from.
+            goal (int): The cell index to reach.
+
+        Returns:
+            Optional[Tuple[List[int], float]]: The cell indices of the path, including `start`, and its cost, or None if
+                no path of finite cost exists. The number of nodes expanded is left in `expansions`.
+
+        Example:
+            ```python
+            jps = JumpPointSearch(grid.path_engine, grid.blueprint.row_count, grid.blueprint.col_count)
+            path, cost = jps.search(0, len(grid.cells) - 1)
+            print(jps.expansions)
+            # Output: 1
+            ```
+        """
+        if self._dirty:
+            self.rebuild()
+        engine = self.engine
+        col_count = self.col_count
+        uniform = memoryview(self.uniform)
+        near_weighted = memoryview(self.near_weighted)
+        jump_distances = [memoryview(distances) for distances in self.jump_distances]
+        enter, leave = memoryview(engine.enter_cost), memoryview(engine.leave_cost)
+        neighbors = memoryview(engine.neighbors.reshape(-1))
+        step_cost = self.uniform_enter + self.uniform_leave
+        uniform_enter = self.uniform_enter
+        heuristic_step = engine.min_step
+        goal_row, goal_col = divmod(goal, col_count)
+
+        def blocked(row, col):
+            return not (0 <= row < self.row_count and 0 <= col < col_count and uniform[row * col_count + col])
+
+        def successors(cell, direction):
+            row, col = divmod(cell, col_count)
+            if direction is None:
+                directions = _DIRECTIONS
+            else:
+                row_step, col_step = direction
+                if row_step and col_step:
+                    directions = [(row_step, 0), (0, col_step), (row_step, col_step)]
+                    if blocked(row, col - col_step):
+                        directions.append((row_step, -col_step))
+                    if blocked(row - row_step, col):
+                        directions.append((-row_step, col_step))
+                elif row_step:
+                    directions = [(row_step, 0)]
+                    if blocked(row, col + 1):
+                        directions.append((row_step, 1))
+                    if blocked(row, col - 1):
+                        directions.append((row_step, -1))
+                else:
+                    directions = [(0, col_step)]
+                    if blocked(row + 1, col):
+                        directions.append((1, col_step))
+                    if blocked(row - 1, col):
+                        directions.append((-1, col_step))
+            row_delta, col_delta = goal_row - row, goal_col - col
+            for row_step, col_step in directions:
+                distance = jump_distances[_DIRECTION_INDEX[row_step, col_step]][cell]
+                reach = distance if distance > 0 else -distance
+                steps = 0
+                if row_step and col_step:
+                    if (row_delta > 0) - (row_delta < 0) == row_step and (col_delta > 0) - (col_delta < 0) == col_step:
+                        to_goal_line = min(abs(row_delta), abs(col_delta))
+                        if to_goal_line <= reach:
+                            steps = to_goal_line
+                elif row_step and col_delta == 0 and 0 < row_delta * row_step <= reach:
+                    steps = row_delta * row_step
+                elif col_step and row_delta == 0 and 0 < col_delta * col_step <= reach:
+                    steps = col_delta * col_step
+                if not steps and distance > 0:
+                    steps = distance
+                if steps:
+                    point = cell + steps * (row_step * col_count + col_step)
+                    yield point, leave[cell] + uniform_enter + (steps - 1) * step_cost, (row_step, col_step)
+
+        g = {start: 0.0}
+        parent = {start: -1}
+        direction_of = {start: None}
+        done = set()
+        frontier = [(0.0, 0.0, start)]
+        expansions = 0
+        while frontier:
+            _, _, current = heappop(frontier)
+            if current in done:
+                continue
+            if current == goal:
+                self.expansions = expansions
+                return self._expand(parent, goal), g[goal]
+            done.add(current)
+            expansions += 1
+            base = g[current]
+            if uniform[current]:
+                edges = list(successors(current, direction_of[current]))
+                if near_weighted[current]:
+                    edges.extend(
+                            (next_step, leave[current] + enter[next_step], None)
+                            for next_step in neighbors[current * 8:current * 8 + 8]
+                            if next_step >= 0 and not uniform[next_step] and enter[next_step] != _INF
+                    )
+            else:
+                edges = [
+                        (next_step, leave[current] + enter[next_step], None)
+                        for next_step in neighbors[current * 8:current * 8 + 8]
+                        if next_step >= 0 and enter[next_step] != _INF
+                ]
+            for next_step, cost, direction in edges:
+                new_cost = base + cost
+                if new_cost < g.get(next_step, _INF):
+                    g[next_step] = new_cost
+                    parent[next_step] = current
+                    direction_of[next_step] = direction
+                    row_delta, col_delta = divmod(next_step, col_count)
+                    row_delta, col_delta = abs(row_delta - goal_row), abs(col_delta - goal_col)
+                    estimate = heuristic_step * (row_delta if row_delta > col_delta else col_delta)
+                    heappush(frontier, (new_cost + estimate, estimate, next_step))
+        self.expansions = expansions
+        return None
+
+    def _expand(self, parent: dict, goal: int) -> List[int]:
+        """Rebuilds the path to the goal, filling in the cells along every straight or diagonal jump."""
+        col_count = self.col_count
+        points = [goal]
+        while parent[points[-1]] >= 0:
+            points.append(parent[points[-1]])
+        points.reverse()
+        path = [points[0]]
+        for point, next_point in zip(points, points[1:]):
+            row, col = divmod(point, col_count)
+            next_row, next_col = divmod(next_point, col_count)
+            row_step = (next_row > row) - (next_row < row)
+            col_step = (next_col > col) - (next_col < col)
+            while (row, col) != (next_row, next_col):
+                row += row_step
+                col += col_step
+                path.append(row * col_count + col)
+        return path
@@ -0,0 +1,90 @@
+from __future__ import annotations
+
+from typing import Dict, Optional
+
+import numpy as np
+
+from .._spatial import label_components, component_labels
+from ._engine import PathEngine
+
+
+class Reachability:
+    """
+    Answers in O(1) whether a path can exist between two cells, from the connected groups of passable cells.
+
+    Every passable cell carries the label of its group. The labels can be handed in precomputed, such as the landmass
+    labels of a grid, and are computed from the engine's cost grid otherwise. Two cells with different labels cannot be
+    joined by a path, so a search between them can be skipped.
+
+    The labels follow the engine's cost grid. A cell that becomes passable joins the groups of its passable neighbors,
+    which are merged through a union-find over the labels. A cell that becomes impassable keeps its label: its group
+    may have split, so cells with the same label are not guaranteed a path, but cells with different labels remain
+    unreachable from each other. The labels are recomputed from scratch after the whole cost grid is rebuilt.
+    """
+
+    def __init__(self, engine: PathEngine, labels: Optional[np.ndarray] = None) -> None:
+        self.engine = engine
+        passable = np.isfinite(engine.enter_cost)
+        if labels is not None and np.array_equal(np.asarray(labels) >= 0, passable):
+            self.labels = np.array(labels, dtype=np.int32)
+        else:
+            self.labels = None
+        self._merged: Dict[int, int] = {}
+        engine.subscribe(self._on_cost_change)
+
+    def _label(self) -> np.ndarray:
+        if self.labels is None:
+            passable = np.isfinite(self.engine.enter_cost)
+            self.labels = component_labels(label_components(self.engine.neighbors, passable), passable)[0]
+            self._merged = {}
+        return self.labels
+
+    def _find(self, label: int) -> int:
+        merged = self._merged
+        root = label
+        while root in merged:
+            root = merged[root]
+        while label != root:
+            next_label = merged[label]
+            merged[label] = root
+            label = next_label
+        return root
+
+    def _on_cost_change(self, cell_index: Optional[int], cheaper: bool) -> None:
+        if cell_index is None:
+            self.labels = None
+        elif self.labels is not None and cheaper and self.engine.enter_cost[cell_index] != np.inf:
+            self._join(cell_index)
+
+    def _join(self, cell_index: int) -> None:
+        labels, enter = self.labels, self.engine.enter_cost
+        roots = {self._find(int(labels[neighbor])) for neighbor in self.engine.neighbors[cell_index].tolist()
+                 if neighbor >= 0 and enter[neighbor] != np.inf}
+        if labels[cell_index] >= 0:
+            roots.add(self._find(int(labels[cell_index])))
+        if not roots:
+            labels[cell_index] = labels.max() + 1
+            return
+        root = min(roots)
+        for other in roots:
+            if other != root:
+                self._merged[other] = root
+        labels[cell_index] = root
+
+    def component(self, cell_index: int) -> int:
+        """Returns the label of the group of a passable cell, or -1 for an impassable cell."""
+        label = int(self._label()[cell_index])
+        return -1 if label < 0 or self.engine.enter_cost[cell_index] == np.inf else self._find(label)
+
+    def connected(self, start: int, goal: int) -> bool:
+        """Returns False if no path can exist from one cell to another. A path from an impassable cell can still lead
+        out through its passable neighbors."""
+        if start == goal:
+            return True
+        goal_label = self.component(goal)
+        if goal_label < 0:
+            return False
+        if self.engine.enter_cost[start] != np.inf:
+            return self.component(start) == goal_label
+        return any(self.component(neighbor) == goal_label for neighbor in self.engine.neighbors[start].tolist()
+                   if neighbor >= 0)
@@ -0,0 +1,52 @@
+from __future__ import annotations
+
+from typing import Iterator, List, Union
+
+# The outcomes of a path search.
+FOUND = 'found'
+UNREACHABLE = 'unreachable'
+EXPANSION_LIMIT = 'expansion_limit'
+COST_LIMIT = 'cost_limit'
+
+
+class PathResult:
+    """
+    The outcome of a path search: the path, its cost, the number of cells the search expanded and a status.
+
+    The status is one of `FOUND`, `UNREACHABLE` (no path exists), `EXPANSION_LIMIT` (the search gave up after
+    expanding the allowed number of cells) or `COST_LIMIT` (no path exists within the allowed cost). The path is empty
+    and the cost is `inf` unless the status is `FOUND`.
+
+    A result unpacks and indexes like a (path, cost) tuple, so `path, cost = grid.get_path(a, b)` and
+    `grid.get_path(a, b)[0]` work as before.
+    """
+
+    __slots__ = ('path', 'cost', 'expansions', 'status')
+
+    def __init__(self, path: List[Union[int, str]], cost: float, expansions: int, status: str) -> None:
+        self.path = path
+        self.cost = cost
+        self.expansions = expansions
+        self.status = status
+
+    @property
+    def found(self) -> bool:
+        """Whether a path was found."""
+        return self.status == FOUND
+
+    def __iter__(self) -> Iterator:
+        yield self.path
+        yield self.cost
+
+    def __getitem__(self, index: Union[int, slice]):
+        return (self.path, self.cost)[index]
+
+    def __len__(self) -> int:
+        return 2
+
+    def __bool__(self) -> bool:
+        return self.found
+
+    def __repr__(self) -> str:
+        return (f'PathResult(status={self.status!r}, cost={self.cost}, steps={len(self.path)}, '
+                f'expansions={self.expansions})')
@@ -0,0 +1,8 @@
+from ._labeling import label_components, component_labels, component_members, coastal_mask
+from ._buckets import BucketIndex
+from ._pools import CellPool
+from ._regions import rectangle_indices, disk_indices, polygon_indices, perimeter_indices, indices_to_mask
+from ._clearance import Clearance
+from ._occupancy import OccupancyIndex
+from ._hash import SpatialHash
+from ._neighborhoods import chebyshev_stencil, neighborhood, neighborhoods, neighborhood_mask
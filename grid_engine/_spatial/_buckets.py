@@ -0,0 +1,185 @@
+from __future__ import annotations
+
+from typing import Dict, Hashable, Iterable, List, Optional
+
+import numpy as np
+
+
+class BucketIndex:
+    """
+    A spatial index of cells by category, bucketed into square blocks of cells.
+
+    Every category (a terrain, an object type, a unit type, ...) keeps, for every bucket of `bucket_size` by
+    `bucket_size` cells, the cells of that category in the bucket and how many entries each cell holds. Adding or
+    removing an entry is O(1). Nearest queries visit the buckets around the query cell in rings of growing Chebyshev
+    distance and stop as soon as no unvisited bucket can hold a closer cell, so the cost of a query depends on how far
+    away the nearest matches are rather than on the size of the grid.
+
+    Distances are straight-line distances between cells, measured in cells.
+    """
+
+    def __init__(self, row_count: int, col_count: int, bucket_size: int = 16) -> None:
+        self.row_count = row_count
+        self.col_count = col_count
+        self.bucket_size = bucket_size
+        self.bucket_rows = -(-row_count // bucket_size)
+        self.bucket_cols = -(-col_count // bucket_size)
+        self._buckets: Dict[Hashable, Dict[int, Dict[int, int]]] = {}
+        self._counts: Dict[Hashable, int] = {}
+
+    def __contains__(self, key: Hashable) -> bool:
+        return key in self._buckets
+
+    def keys(self) -> List[Hashable]:
+        """Returns the categories that hold at least one cell."""
+        return list(self._buckets)
+
+    def count(self, key: Hashable) -> int:
+        """Returns the number of entries of a category."""
+        return self._counts.get(key, 0)
+
+    def bucket_of(self, cell_index: int) -> int:
+        """Returns the bucket a cell falls in."""
+        row, col = divmod(cell_index, self.col_count)
+        return (row // self.bucket_size) * self.bucket_cols + col // self.bucket_size
+
+    def add(self, key: Hashable, cell_index: int) -> None:
+        """Adds an entry of a category at a cell."""
+        cells = self._buckets.setdefault(key, {}).setdefault(self.bucket_of(cell_index), {})
+        cells[cell_index] = cells.get(cell_index, 0) + 1
+        self._counts[key] = self._counts.get(key, 0) + 1
+
+    def add_many(self, key: Hashable, cell_indices: np.ndarray) -> None:
+        """Adds one entry of a category at each of many distinct cells, grouping them into buckets with NumPy."""
+        cell_indices = np.asarray(cell_indices, dtype=np.int64)
+        if not cell_indices.size:
+            return
+        rows, cols = np.divmod(cell_indices, self.col_count)
+        buckets = (rows // self.bucket_size) * self.bucket_cols + cols // self.bucket_size
+        order = np.argsort(buckets, kind='stable')
+        buckets, cell_indices = buckets[order], cell_indices[order]
+        starts = np.flatnonzero(np.r_[True, buckets[1:] != buckets[:-1]])
+        stops = np.r_[starts[1:], len(buckets)]
+        key_buckets = self._buckets.setdefault(key, {})
+        for bucket, start, stop in zip(buckets[starts].tolist(), starts.tolist(), stops.tolist()):
+            cells = key_buckets.setdefault(bucket, {})
+            for cell_index in cell_indices[start:stop].tolist():
+                cells[cell_index] = cells.get(cell_index, 0) + 1
+        self._counts[key] = self._counts.get(key, 0) + len(cell_indices)
+
+    def remove(self, key: Hashable, cell_index: int) -> None:
+        """Removes an entry of a category from a cell. Raises a KeyError if the cell holds no entry of the category."""
+        bucket = self.bucket_of(cell_index)
+        key_buckets = self._buckets[key]
+        cells = key_buckets[bucket]
+        count = cells[cell_index] - 1
+        if count:
+            cells[cell_index] = count
+        else:
+            del cells[cell_index]
+            if not cells:
+                del key_buckets[bucket]
+                if not key_buckets:
+                    del self._buckets[key]
+        self._counts[key] -= 1
+        if not self._counts[key]:
+            del self._counts[key]
+
+    def move(self, key: Hashable, old_cell_index: int, new_cell_index: int) -> None:
+        """Moves an entry of a category from one cell to another."""
+        self.remove(key, old_cell_index)
+        self.add(key, new_cell_index)
+
+    def cells(self, key: Hashable) -> np.ndarray:
+        """Returns the cell indices holding entries of a category, in no particular order."""
+        buckets = self._buckets.get(key)
+        if not buckets:
+            return np.empty(0, dtype=np.int64)
+        return np.fromiter((cell for cells in buckets.values() for cell in cells), dtype=np.int64)
+
+    def nearest(self, cell_index: int, keys: Iterable[Hashable], k: int = 1, max_distance: Optional[float] = None) -> List[int]:
+        """
+        Returns the cells nearest to a cell that hold an entry of any of the given categories.
+
+        Args:
+            cell_index (int): The cell to measure from.
+            keys (Iterable[Hashable]): The categories to look for.
+            k (int): The number of cells to return. Defaults to 1.
+            max_distance (Optional[float]): The furthest distance, in cells, to look. Defaults to None, which looks
+                across the whole grid.
+
+        Returns:
+            List[int]: Up to `k` cell indices, nearest first. Cells at equal distances are ordered by cell index.
+
+        Example:
+            ```python
+            index = BucketIndex(100, 100)
+            index.add('well', 510)
+            index.add('well', 9999)
+            print(index.nearest(0, ['well'], k=2))
+            # Output: [510, 9999]
+            ```
+        """
+        return [cell for _, cell in self._search(cell_index, keys, k, max_distance)]
+
+    def nearest_with_distances(
+            self,
+            cell_index: int,
+            keys: Iterable[Hashable],
+            k: int = 1,
+            max_distance: Optional[float] = None
+    ) -> List[tuple[float, int]]:
+        """As `nearest`, but returns (distance, cell index) pairs."""
+        return [(distance ** 0.5, cell) for distance, cell in self._search(cell_index, keys, k, max_distance)]
+
+    def nearest_ties(self, cell_index: int, keys: Iterable[Hashable]) -> List[int]:
+        """Returns every cell at the smallest distance from a cell that holds an entry of any of the given
+        categories."""
+        keys = list(keys)
+        nearest = self._search(cell_index, keys, 1, None)
+        if not nearest:
+            return []
+        distance = nearest[0][0]
+        found = self._search(cell_index, keys, self.row_count * self.col_count, distance ** 0.5 + 0.5)
+        return [cell for cell_distance, cell in found if cell_distance == distance]
+
+    def _search(self, cell_index: int, keys: Iterable[Hashable], k: int, max_distance: Optional[float]) -> List[tuple[int, int]]:
+        key_buckets = [self._buckets[key] for key in keys if key in self._buckets]
+        if not key_buckets or k < 1:
+            return []
+        size, col_count, bucket_cols = self.bucket_size, self.col_count, self.bucket_cols
+        row, col = divmod(cell_index, col_count)
+        bucket_row, bucket_col = row // size, col // size
+        limit = np.inf if max_distance is None else max_distance * max_distance
+        rings = max(bucket_row, self.bucket_rows - 1 - bucket_row, bucket_col, self.bucket_cols - 1 - bucket_col)
+        found: List[tuple[int, int]] = []
+        seen = set()
+        for ring in range(rings + 1):
+            if ring:
+                closest = (ring - 1) * size + 1
+                if closest * closest > limit or (len(found) >= k and closest * closest > found[k - 1][0]):
+                    break
+            for ring_row in range(bucket_row - ring, bucket_row + ring + 1):
+                if not 0 <= ring_row < self.bucket_rows:
+                    continue
+                edge = ring_row in (bucket_row - ring, bucket_row + ring)
+                step = 1 if edge else 2 * ring
+                for ring_col in range(bucket_col - ring, bucket_col + ring + 1, step):
+                    if not 0 <= ring_col < bucket_cols:
+                        continue
+                    bucket = ring_row * bucket_cols + ring_col
+                    for buckets in key_buckets:
+                        cells = buckets.get(bucket)
+                        if not cells:
+                            continue
+                        for cell in cells:
+                            if cell in seen:
+                                continue
+                            seen.add(cell)
+                            cell_row, cell_col = divmod(cell, col_count)
+                            distance = (cell_row - row) ** 2 + (cell_col - col) ** 2
+                            if distance <= limit:
+                                found.append((distance, cell))
+            found.sort()
+            del found[k:]
+        return found
@@ -0,0 +1,83 @@
+from __future__ import annotations
+
+import numpy as np
+
+
+def _runs_forward(passable: np.ndarray) -> np.ndarray:
+    """Returns, along the last axis, the number of consecutive True values starting at each position and moving
+    towards higher positions."""
+    length = passable.shape[-1]
+    positions = np.arange(length)
+    blocked = np.where(passable, length, positions)
+    next_blocked = np.minimum.accumulate(blocked[..., ::-1], axis=-1)[..., ::-1]
+    return next_blocked - positions
+
+
+def _runs_backward(passable: np.ndarray) -> np.ndarray:
+    """Returns, along the last axis, the number of consecutive True values starting at each position and moving
+    towards lower positions. Position 0 is never counted."""
+    positions = np.arange(passable.shape[-1])
+    blocked = np.where(passable, 0, positions)
+    return positions - np.maximum.accumulate(blocked, axis=-1)
+
+
+class Clearance:
+    """
+    The number of consecutive passable cells from every cell in each of the four directions.
+
+    The four run-length arrays are computed with cumulative scans over the passable mask, and each is indexed by cell
+    index. When the passability of a cell changes only the runs of its row and column can change, so `update`
+    rescans just that row and column.
+
+    The runs follow the conventions of the clearance properties of a cell: `up` counts towards higher row indices and
+    `down` towards lower ones, `left` and `right` count along the row, every run includes the cell itself, the
+    runs towards lower indices stop before the first row or column, and a cell on the first row, the last row, the
+    first column or the last column has an `up`, `down`, `left` or `right` clearance of 0 respectively.
+
+    Example:
+        ```python
+        passable = np.array([True, True, True, True, False, True, True, True, True])
+        clearance = Clearance(3, 3, passable)
+        print(clearance.right[0], clearance.up[3], clearance.left[5])
+        # Output: 3 2 1
+        ```
+    """
+
+    def __init__(self, row_count: int, col_count: int, passable: np.ndarray) -> None:
+        self.row_count = row_count
+        self.col_count = col_count
+        self.up = np.zeros(row_count * col_count, dtype=np.int32)
+        self.down = np.zeros_like(self.up)
+        self.left = np.zeros_like(self.up)
+        self.right = np.zeros_like(self.up)
+        self.rebuild(passable)
+
+    def _grids(self):
+        shape = (self.row_count, self.col_count)
+        return (self.up.reshape(shape), self.down.reshape(shape), self.left.reshape(shape),
+                self.right.reshape(shape))
+
+    def rebuild(self, passable: np.ndarray) -> None:
+        """Recomputes the runs of every cell from a passable mask."""
+        grid = np.asarray(passable, dtype=np.bool_).reshape(self.row_count, self.col_count)
+        up, down, left, right = self._grids()
+        up[:] = _runs_forward(grid.T).T
+        down[:] = _runs_backward(grid.T).T
+        left[:] = _runs_backward(grid)
+        right[:] = _runs_forward(grid)
+        up[0] = 0
+        down[-1] = 0
+        right[:, -1] = 0
+
+    def update(self, cell_index: int, passable: np.ndarray) -> None:
+        """Recomputes the runs of the row and the column of a cell whose passability changed."""
+        row, col = divmod(int(cell_index), self.col_count)
+        grid = np.asarray(passable, dtype=np.bool_).reshape(self.row_count, self.col_count)
+        up, down, left, right = self._grids()
+        up[:, col] = _runs_forward(grid[:, col])
+        down[:, col] = _runs_backward(grid[:, col])
+        left[row] = _runs_backward(grid[row])
+        right[row] = _runs_forward(grid[row])
+        up[0, col] = 0
+        down[-1, col] = 0
+        right[row, -1] = 0
@@ -0,0 +1,165 @@
+from __future__ import annotations
+
+from typing import Dict, Hashable, List, Optional, Sequence, Tuple
+
+import numpy as np
+
+# A (row index, column index) pair.
+Point = Tuple[int, int]
+
+
+class SpatialHash:
+    """
+    A spatial hash of moving entities over a grid, bucketed into square blocks of `bucket_size` by `bucket_size`
+    cells.
+
+    Every entity stands on one cell and is filed under the bucket of that cell. Moving an entity within its bucket only
+    updates its cell, and moving it to another bucket files it there, so every move is O(1). Box and radius queries
+    visit only the buckets that overlap the query and test the entities in them, so their cost depends on the number
+    of entities nearby rather than on the size of the grid or the number of entities on it. `move_many` computes the
+    buckets of a whole batch of moves with NumPy and only refiles the entities that changed bucket.
+
+    Example:
+        ```python
+        spatial_hash = SpatialHash(100, 100, bucket_size=8)
+        spatial_hash.insert('scout', 0)
+        spatial_hash.insert('guard', 505)
+        spatial_hash.move_many(['scout'], [101])
+        print(spatial_hash.query_radius(101, 6), spatial_hash.query_box((0, 0), (3, 3)))
+        # Output: ['scout', 'guard'] ['scout']
+        ```
+    """
+
+    def __init__(self, row_count: int, col_count: int, bucket_size: int = 8) -> None:
+        if bucket_size < 1:
+            raise ValueError('The bucket size must be at least one cell.')
+        self.row_count = row_count
+        self.col_count = col_count
+        self.bucket_size = bucket_size
+        self.bucket_rows = -(-row_count // bucket_size)
+        self.bucket_cols = -(-col_count // bucket_size)
+        self._buckets: Dict[int, Dict[Hashable, int]] = {}
+        self._where: Dict[Hashable, Tuple[int, int]] = {}
+
+    def __len__(self) -> int:
+        return len(self._where)
+
+    def __contains__(self, entity: Hashable) -> bool:
+        return entity in self._where
+
+    def bucket_of(self, cell_index: int) -> int:
+        """Returns the bucket a cell falls in."""
+        row, col = divmod(cell_index, self.col_count)
+        return (row // self.bucket_size) * self.bucket_cols + col // self.bucket_size
+
+    def cell_of(self, entity: Hashable) -> Optional[int]:
+        """Returns the cell an entity stands on, or None if it is not in the hash."""
+        placed = self._where.get(entity)
+        return None if placed is None else placed[0]
+
+    def insert(self, entity: Hashable, cell_index: int) -> None:
+        """Places an entity on a cell. An entity already in the hash is moved there."""
+        if entity in self._where:
+            self.move(entity, cell_index)
+            return
+        bucket = self.bucket_of(cell_index)
+        self._buckets.setdefault(bucket, {})[entity] = cell_index
+        self._where[entity] = (cell_index, bucket)
+
+    def remove(self, entity: Hashable, cell_index: Optional[int] = None) -> None:
+        """Removes an entity from the hash, if it is in it. If a cell is given, the entity is only removed if it stands
+        on that cell."""
+        placed = self._where.get(entity)
+        if placed is None or (cell_index is not None and placed[0] != cell_index):
+            return
+        del self._where[entity]
+        self._unfile(entity, placed[1])
+
+    def move(self, entity: Hashable, cell_index: int) -> None:
+        """Moves an entity to a cell. Raises a KeyError if the entity is not in the hash."""
+        self._move(entity, cell_index, self.bucket_of(cell_index))
+
+    def move_many(self, entities: Sequence[Hashable], cell_indices: Sequence[int]) -> None:
+        """
+        Moves many entities at once, such as every unit that moved in a tick. The buckets of the new cells are computed
+        together with NumPy, and only entities that changed bucket are refiled. Entities that are not in the hash yet
+        are inserted.
+        """
+        cell_indices = np.asarray(cell_indices, dtype=np.int64)
+        if len(entities) != len(cell_indices):
+            raise ValueError('Every entity needs exactly one cell.')
+        rows, cols = np.divmod(cell_indices, self.col_count)
+        buckets = (rows // self.bucket_size) * self.bucket_cols + cols // self.bucket_size
+        where = self._where
+        for entity, cell_index, bucket in zip(entities, cell_indices.tolist(), buckets.tolist()):
+            if entity in where:
+                self._move(entity, cell_index, bucket)
+            else:
+                self._buckets.setdefault(bucket, {})[entity] = cell_index
+                where[entity] = (cell_index, bucket)
+
+    def _move(self, entity: Hashable, cell_index: int, bucket: int) -> None:
+        old_bucket = self._where[entity][1]
+        if old_bucket == bucket:
+            self._buckets[bucket][entity] = cell_index
+        else:
+            self._unfile(entity, old_bucket)
+            self._buckets.setdefault(bucket, {})[entity] = cell_index
+        self._where[entity] = (cell_index, bucket)
+
+    def _unfile(self, entity: Hashable, bucket: int) -> None:
+        entities = self._buckets[bucket]
+        del entities[entity]
+        if not entities:
+            del self._buckets[bucket]
+
+    def _box_buckets(self, top: int, left: int, bottom: int, right: int):
+        size, bucket_cols = self.bucket_size, self.bucket_cols
+        for bucket_row in range(max(top, 0) // size, min(bottom, self.row_count - 1) // size + 1):
+            for bucket_col in range(max(left, 0) // size, min(right, self.col_count - 1) // size + 1):
+                entities = self._buckets.get(bucket_row * bucket_cols + bucket_col)
+                if entities:
+                    yield entities
+
+    def query_box(self, corner_a: Point, corner_b: Point) -> List[Hashable]:
+        """Returns the entities standing between two (row index, column index) corners, inclusive, in no particular
+        order."""
+        top, bottom = sorted((corner_a[0], corner_b[0]))
+        left, right = sorted((corner_a[1], corner_b[1]))
+        col_count = self.col_count
+        found = []
+        for entities in self._box_buckets(top, left, bottom, right):
+            for entity, cell_index in entities.items():
+                row, col = divmod(cell_index, col_count)
+                if top <= row <= bottom and left <= col <= right:
+                    found.append(entity)
+        return found
+
+    def query_radius(self, cell_index: int, radius: float, metric: str = 'euclidean') -> List[Hashable]:
+        """
+        Returns the entities within a distance of a cell, in no particular order.
+
+        Args:
+            cell_index (int): The cell to measure from.
+            radius (float): The largest distance, in cells, of a returned entity.
+            metric (str): 'euclidean' or 'chebyshev'. Defaults to 'euclidean'.
+
+        Returns:
+            List[Hashable]: The entities within the radius.
+        """
+        if metric not in ('chebyshev', 'euclidean'):
+            raise ValueError(f'Unknown metric: {metric}')
+        row, col = divmod(cell_index, self.col_count)
+        reach = int(np.floor(radius))
+        limit = radius * radius
+        col_count = self.col_count
+        found = []
+        for entities in self._box_buckets(row - reach, col - reach, row + reach, col + reach):
+            for entity, entity_cell in entities.items():
+                entity_row, entity_col = divmod(entity_cell, col_count)
+                if metric == 'euclidean':
+                    if (entity_row - row) ** 2 + (entity_col - col) ** 2 <= limit:
+                        found.append(entity)
+                elif abs(entity_row - row) <= reach and abs(entity_col - col) <= reach:
+                    found.append(entity)
+        return found
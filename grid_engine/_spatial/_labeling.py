@@ -0,0 +1,90 @@
+from __future__ import annotations
+
+import numpy as np
+
+# Columns of the neighbor table that point forward in cell index order: right, down-right, down and down-left. Every
+# pair of adjacent cells is joined by exactly one of them.
+_FORWARD_NEIGHBORS = (3, 4, 5, 6)
+
+
+def label_components(neighbors: np.ndarray, values: np.ndarray) -> np.ndarray:
+    """
+    Labels the 8-connected components of a grid in which adjacent cells with equal values are connected.
+
+    The components are found with a vectorized union-find: every round, the root of each pair of adjacent cells in
+    different components is hooked onto the smaller of the two roots, and the parent pointers are then compressed by
+    pointer jumping until every cell points at its root. Rounds repeat until no adjacent pair is left unjoined.
+
+    Args:
+        neighbors (np.ndarray): The (N, 8) neighbor table of the grid, with -1 for neighbors off the grid.
+        values (np.ndarray): The value of every cell, by cell index.
+
+    Returns:
+        np.ndarray: The root of the component of every cell, which is the smallest cell index in the component.
+
+    Example:
+        ```python
+        roots = label_components(blueprint.neighbors, store.passable)
+        print(roots[:6])
+        # Output: [0 0 2 2 0 2]
+        ```
+    """
+    values = np.asarray(values)
+    parent = np.arange(len(values))
+    edges_from, edges_to = [], []
+    for direction in _FORWARD_NEIGHBORS:
+        neighbor = neighbors[:, direction]
+        cells = np.flatnonzero(neighbor >= 0)
+        neighbor = neighbor[cells]
+        joined = values[cells] == values[neighbor]
+        edges_from.append(cells[joined])
+        edges_to.append(neighbor[joined])
+    edges_from = np.concatenate(edges_from)
+    edges_to = np.concatenate(edges_to)
+    while True:
+        roots_from = parent[edges_from]
+        roots_to = parent[edges_to]
+        apart = roots_from != roots_to
+        if not apart.any():
+            return parent
+        edges_from, edges_to = edges_from[apart], edges_to[apart]
+        roots_from, roots_to = roots_from[apart], roots_to[apart]
+        np.minimum.at(parent, np.maximum(roots_from, roots_to), np.minimum(roots_from, roots_to))
+        while True:
+            grandparent = parent[parent]
+            if np.array_equal(grandparent, parent):
+                break
+            parent = grandparent
+
+
+def component_labels(roots: np.ndarray, mask: np.ndarray) -> tuple[np.ndarray, np.ndarray]:
+    """
+    Numbers the components of the cells in `mask` in order of their first cell.
+
+    Args:
+        roots (np.ndarray): The component root of every cell, as returned by `label_components`.
+        mask (np.ndarray): The cells whose components are numbered.
+
+    Returns:
+        tuple[np.ndarray, np.ndarray]: The int32 label of every cell, -1 outside `mask`, and the size of every label.
+    """
+    mask = np.asarray(mask, dtype=bool)
+    is_root = mask & (roots == np.arange(len(roots)))
+    label_of_root = np.full(len(roots), -1, dtype=np.int32)
+    label_of_root[is_root] = np.arange(np.count_nonzero(is_root), dtype=np.int32)
+    labels = np.where(mask, label_of_root[roots], np.int32(-1))
+    sizes = np.bincount(labels[mask], minlength=np.count_nonzero(is_root))
+    return labels, sizes
+
+
+def component_members(labels: np.ndarray, sizes: np.ndarray) -> list[np.ndarray]:
+    """Returns the cell indices of every label, in cell index order, from the output of `component_labels`."""
+    order = np.argsort(labels, kind='stable')
+    order = order[len(order) - int(sizes.sum()):]
+    return np.split(order, np.cumsum(sizes)[:-1]) if len(sizes) else []
+
+
+def coastal_mask(neighbors: np.ndarray, water: np.ndarray) -> np.ndarray:
+    """Returns a mask of the cells with at least one neighbor in `water`."""
+    water = np.asarray(water, dtype=bool)
+    return ((neighbors >= 0) & water[neighbors]).any(axis=1)
@@ -0,0 +1,86 @@
+from __future__ import annotations
+
+from functools import lru_cache
+from typing import Sequence, Union
+
+import numpy as np
+
+
+@lru_cache(maxsize=None)
+def chebyshev_stencil(radius: int, include_center: bool = False) -> np.ndarray:
+    """
+    Returns the (row offset, column offset) of every cell within a Chebyshev distance of a cell, in cell index order.
+    Stencils are computed once per radius and cached; the returned array is read-only.
+
+    Example:
+        ```python
+        print(chebyshev_stencil(1).tolist())
+        # Output: [[-1, -1], [-1, 0], [-1, 1], [0, -1], [0, 1], [1, -1], [1, 0], [1, 1]]
+        ```
+    """
+    if radius < 0:
+        raise ValueError('The radius must not be negative.')
+    offsets = np.arange(-radius, radius + 1)
+    row_offsets, col_offsets = np.meshgrid(offsets, offsets, indexing='ij')
+    stencil = np.stack((row_offsets.ravel(), col_offsets.ravel()), axis=1)
+    if not include_center:
+        stencil = stencil[(stencil != 0).any(axis=1)]
+    stencil.flags.writeable = False
+    return stencil
+
+
+def neighborhoods(
+        row_count: int,
+        col_count: int,
+        cell_indices: Union[np.ndarray, Sequence[int]],
+        radius: int,
+        include_center: bool = False
+) -> np.ndarray:
+    """
+    Returns the neighborhoods of many cells at once: the cells within a Chebyshev distance of each of them.
+
+    Args:
+        row_count (int): The number of rows of the grid.
+        col_count (int): The number of columns of the grid.
+        cell_indices (np.ndarray): The cell indices of the focus cells.
+        radius (int): The Chebyshev distance, in cells, of the farthest neighbors.
+        include_center (bool): Whether each neighborhood includes its focus cell. Defaults to False.
+
+    Returns:
+        np.ndarray: An (M, S) array holding, for each of the M focus cells, the cell indices of its neighborhood in the
+            order of the stencil. Neighbors that fall off the grid are -1.
+
+    Example:
+        ```python
+        print(neighborhoods(3, 3, [0, 4], 1))
+        # Output: [[-1 -1 -1 -1  1 -1  3  4]
+        #          [ 0  1  2  3  5  6  7  8]]
+        ```
+    """
+    stencil = chebyshev_stencil(radius, include_center)
+    rows, cols = np.divmod(np.asarray(cell_indices, dtype=np.int64), col_count)
+    neighbor_rows = rows[:, None] + stencil[None, :, 0]
+    neighbor_cols = cols[:, None] + stencil[None, :, 1]
+    on_grid = (neighbor_rows >= 0) & (neighbor_rows < row_count) & (neighbor_cols >= 0) & (neighbor_cols < col_count)
+    return np.where(on_grid, neighbor_rows * col_count + neighbor_cols, -1)
+
+
+def neighborhood(row_count: int, col_count: int, cell_index: int, radius: int, include_center: bool = False) -> np.ndarray:
+    """Returns the cell indices of the on-grid cells within a Chebyshev distance of a cell, in cell index order."""
+    indices = neighborhoods(row_count, col_count, [cell_index], radius, include_center)[0]
+    return indices[indices >= 0]
+
+
+def neighborhood_mask(
+        row_count: int,
+        col_count: int,
+        cell_indices: Union[np.ndarray, Sequence[int]],
+        radius: int,
+        include_center: bool = True
+) -> np.ndarray:
+    """Returns a boolean mask over every cell of the cells within a Chebyshev distance of any of many cells, such as
+    the cells covered by several area effects."""
+    indices = neighborhoods(row_count, col_count, cell_indices, radius, include_center)
+    mask = np.zeros(row_count * col_count, dtype=np.bool_)
+    mask[indices[indices >= 0]] = True
+    return mask
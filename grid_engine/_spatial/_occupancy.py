@@ -0,0 +1,180 @@
+from __future__ import annotations
+
+from typing import Dict, Hashable, Iterable, List, Optional, Tuple, Union
+
+import numpy as np
+
+
+class OccupancyIndex:
+    """
+    A sparse index of the entities (units, objects, ...) standing on the cells of a grid.
+
+    Every entity is held under a kind ('players', 'items', 'structures', ...) at one cell. The index maps each
+    occupied cell to its entities and each entity to its cell, so adding, moving and removing an entity is O(1), and
+    keeps the number of entities on every cell in an array, so the occupancy of the whole grid is available as a
+    NumPy mask without visiting any cell. Queries by kind or by region cost time in proportion to the entities or
+    cells involved, never to the size of the grid.
+
+    Example:
+        ```python
+        occupancy = OccupancyIndex(100)
+        occupancy.add(hero, 12, 'players')
+        occupancy.add(sword, 12, 'items')
+        occupancy.move(hero, 13)
+        print(occupancy.at(12), occupancy.cell_of(hero), occupancy.mask().sum())
+        # Output: [sword] 13 2
+        ```
+    """
+
+    def __init__(self, size: int) -> None:
+        self.size = size
+        self._cells: Dict[int, Dict[Hashable, str]] = {}
+        self._where: Dict[Hashable, Tuple[int, str]] = {}
+        self._kinds: Dict[str, Dict[Hashable, int]] = {}
+        self._counts = np.zeros(size, dtype=np.int32)
+
+    def __len__(self) -> int:
+        return len(self._where)
+
+    def __contains__(self, entity: Hashable) -> bool:
+        return entity in self._where
+
+    def add(self, entity: Hashable, cell_index: int, kind: str) -> None:
+        """Places an entity of a kind on a cell. An entity already in the index is moved there."""
+        if entity in self._where:
+            self.remove(entity)
+        self._cells.setdefault(cell_index, {})[entity] = kind
+        self._where[entity] = (cell_index, kind)
+        self._kinds.setdefault(kind, {})[entity] = cell_index
+        self._counts[cell_index] += 1
+
+    def remove(self, entity: Hashable, cell_index: Optional[int] = None) -> None:
+        """Removes an entity from the index, if it is in it. If a cell is given, the entity is only removed if it
+        stands on that cell."""
+        placed = self._where.get(entity)
+        if placed is None or (cell_index is not None and placed[0] != cell_index):
+            return
+        del self._where[entity]
+        cell_index, kind = placed
+        entities = self._cells[cell_index]
+        del entities[entity]
+        if not entities:
+            del self._cells[cell_index]
+        kind_entities = self._kinds[kind]
+        del kind_entities[entity]
+        if not kind_entities:
+            del self._kinds[kind]
+        self._counts[cell_index] -= 1
+
+    def move(self, entity: Hashable, cell_index: int) -> None:
+        """Moves an entity to another cell, keeping its kind. Raises a KeyError if the entity is not in the index."""
+        old_cell_index, kind = self._where[entity]
+        if old_cell_index == cell_index:
+            return
+        entities = self._cells[old_cell_index]
+        del entities[entity]
+        if not entities:
+            del self._cells[old_cell_index]
+        self._cells.setdefault(cell_index, {})[entity] = kind
+        self._where[entity] = (cell_index, kind)
+        self._kinds[kind][entity] = cell_index
+        self._counts[old_cell_index] -= 1
+        self._counts[cell_index] += 1
+
+    def cell_of(self, entity: Hashable) -> Optional[int]:
+        """Returns the cell an entity stands on, or None if it is not in the index."""
+        placed = self._where.get(entity)
+        return None if placed is None else placed[0]
+
+    def kind_of(self, entity: Hashable) -> Optional[str]:
+        """Returns the kind of an entity, or None if it is not in the index."""
+        placed = self._where.get(entity)
+        return None if placed is None else placed[1]
+
+    def at(self, cell_index: int, kinds: Optional[Union[str, Iterable[str]]] = None) -> List[Hashable]:
+        """Returns the entities on a cell, optionally only those of some kinds."""
+        entities = self._cells.get(cell_index)
+        if not entities:
+            return []
+        if kinds is None:
+            return list(entities)
+        kinds = {kinds} if isinstance(kinds, str) else set(kinds)
+        return [entity for entity, kind in entities.items() if kind in kinds]
+
+    def count(self, cell_index: int) -> int:
+        """Returns the number of entities on a cell."""
+        return int(self._counts[cell_index])
+
+    def kinds(self) -> List[str]:
+        """Returns the kinds that have at least one entity."""
+        return list(self._kinds)
+
+    def entities(self, kinds: Optional[Union[str, Iterable[str]]] = None) -> List[Hashable]:
+        """Returns every entity, or every entity of some kinds."""
+        if kinds is None:
+            return list(self._where)
+        return [entity for kind in self._kind_list(kinds) for entity in self._kinds.get(kind, ())]
+
+    def cells(self, kinds: Optional[Union[str, Iterable[str]]] = None) -> np.ndarray:
+        """Returns the cell indices holding at least one entity, or one entity of some kinds, in cell index order."""
+        if kinds is None:
+            return np.array(sorted(self._cells), dtype=np.int64)
+        cells = {cell_index for kind in self._kind_list(kinds) for cell_index in self._kinds.get(kind, {}).values()}
+        return np.array(sorted(cells), dtype=np.int64)
+
+    def mask(self, kinds: Optional[Union[str, Iterable[str]]] = None) -> np.ndarray:
+        """Returns a boolean mask over every cell of the cells holding at least one entity, or one entity of some
+        kinds."""
+        if kinds is None:
+            return self._counts > 0
+        mask = np.zeros(self.size, dtype=np.bool_)
+        mask[self.cells(kinds)] = True
+        return mask
+
+    def counts(self) -> np.ndarray:
+        """Returns the number of entities on every cell. The array is read-only and changes with the index."""
+        counts = self._counts.view()
+        counts.flags.writeable = False
+        return counts
+
+    def in_region(
+            self,
+            region: np.ndarray,
+            kinds: Optional[Union[str, Iterable[str]]] = None
+    ) -> List[Hashable]:
+        """
+        Returns the entities standing in a region, optionally only those of some kinds.
+
+        Args:
+            region (np.ndarray): The cell indices of the region, or a boolean mask over every cell.
+            kinds (Optional[Union[str, Iterable[str]]]): The kinds to return. Defaults to None, which returns every
+                kind.
+
+        Returns:
+            List[Hashable]: The entities, in no particular order.
+
+        The region's cells are looked up one by one when the region is smaller than the number of candidate entities;
+        otherwise the cell of every candidate entity is tested for membership in the region.
+        """
+        region = np.asarray(region)
+        if region.dtype != np.bool_:
+            region = region.astype(np.int64)
+        candidates = self._where if kinds is None else {
+            entity: (cell_index, kind) for kind in self._kind_list(kinds)
+            for entity, cell_index in self._kinds.get(kind, {}).items()
+        }
+        if region.dtype != np.bool_ and len(region) < len(candidates):
+            found = []
+            for cell_index in np.unique(region).tolist():
+                for entity in self._cells.get(cell_index, ()):
+                    if entity in candidates:
+                        found.append(entity)
+            return found
+        if region.dtype == np.bool_:
+            return [entity for entity, (cell_index, _) in candidates.items() if region[cell_index]]
+        region = set(region.tolist())
+        return [entity for entity, (cell_index, _) in candidates.items() if cell_index in region]
+
+    @staticmethod
+    def _kind_list(kinds: Union[str, Iterable[str]]) -> List[str]:
+        return [kinds] if isinstance(kinds, str) else list(kinds)
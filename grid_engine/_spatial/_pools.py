@@ -0,0 +1,71 @@
+from __future__ import annotations
+
+from typing import Sequence, Union
+
+import numpy as np
+
+
+class CellPool:
+    """
+    A set of cell indices that can be added to, removed from and sampled in O(1).
+
+    The members are packed into the front of an array, and the position of every cell in that array is kept in a
+    second array, so a member is removed by moving the last member into its place. Drawing a random member is picking
+    a random position, which never has to reject a draw, however small the pool is compared to the grid.
+    """
+
+    def __init__(self, size: int, members: Union[np.ndarray, Sequence[int]] = ()) -> None:
+        members = np.unique(np.asarray(members, dtype=np.int64))
+        self._members = np.empty(max(len(members), 16), dtype=np.int64)
+        self._members[:len(members)] = members
+        self._count = len(members)
+        self._positions = np.full(size, -1, dtype=np.int64)
+        self._positions[members] = np.arange(len(members))
+
+    @classmethod
+    def from_mask(cls, mask: np.ndarray) -> CellPool:
+        """Creates a pool of the cells for which a boolean mask is True."""
+        return cls(len(mask), np.flatnonzero(mask))
+
+    def __len__(self) -> int:
+        return self._count
+
+    def __contains__(self, cell_index: int) -> bool:
+        return self._positions[cell_index] >= 0
+
+    @property
+    def members(self) -> np.ndarray:
+        """The cell indices in the pool, in no particular order. The array is a view that changes with the pool."""
+        return self._members[:self._count]
+
+    def contains_many(self, cell_indices: np.ndarray) -> np.ndarray:
+        """Returns whether each of many cells is in the pool."""
+        return self._positions[cell_indices] >= 0
+
+    def add(self, cell_index: int) -> None:
+        """Adds a cell to the pool, if it is not in it already."""
+        if self._positions[cell_index] >= 0:
+            return
+        if self._count == len(self._members):
+            self._members = np.concatenate((self._members, np.empty(len(self._members), dtype=np.int64)))
+        self._members[self._count] = cell_index
+        self._positions[cell_index] = self._count
+        self._count += 1
+
+    def discard(self, cell_index: int) -> None:
+        """Removes a cell from the pool, if it is in it."""
+        position = self._positions[cell_index]
+        if position < 0:
+            return
+        self._count -= 1
+        last = self._members[self._count]
+        self._members[position] = last
+        self._positions[last] = position
+        self._positions[cell_index] = -1
+
+    def set(self, cell_index: int, member: bool) -> None:
+        """Adds a cell to, or removes it from, the pool."""
+        if member:
+            self.add(cell_index)
+        else:
+            self.discard(cell_index)
@@ -0,0 +1,160 @@
+from __future__ import annotations
+
+from typing import Sequence, Tuple
+
+import numpy as np
+
+# A (row index, column index) pair.
+Point = Tuple[int, int]
+
+
+def _box_indices(col_count: int, rows: np.ndarray, cols: np.ndarray) -> np.ndarray:
+    return (rows[:, None] * col_count + cols[None, :]).ravel()
+
+
+def rectangle_indices(row_count: int, col_count: int, corner_a: Point, corner_b: Point) -> np.ndarray:
+    """
+    Returns the cell indices of the cells between two (row index, column index) corners, inclusive, in cell index
+    order. The rectangle is clipped to the grid.
+
+    Example:
+        ```python
+        print(rectangle_indices(4, 5, (1, 1), (2, 3)))
+        # Output: [ 6  7  8 11 12 13]
+        ```
+    """
+    top, bottom = sorted((corner_a[0], corner_b[0]))
+    left, right = sorted((corner_a[1], corner_b[1]))
+    rows = np.arange(max(top, 0), min(bottom, row_count - 1) + 1)
+    cols = np.arange(max(left, 0), min(right, col_count - 1) + 1)
+    return _box_indices(col_count, rows, cols)
+
+
+def disk_indices(row_count: int, col_count: int, center: Point, radius: float, metric: str = 'chebyshev') -> np.ndarray:
+    """
+    Returns the cell indices of the cells within a distance of a center cell, in cell index order.
+
+    Only the bounding box of the disk is examined, so the cost is proportional to the size of the disk.
+
+    Args:
+        row_count (int): The number of rows of the grid.
+        col_count (int): The number of columns of the grid.
+        center (Tuple[int, int]): The (row index, column index) of the center cell.
+        radius (float): The largest distance, in cells, of a cell in the disk.
+        metric (str): 'chebyshev', for which the disk is a square, or 'euclidean'. Defaults to 'chebyshev'.
+
+    Returns:
+        np.ndarray: The cell indices of the disk.
+
+    Example:
+        ```python
+        print(disk_indices(5, 5, (2, 2), 1, 'euclidean'))
+        # Output: [ 7 11 12 13 17]
+        ```
+    """
+    if metric not in ('chebyshev', 'euclidean'):
+        raise ValueError(f'Unknown metric: {metric}')
+    reach = int(np.floor(radius))
+    row, col = center
+    indices = rectangle_indices(row_count, col_count, (row - reach, col - reach), (row + reach, col + reach))
+    if metric == 'euclidean':
+        rows, cols = np.divmod(indices, col_count)
+        indices = indices[(rows - row) ** 2 + (cols - col) ** 2 <= radius * radius]
+    return indices
+
+
+def polygon_indices(row_count: int, col_count: int, vertices: Sequence[Point]) -> np.ndarray:
+    """
+    Returns the cell indices of the cells whose centers lie inside a polygon, in cell index order.
+
+    The polygon is given by its (row index, column index) vertices, which are taken to be the centers of those cells,
+    and may be concave. Cells are tested with the even-odd rule over the bounding box of the polygon only; cells on the
+    boundary of the polygon are included.
+
+    Example:
+        ```python
+        print(polygon_indices(4, 4, [(0, 0), (0, 2), (2, 0)]))
+        # Output: [0 1 2 4 5 8]
+        ```
+    """
+    vertices = np.asarray(vertices, dtype=np.float64)
+    top, left = np.maximum(np.ceil(vertices.min(axis=0)).astype(int), 0)
+    bottom, right = np.floor(vertices.max(axis=0)).astype(int)
+    bottom, right = min(bottom, row_count - 1), min(right, col_count - 1)
+    if top > bottom or left > right:
+        return np.empty(0, dtype=np.int64)
+    rows, cols = np.meshgrid(np.arange(top, bottom + 1), np.arange(left, right + 1), indexing='ij')
+    rows, cols = rows.ravel().astype(np.float64), cols.ravel().astype(np.float64)
+    inside = np.zeros(len(rows), dtype=np.bool_)
+    boundary = np.zeros(len(rows), dtype=np.bool_)
+    for (row_a, col_a), (row_b, col_b) in zip(vertices, np.roll(vertices, -1, axis=0)):
+        crosses = (row_a > rows) != (row_b > rows)
+        with np.errstate(divide='ignore', invalid='ignore'):
+            col_at_row = col_a + (rows - row_a) * (col_b - col_a) / (row_b - row_a)
+        inside ^= crosses & (cols < col_at_row)
+        cross = (col_b - col_a) * (rows - row_a) - (row_b - row_a) * (cols - col_a)
+        within = ((np.minimum(row_a, row_b) <= rows) & (rows <= np.maximum(row_a, row_b))
+                  & (np.minimum(col_a, col_b) <= cols) & (cols <= np.maximum(col_a, col_b)))
+        boundary |= (cross == 0) & within
+    keep = inside | boundary
+    return rows[keep].astype(np.int64) * col_count + cols[keep].astype(np.int64)
+
+
+def indices_to_mask(indices: np.ndarray, size: int) -> np.ndarray:
+    """Returns a boolean mask over `size` cells that is True at the given cell indices."""
+    mask = np.zeros(size, dtype=np.bool_)
+    mask[indices] = True
+    return mask
+
+
+def _shifted_any(padded: np.ndarray) -> np.ndarray:
+    """Returns, for every cell of a padded local mask, whether any of its 8 neighbors is set."""
+    height, width = padded.shape[0] - 2, padded.shape[1] - 2
+    result = np.zeros((height, width), dtype=np.bool_)
+    for row_shift in (0, 1, 2):
+        for col_shift in (0, 1, 2):
+            if row_shift != 1 or col_shift != 1:
+                result |= padded[row_shift:row_shift + height, col_shift:col_shift + width]
+    return result
+
+
+def perimeter_indices(row_count: int, col_count: int, indices: np.ndarray, inner: bool = False) -> np.ndarray:
+    """
+    Returns the cell indices of the perimeter of a region, in cell index order.
+
+    The region is rasterised into a mask over its bounding box, grown by one cell, and the perimeter is found by
+    eroding or dilating that mask with the 8-neighborhood, so the cost is proportional to the size of the region.
+
+    Args:
+        row_count (int): The number of rows of the grid.
+        col_count (int): The number of columns of the grid.
+        indices (np.ndarray): The cell indices of the region.
+        inner (bool): Whether to return the cells of the region that border a cell outside it (the mask minus its
+            erosion) rather than the cells outside the region that border it (the dilation minus the mask). Cells off
+            the grid count as outside the region. Defaults to False.
+
+    Returns:
+        np.ndarray: The cell indices of the perimeter.
+
+    Example:
+        ```python
+        print(perimeter_indices(5, 5, disk_indices(5, 5, (2, 2), 1), inner=True))
+        # Output: [ 6  7  8 11 13 16 17 18]
+        ```
+    """
+    indices = np.asarray(indices, dtype=np.int64)
+    if not indices.size:
+        return indices
+    rows, cols = np.divmod(indices, col_count)
+    top, left = rows.min() - 1, cols.min() - 1
+    height, width = rows.max() - top + 2, cols.max() - left + 2
+    local = np.zeros((height, width), dtype=np.bool_)
+    local[rows - top, cols - left] = True
+    if inner:
+        edge = local & _shifted_any(np.pad(~local, 1, constant_values=True))
+    else:
+        edge = _shifted_any(np.pad(local, 1)) & ~local
+    edge_rows, edge_cols = np.nonzero(edge)
+    edge_rows, edge_cols = edge_rows + top, edge_cols + left
+    on_grid = (edge_rows >= 0) & (edge_rows < row_count) & (edge_cols >= 0) & (edge_cols < col_count)
+    return edge_rows[on_grid] * col_count + edge_cols[on_grid]
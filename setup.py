@@ -17,8 +17,7 @@ setup(
         'numpy',
         'pillow',
         'pyglet',
-        'pymunk',
-        'noise'
+        'pymunk'
     ],
     scripts=['grid_engine/__main__.py'],
     keywords='game development 2d grid world generation procedural generation cell numpy pillow pyglet pymunk cli',